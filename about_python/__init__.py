@@ -1,9 +1,11 @@
 import sys
+from collections.abc import Sequence
 
 
-def main(name: str = __name__) -> int:
-    print(name)
-    return 0
+def main(argv: Sequence[str] | None = None) -> int:
+    from .cli import run
+
+    return run(argv)
 
 
 if __name__ == "__main__":
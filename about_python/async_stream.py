@@ -0,0 +1,230 @@
+import asyncio
+import inspect
+import itertools
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+
+from .stats import Histogram
+
+T = TypeVar("T")
+
+# An item in a queue: its position in the queue, when it was put, and the item
+type _Entry = tuple[int, int, Any]
+
+# The last entry of a queue, and the entry that reports a failure to the consumer
+_DONE: Any = object()
+_FAILED: Any = object()
+
+
+@dataclass(slots=True)
+class StageStats:
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    # The longest the queue of the stage was, out of its maxsize
+    max_depth: int = 0
+    # Nanoseconds to process an item, and waited in the queue of the stage
+    latency: Histogram = field(default_factory=Histogram)
+    wait: Histogram = field(default_factory=Histogram)
+
+
+class _Stage:
+    def __init__(
+        self,
+        function: Callable[[Any], Awaitable[Any] | AsyncIterator[Any]],
+        name: str,
+        concurrency: int,
+        ordered: bool,
+        maxsize: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least one")
+        # Returns an awaitable or an async iterator, as self.generator tells
+        self.function: Callable[[Any], Any] = function
+        self.generator = inspect.isasyncgenfunction(function)
+        self.name = name
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.maxsize = maxsize
+        self.stats = StageStats(name)
+        super().__init__()
+
+    async def run(self, inbox: asyncio.Queue[Any], outbox: asyncio.Queue[Any]) -> None:
+        self.stats = StageStats(self.name)
+        # The position of the next item to emit, in ordered mode
+        self._next = 0
+        self._turn = asyncio.Condition()
+        # Positions are assigned as entries are put, so that the queue is in order
+        self._positions = itertools.count()
+        self._put = asyncio.Lock()
+        workers = [
+            asyncio.create_task(self._work(inbox, outbox))
+            for _ in range(self.concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        await outbox.put(_DONE)
+
+    async def _work(
+        self, inbox: asyncio.Queue[Any], outbox: asyncio.Queue[Any]
+    ) -> None:
+        clock = time.perf_counter_ns
+        while True:
+            self.stats.max_depth = max(self.stats.max_depth, inbox.qsize())
+            entry: _Entry = await inbox.get()
+            if entry is _DONE:
+                # For the other workers: nothing follows it, so there is room
+                inbox.put_nowait(_DONE)
+                return
+            position, put, item = entry
+            start = clock()
+            self.stats.wait.record(start - put)
+            self.stats.items_in += 1
+
+            if not self.ordered:
+                if self.generator:
+                    async for result in self.function(item):
+                        await self._emit(outbox, result)
+                else:
+                    await self._emit(outbox, await self.function(item))
+                self.stats.latency.record(clock() - start)
+                continue
+
+            if self.generator:
+                results = [result async for result in self.function(item)]
+            else:
+                results = [await self.function(item)]
+            self.stats.latency.record(clock() - start)
+            async with self._turn:
+                await self._turn.wait_for(lambda: self._next == position)
+                for result in results:
+                    await self._emit(outbox, result)
+                self._next += 1
+                self._turn.notify_all()
+
+    async def _emit(self, outbox: asyncio.Queue[Any], result: Any) -> None:
+        async with self._put:
+            await outbox.put((next(self._positions), time.perf_counter_ns(), result))
+        self.stats.items_out += 1
+
+
+class AsyncPipeline(Generic[T]):
+    """Stages joined by bounded queues, each run by its own number of tasks.
+
+    A stage is a coroutine function, called with each item, or an async
+    generator function, whose items replace the item. A full queue stops the
+    stage that fills it: a slow stage slows the ones before it instead of
+    piling up their items. Ordered stages emit in the order of their input,
+    unordered ones as soon as an item is processed.
+
+    A failing stage cancels the others and its exception is raised by the
+    iteration; cancelling or closing the iteration cancels every stage."""
+
+    def __init__(
+        self, source: Iterable[T] | AsyncIterable[T], *, maxsize: int = 64
+    ) -> None:
+        self.source = source
+        self.maxsize = maxsize
+        self.stages: list[_Stage] = []
+        super().__init__()
+
+    def pipe(
+        self,
+        function: Callable[[Any], Awaitable[Any] | AsyncIterator[Any]],
+        *,
+        concurrency: int = 1,
+        ordered: bool = True,
+        maxsize: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> "AsyncPipeline[Any]":
+        label: str = name or getattr(function, "__name__", "stage")
+        stage = _Stage(function, label, concurrency, ordered, maxsize or self.maxsize)
+        self.stages.append(stage)
+        return self
+
+    @property
+    def stats(self) -> list[StageStats]:
+        return [stage.stats for stage in self.stages]
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._run()
+
+    def report(self) -> str:
+        lines = [
+            f"{'stage':<20} {'in':>8} {'out':>8} {'p50 ms':>9} {'p99 ms':>9}"
+            f" {'wait p99':>9} {'depth':>6}"
+        ]
+        for s in self.stats:
+            p50 = p99 = wait = 0
+            if s.latency.count:
+                p50, p99 = s.latency.percentile(50), s.latency.percentile(99)
+                wait = s.wait.percentile(99)
+            lines.append(
+                f"{s.name:<20} {s.items_in:>8} {s.items_out:>8} {p50 / 1e6:>9.3f}"
+                f" {p99 / 1e6:>9.3f} {wait / 1e6:>9.3f} {s.max_depth:>6}"
+            )
+        return "\n".join(lines)
+
+    async def _run(self) -> AsyncIterator[T]:
+        queues: list[asyncio.Queue[Any]] = [
+            asyncio.Queue(stage.maxsize) for stage in self.stages
+        ]
+        queues.append(asyncio.Queue(self.maxsize))
+        tasks = [asyncio.create_task(self._feed(queues[0]))]
+        tasks += [
+            asyncio.create_task(stage.run(inbox, outbox))
+            for stage, inbox, outbox in zip(self.stages, queues, queues[1:])
+        ]
+        last = queues[-1]
+        failures: list[BaseException] = []
+
+        def done(task: asyncio.Task[None]) -> None:
+            if task.cancelled() or (exception := task.exception()) is None:
+                return
+            if not failures:
+                failures.append(exception)
+                for other in tasks:
+                    other.cancel()
+                # Items not consumed yet are dropped: the consumer gets the error
+                while last.full():
+                    last.get_nowait()
+                last.put_nowait(_FAILED)
+
+        for task in tasks:
+            task.add_done_callback(done)
+        try:
+            while True:
+                entry: _Entry = await last.get()
+                if entry is _DONE:
+                    return
+                if entry is _FAILED:
+                    raise failures[0]
+                yield entry[2]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _feed(self, outbox: asyncio.Queue[Any]) -> None:
+        clock = time.perf_counter_ns
+        position = 0
+        async for item in _aiter(self.source):
+            await outbox.put((position, clock(), item))
+            position += 1
+        await outbox.put(_DONE)
+
+
+async def _aiter(source: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
@@ -0,0 +1,49 @@
+"""Micro-benchmarks paired with the examples in the "tests" directory."""
+
+from .baseline import (
+    Regression,
+    RegressionError,
+    check,
+    compare,
+    load_baseline,
+    save_baseline,
+)
+from .core import (
+    Benchmark,
+    Operation,
+    Result,
+    benchmark,
+    calibrate,
+    index,
+    measure,
+    registry,
+    run,
+    select,
+    sources,
+)
+from .runner import RUNNERS, InProcessRunner, Options, Runner, SubprocessRunner
+
+__all__ = [
+    "Benchmark",
+    "InProcessRunner",
+    "Operation",
+    "Options",
+    "RUNNERS",
+    "Regression",
+    "RegressionError",
+    "Result",
+    "Runner",
+    "SubprocessRunner",
+    "benchmark",
+    "calibrate",
+    "check",
+    "compare",
+    "index",
+    "load_baseline",
+    "measure",
+    "registry",
+    "run",
+    "save_baseline",
+    "select",
+    "sources",
+]
@@ -0,0 +1,105 @@
+import json
+import platform
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .core import Result
+
+VERSION = 1
+
+# Metrics compared against a baseline
+METRICS: tuple[str, ...] = ("ns_per_op", "allocations", "peak_bytes")
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.metric} {self.baseline:.1f} -> {self.current:.1f}"
+            f" ({self.ratio - 1:+.1%})"
+        )
+
+
+class RegressionError(Exception):
+    def __init__(self, regressions: list[Regression]) -> None:
+        super().__init__(regressions)
+
+    def __str__(self) -> str:
+        return "\n".join(str(regression) for regression in self.regressions)
+
+    @property
+    def regressions(self) -> list[Regression]:
+        return self.args[0]
+
+
+def save_baseline(path: Path | str, results: Iterable[Result]) -> None:
+    document: dict[str, Any] = {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "results": {
+            result.name: {
+                "ns_per_op": result.ns_per_op,
+                "samples": list(result.samples),
+                "allocations": result.allocations,
+                "peak_bytes": result.peak_bytes,
+            }
+            for result in results
+        },
+    }
+    Path(path).write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path | str) -> dict[str, Result]:
+    document: dict[str, Any] = json.loads(Path(path).read_text())
+    if document.get("version") != VERSION:
+        raise ValueError(f"unsupported baseline version: {document.get('version')!r}")
+    return {
+        name: Result(
+            name=name,
+            ns_per_op=float(values["ns_per_op"]),
+            samples=tuple(float(sample) for sample in values.get("samples", ())),
+            allocations=float(values["allocations"]),
+            peak_bytes=int(values["peak_bytes"]),
+        )
+        for name, values in document["results"].items()
+    }
+
+
+def compare(
+    results: Iterable[Result],
+    baseline: Mapping[str, Result],
+    threshold: float = 0.1,
+) -> list[Regression]:
+    # Benchmarks missing from the baseline are new and cannot regress
+    regressions: list[Regression] = []
+    for result in results:
+        if (reference := baseline.get(result.name)) is None:
+            continue
+        for metric in METRICS:
+            before: float = getattr(reference, metric)
+            after: float = getattr(result, metric)
+            # Allocation counts are small integers: allow half a block of noise
+            slack = 0.5 if metric == "allocations" else 0
+            if after > before * (1 + threshold) + slack:
+                regressions.append(Regression(result.name, metric, before, after))
+    return regressions
+
+
+def check(
+    results: Iterable[Result],
+    baseline: Mapping[str, Result],
+    threshold: float = 0.1,
+) -> None:
+    if regressions := compare(results, baseline, threshold):
+        raise RegressionError(regressions)
@@ -0,0 +1,37 @@
+import operator
+
+from .core import Operation, benchmark
+
+WORDS = ["a", "b"] * 500
+PAIRS = [(i % 7, str(i % 11)) for i in range(1000)]
+
+
+@benchmark
+def map_lambda() -> Operation:
+    return lambda: list(map(lambda x: x.upper(), WORDS))
+
+
+@benchmark
+def map_method() -> Operation:
+    return lambda: list(map(str.upper, WORDS))
+
+
+@benchmark
+def list_comprehension() -> Operation:
+    return lambda: [x.upper() for x in WORDS]
+
+
+@benchmark
+def sorted_itemgetter() -> Operation:
+    key = operator.itemgetter(0, 1)
+    return lambda: sorted(PAIRS, key=key)
+
+
+@benchmark
+def sorted_lambda() -> Operation:
+    return lambda: sorted(PAIRS, key=lambda pair: (pair[0], pair[1]))
+
+
+@benchmark
+def sorted_natural() -> Operation:
+    return lambda: sorted(PAIRS)
@@ -0,0 +1,323 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import NamedTuple, Protocol, cast, runtime_checkable
+
+from ..columnar import Columnar
+from ..descriptors import cached_field, computed
+from ..protocols import fast_runtime_checkable
+from ..records import Frozen, Record
+from .core import Operation, benchmark
+
+# ______________________________________________________________________________
+# Records
+
+
+class Slots:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+@dataclass(slots=True)
+class DataClass:
+    x: int
+    y: int
+
+
+class Tuple(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenDataClass:
+    x: int
+    y: int
+
+
+class FrozenRecord(Record, frozen=True):
+    x: int
+    y: int
+
+
+@benchmark
+def slots_construction() -> Operation:
+    return lambda: Slots(1, 2)
+
+
+@benchmark
+def dataclass_slots_construction() -> Operation:
+    return lambda: DataClass(1, 2)
+
+
+@benchmark
+def named_tuple_construction() -> Operation:
+    return lambda: Tuple(1, 2)
+
+
+@benchmark
+def dataclass_frozen_construction() -> Operation:
+    # __init__ assigns with object.__setattr__, to get around __setattr__
+    return lambda: FrozenDataClass(1, 2)
+
+
+@benchmark
+def record_frozen_construction() -> Operation:
+    return lambda: FrozenRecord(1, 2)
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenEvent:
+    name: str
+    value: int
+    weight: float
+
+
+class Event(Frozen, frozen=True):
+    name: str
+    value: int
+    weight: float
+
+
+@benchmark
+def dataclass_frozen_event_construction() -> Operation:
+    return lambda: FrozenEvent("a", 1, 0.5)
+
+
+@benchmark
+def frozen_event_construction() -> Operation:
+    return lambda: Event("a", 1, 0.5)
+
+
+@benchmark
+def dataclass_frozen_replace() -> Operation:
+    event = FrozenEvent("a", 1, 0.5)
+    return lambda: replace(event, value=2)
+
+
+@benchmark
+def frozen_replace() -> Operation:
+    event = Event("a", 1, 0.5)
+    return lambda: event.replace(value=2)
+
+
+@benchmark
+def dataclass_frozen_hash() -> Operation:
+    event = FrozenEvent("a", 1, 0.5)
+    return lambda: hash(event)
+
+
+@benchmark
+def frozen_hash() -> Operation:
+    # Computed by the first call only
+    event = Event("a", 1, 0.5)
+    return lambda: hash(event)
+
+
+@benchmark
+def slots_attribute_access() -> Operation:
+    instance = Slots(1, 2)
+    return lambda: instance.x + instance.y
+
+
+@benchmark
+def dataclass_slots_attribute_access() -> Operation:
+    instance = DataClass(1, 2)
+    return lambda: instance.x + instance.y
+
+
+@benchmark
+def named_tuple_attribute_access() -> Operation:
+    instance = Tuple(1, 2)
+    return lambda: instance.x + instance.y
+
+
+# ______________________________________________________________________________
+# Record stores
+
+ROWS = 1000
+
+
+@dataclass(slots=True)
+class Row:
+    name: str
+    value: int
+    weight: float
+
+
+def rows() -> list[Row]:
+    return [Row(f"name{i % 10}", i, i / 2) for i in range(ROWS)]
+
+
+@benchmark
+def dataclass_list_build() -> Operation:
+    return rows
+
+
+@benchmark
+def columnar_build() -> Operation:
+    return lambda: Columnar(Row, rows())
+
+
+@benchmark
+def dataclass_list_column_sum() -> Operation:
+    instances = rows()
+    return lambda: sum(instance.value for instance in instances)
+
+
+@benchmark
+def columnar_column_sum() -> Operation:
+    table = Columnar(Row, rows())
+    return lambda: sum(table.column("value"))
+
+
+@benchmark
+def dataclass_list_astuple() -> Operation:
+    instances = rows()
+    return lambda: [(i.name, i.value, i.weight) for i in instances]
+
+
+@benchmark
+def columnar_astuple() -> Operation:
+    table = Columnar(Row, rows())
+    return table.astuple
+
+
+# ______________________________________________________________________________
+# Structural subtyping
+
+
+@runtime_checkable
+class MyProtocol(Protocol):
+    def foo(self) -> int: ...
+
+
+@fast_runtime_checkable
+@runtime_checkable
+class MyFastProtocol(Protocol):
+    def foo(self) -> int: ...
+
+
+class AbstractClass(ABC):
+    @abstractmethod
+    def foo(self) -> int: ...
+
+    @classmethod
+    def __subclasshook__(cls, C: type) -> bool:
+        if cls is AbstractClass:
+            return any("foo" in B.__dict__ for B in C.__mro__)
+        return NotImplemented
+
+
+class Structural:
+    def foo(self) -> int:
+        return 0
+
+
+class NotStructural:
+    def bar(self) -> int:
+        return 0
+
+
+@benchmark
+def runtime_checkable_isinstance() -> Operation:
+    # As an object, or type checkers find the isinstance call unnecessary
+    instance = cast(object, Structural())
+    return lambda: isinstance(instance, MyProtocol)
+
+
+@benchmark
+def subclasshook_isinstance() -> Operation:
+    instance = Structural()
+    return lambda: isinstance(instance, AbstractClass)
+
+
+@benchmark
+def fast_runtime_checkable_isinstance() -> Operation:
+    instance = cast(object, Structural())
+    return lambda: isinstance(instance, MyFastProtocol)
+
+
+@benchmark
+def runtime_checkable_isinstance_miss() -> Operation:
+    instance = NotStructural()
+    return lambda: isinstance(instance, MyProtocol)
+
+
+@benchmark
+def fast_runtime_checkable_isinstance_miss() -> Operation:
+    instance = NotStructural()
+    return lambda: isinstance(instance, MyFastProtocol)
+
+
+@benchmark
+def runtime_checkable_dispatch_loop() -> Operation:
+    # A hot dispatch loop over mixed types
+    values = [Structural(), NotStructural(), 1, "a"] * 25
+    return lambda: sum(isinstance(value, MyProtocol) for value in values)
+
+
+@benchmark
+def fast_runtime_checkable_dispatch_loop() -> Operation:
+    values = [Structural(), NotStructural(), 1, "a"] * 25
+    return lambda: sum(isinstance(value, MyFastProtocol) for value in values)
+
+
+# ______________________________________________________________________________
+# Derived attributes
+
+
+class PropertyShape:
+    __slots__ = ("points",)
+
+    def __init__(self, points: list[int]) -> None:
+        self.points = points
+
+    @property
+    def total(self) -> int:
+        return sum(self.points)
+
+
+class CachedShape:
+    __slots__ = ("points", "_total")
+
+    def __init__(self, points: list[int]) -> None:
+        self.points = points
+
+    @cached_field
+    def total(self) -> int:
+        return sum(self.points)
+
+
+class ComputedShape:
+    __slots__ = ("points", "_total")
+
+    def __init__(self, points: list[int]) -> None:
+        self.points = points
+
+    @computed("points")
+    def total(self) -> int:
+        return sum(self.points)
+
+
+POINTS = list(range(100))
+
+
+@benchmark
+def property_derived_access() -> Operation:
+    instance = PropertyShape(POINTS)
+    return lambda: instance.total
+
+
+@benchmark
+def cached_field_derived_access() -> Operation:
+    instance = CachedShape(POINTS)
+    return lambda: instance.total
+
+
+@benchmark
+def computed_derived_access() -> Operation:
+    instance = ComputedShape(POINTS)
+    return lambda: instance.total
@@ -0,0 +1,183 @@
+import gc
+import importlib
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Optional
+
+from ..stats import percentile
+
+# An operation is the body of a benchmark: it is called many times in a row
+type Operation = Callable[[], object]
+
+# A factory builds the state needed by an operation and returns the operation
+type Factory = Callable[[], Operation]
+
+# Modules paired with the examples in the "tests" directory
+MODULES: tuple[str, ...] = (
+    "language",
+    "classes",
+    "generics",
+    "dunders",
+    "data_types",
+    "builtin_functions",
+    "standard_library",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    group: str
+    factory: Factory
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    name: str
+    ns_per_op: float
+    samples: tuple[float, ...]
+    # Memory blocks still referenced by the value returned by one operation
+    allocations: float
+    # Peak of the memory traced while running one operation
+    peak_bytes: int
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.samples, 99)
+
+
+_registry: dict[str, Benchmark] = {}
+
+
+def benchmark(factory: Factory) -> Factory:
+    group = factory.__module__.rpartition(".")[2]
+    name = f"{group}.{factory.__name__}"
+    _registry[name] = Benchmark(name=name, group=group, factory=factory)
+    return factory
+
+
+def registry(modules: Iterable[str] = MODULES) -> dict[str, Benchmark]:
+    modules = set(modules)
+    for module in modules:
+        importlib.import_module(f"{__package__}.{module}")
+    return {name: b for name, b in _registry.items() if b.group in modules}
+
+
+def select(
+    pattern: Optional[str] = None, modules: Iterable[str] = MODULES
+) -> list[Benchmark]:
+    return [
+        bench
+        for name, bench in sorted(registry(modules).items())
+        if pattern is None or fnmatchcase(name, pattern)
+    ]
+
+
+def index() -> dict[str, str]:
+    # The module of each benchmark: selecting with it imports only what matches
+    return {name: bench.group for name, bench in registry().items()}
+
+
+def sources() -> list[Path]:
+    # The files index() depends on
+    return [Path(__file__).with_name(f"{module}.py") for module in MODULES]
+
+
+def calibrate(operation: Operation, min_time: float = 0.01) -> int:
+    # Same progression as timeit.Timer.autorange: 1, 2, 5, 10, 20, 50, ...
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = scale * multiplier
+            if _time(operation, number) >= min_time * 1e9:
+                return number
+        scale *= 10
+
+
+def measure(
+    bench: Benchmark,
+    number: Optional[int] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    min_time: float = 0.01,
+) -> Result:
+    # number=None calibrates the loop so that one sample lasts at least min_time
+    operation = bench.factory()
+    for _ in range(warmup):
+        operation()
+    if number is None:
+        number = calibrate(operation, min_time)
+
+    samples: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            samples.append(_time(operation, number) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return Result(
+        name=bench.name,
+        ns_per_op=statistics.median(samples),
+        samples=tuple(samples),
+        allocations=_allocations(operation, number),
+        peak_bytes=_peak_bytes(operation),
+    )
+
+
+def run(
+    pattern: Optional[str] = None,
+    number: Optional[int] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    min_time: float = 0.01,
+) -> list[Result]:
+    return [
+        measure(bench, number, repeat, warmup, min_time) for bench in select(pattern)
+    ]
+
+
+def _time(operation: Operation, number: int) -> int:
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        operation()
+    return time.perf_counter_ns() - start
+
+
+def _allocations(operation: Operation, number: int) -> float:
+    values: list[object] = [None] * number
+    gc.collect()
+    before = sys.getallocatedblocks()
+    for index in range(number):
+        values[index] = operation()
+    after = sys.getallocatedblocks()
+    del values
+    return max(after - before, 0) / number
+
+
+def _peak_bytes(operation: Operation) -> int:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+        return max(peak - current, 0)
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
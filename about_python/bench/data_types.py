@@ -0,0 +1,114 @@
+import struct
+from typing import Annotated, NamedTuple, TypedDict
+
+from ..codec import Codec, Format
+from .core import Operation, benchmark
+
+# ______________________________________________________________________________
+# Strings
+
+
+@benchmark
+def string_concatenation() -> Operation:
+    words = ["abc"] * 100
+
+    def operation() -> str:
+        result = ""
+        for word in words:
+            result += word
+        return result
+
+    return operation
+
+
+@benchmark
+def string_join() -> Operation:
+    words = ["abc"] * 100
+    return lambda: "".join(words)
+
+
+@benchmark
+def f_string() -> Operation:
+    x, y = 1, "a"
+    return lambda: f"{x}-{y}"
+
+
+@benchmark
+def percent_format() -> Operation:
+    x, y = 1, "a"
+    return lambda: "%d-%s" % (x, y)
+
+
+# ______________________________________________________________________________
+# Records
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+class PointTuple(NamedTuple):
+    x: int
+    y: int
+
+
+@benchmark
+def typed_dict_construction() -> Operation:
+    return lambda: Point(x=1, y=2)
+
+
+@benchmark
+def dict_literal_construction() -> Operation:
+    return lambda: {"x": 1, "y": 2}
+
+
+@benchmark
+def named_tuple_keyword_construction() -> Operation:
+    return lambda: PointTuple(x=1, y=2)
+
+
+# ______________________________________________________________________________
+# Binary records
+
+
+class Record(NamedTuple):
+    id: int
+    value: float
+    flags: Annotated[int, Format("I")]
+
+
+RECORDS = 1000
+
+
+def records(codec: Codec[Record]) -> bytes:
+    return b"".join(codec.pack(Record(i, i / 2, i % 7)) for i in range(RECORDS))
+
+
+@benchmark
+def struct_unpack_loop() -> Operation:
+    codec = Codec(Record)
+    data = records(codec)
+    size = codec.size
+
+    def operation() -> list[Record]:
+        return [
+            Record(*struct.unpack("<qdI", data[offset : offset + size]))
+            for offset in range(0, len(data), size)
+        ]
+
+    return operation
+
+
+@benchmark
+def codec_iter_unpack() -> Operation:
+    codec = Codec(Record)
+    data = records(codec)
+    return lambda: list(codec.iter_unpack(data))
+
+
+@benchmark
+def codec_view_random_access() -> Operation:
+    codec = Codec(Record)
+    view = codec.view(records(codec))
+    return lambda: view[RECORDS // 2]
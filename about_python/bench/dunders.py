@@ -0,0 +1,216 @@
+from typing import Any, Optional
+
+from .. import records
+from ..proxy import make_proxy
+from ..registry import Registry
+from ..stats import Histogram
+from .core import Operation, benchmark
+
+# ______________________________________________________________________________
+# Attribute access
+
+
+class Descriptor:
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = "_" + name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> int:
+        return getattr(obj, self.name)
+
+    def __set__(self, obj: Any, value: int) -> None:
+        setattr(obj, self.name, value)
+
+
+class WithDescriptor:
+    value = Descriptor()
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+class WithProperty:
+    def __init__(self) -> None:
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class WithAttribute:
+    def __init__(self) -> None:
+        self.value = 0
+
+
+@benchmark
+def descriptor_access() -> Operation:
+    instance = WithDescriptor()
+    return lambda: instance.value
+
+
+@benchmark
+def property_access() -> Operation:
+    instance = WithProperty()
+    return lambda: instance.value
+
+
+@benchmark
+def attribute_access() -> Operation:
+    instance = WithAttribute()
+    return lambda: instance.value
+
+
+# ______________________________________________________________________________
+# Delegation
+
+
+class Target:
+    def get_int(self, value: int) -> int:
+        return value
+
+
+class Proxy:
+    def __init__(self, value: Target) -> None:
+        self._value = value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._value, name)
+
+
+@benchmark
+def getattr_proxy_call() -> Operation:
+    proxy = Proxy(Target())
+    return lambda: proxy.get_int(1)
+
+
+@benchmark
+def generated_proxy_call() -> Operation:
+    proxy = make_proxy(Target)(Target())
+    return lambda: proxy.get_int(1)
+
+
+@benchmark
+def timed_proxy_call() -> Operation:
+    proxy = make_proxy(Target, hooks={"get_int": Histogram().record})(Target())
+    return lambda: proxy.get_int(1)
+
+
+@benchmark
+def direct_call() -> Operation:
+    target = Target()
+    return lambda: target.get_int(1)
+
+
+# ______________________________________________________________________________
+# Frozen instances
+
+
+class FrozenClass:
+    _isfrozen = False
+
+    def __init__(self, isfrozen: bool) -> None:
+        self._isfrozen = isfrozen
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if self._isfrozen and not hasattr(self, key):
+            raise TypeError("%r is a frozen class" % self)
+        object.__setattr__(self, key, value)
+
+
+class Frozen(FrozenClass):
+    def __init__(self, value: int) -> None:
+        self.value = value
+        super().__init__(True)
+
+
+class FrozenValue(records.Frozen, frozen=True):
+    value: int
+
+
+@benchmark
+def setattr_frozen_construction() -> Operation:
+    return lambda: Frozen(10)
+
+
+@benchmark
+def frozen_value_construction() -> Operation:
+    # Sealed by the class: __init__ runs no __setattr__
+    return lambda: FrozenValue(10)
+
+
+# ______________________________________________________________________________
+# Class registries
+
+
+class Plugin(Registry):
+    pass
+
+
+# 4 families of 5 plugins each, under an intermediate class each
+FAMILIES = [type(f"Family{i}", (Plugin,), {}) for i in range(4)]
+PLUGINS = [
+    type(f"Plugin{i}{j}", (family,), {}, key=f"plugin{i}{j}")
+    for i, family in enumerate(FAMILIES)
+    for j in range(5)
+]
+
+
+def walk(cls: type) -> list[type]:
+    # The subclasses of cls at any depth, as plugin discovery finds them
+    found: list[type] = []
+    for subclass in cls.__subclasses__():
+        found.append(subclass)
+        found += walk(subclass)
+    return found
+
+
+@benchmark
+def subclasses_walk_lookup() -> Operation:
+    return lambda: next(
+        c for c in walk(Plugin) if getattr(c, "key", None) == "plugin34"
+    )
+
+
+@benchmark
+def registry_lookup() -> Operation:
+    return lambda: Plugin.lookup("plugin34")
+
+
+@benchmark
+def subclasses_walk() -> Operation:
+    return lambda: walk(Plugin)
+
+
+@benchmark
+def registry_descendants() -> Operation:
+    return Plugin.descendants
+
+
+# ______________________________________________________________________________
+# Containers
+
+
+class Container:
+    def __init__(self, values: list[int]) -> None:
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: int) -> bool:
+        return value in self.values
+
+    def __getitem__(self, index: int) -> int:
+        return self.values[index]
+
+
+@benchmark
+def dunder_getitem() -> Operation:
+    container = Container(list(range(100)))
+    return lambda: container[50]
+
+
+@benchmark
+def dunder_contains() -> Operation:
+    container = Container(list(range(100)))
+    return lambda: 99 in container
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from .core import Operation, benchmark
+
+
+def identity[T](value: T) -> T:
+    return value
+
+
+def identity_int(value: int) -> int:
+    return value
+
+
+@dataclass(slots=True)
+class GenericClass[T, S]:
+    t: T
+    s: S
+
+
+@benchmark
+def generic_function_call() -> Operation:
+    return lambda: identity(1)
+
+
+@benchmark
+def function_call() -> Operation:
+    return lambda: identity_int(1)
+
+
+@benchmark
+def generic_class_construction() -> Operation:
+    return lambda: GenericClass("1", 1)
+
+
+@benchmark
+def subscripted_generic_class_construction() -> Operation:
+    # Subscripted aliases go through typing._GenericAlias.__call__
+    alias = GenericClass[str, int]
+    return lambda: alias("1", 1)
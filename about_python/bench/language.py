@@ -0,0 +1,148 @@
+import functools
+from typing import Any, overload
+
+from ..dispatch import dispatch
+from .core import Operation, benchmark
+
+VALUES = list(range(1000))
+
+
+@benchmark
+def generator_pipeline() -> Operation:
+    def operation() -> int:
+        squares = (value * value for value in VALUES)
+        return sum(square for square in squares if square % 3)
+
+    return operation
+
+
+@benchmark
+def list_pipeline() -> Operation:
+    def operation() -> int:
+        squares = [value * value for value in VALUES]
+        return sum([square for square in squares if square % 3])
+
+    return operation
+
+
+@benchmark
+def try_without_exception() -> Operation:
+    def operation() -> int:
+        try:
+            return 1
+        except ValueError:
+            return 0
+
+    return operation
+
+
+@benchmark
+def try_with_exception() -> Operation:
+    def operation() -> int:
+        try:
+            raise ValueError
+        except ValueError:
+            return 0
+
+    return operation
+
+
+@benchmark
+def closure_call() -> Operation:
+    captured: int = 1
+
+    def f() -> int:
+        return captured
+
+    return f
+
+
+@benchmark
+def default_argument_call() -> Operation:
+    captured: int = 1
+
+    def f(x: int = captured) -> int:
+        return x
+
+    return f
+
+
+# ______________________________________________________________________________
+# Overloads
+
+MIXED: list[Any] = [1, [1, 2], "a", 2.5] * 25
+
+# The isinstance chain is the fastest: dispatch only beats singledispatch
+
+
+@benchmark
+def isinstance_chain_overload() -> Operation:
+    def overloaded_function(x: Any) -> Any:
+        if isinstance(x, int):
+            return x
+        elif isinstance(x, list):
+            return x[0]  # type: ignore
+        elif isinstance(x, str):
+            return len(x)
+        return None
+
+    return lambda: [overloaded_function(x) for x in MIXED]
+
+
+@benchmark
+def singledispatch_overload() -> Operation:
+    @functools.singledispatch
+    def overloaded_function(x: Any) -> Any:
+        return None
+
+    @overloaded_function.register
+    def _(x: int) -> Any:
+        return x
+
+    @overloaded_function.register
+    def _(x: list) -> Any:  # type: ignore
+        return x[0]  # type: ignore
+
+    @overloaded_function.register
+    def _(x: str) -> Any:
+        return len(x)
+
+    return lambda: [overloaded_function(x) for x in MIXED]
+
+
+@benchmark
+def dispatch_overload() -> Operation:
+    @overload
+    def overloaded_function(x: int) -> int:
+        return x
+
+    @overload
+    def overloaded_function(x: list) -> int:  # type: ignore
+        return x[0]  # type: ignore
+
+    @overload
+    def overloaded_function(x: str) -> int:
+        return len(x)
+
+    @dispatch
+    def overloaded_function(x: Any) -> Any:
+        return None
+
+    return lambda: [overloaded_function(x) for x in MIXED]
+
+
+@benchmark
+def dispatch_generic_overload() -> Operation:
+    @overload
+    def overloaded_function(x: int) -> int:
+        return x
+
+    @overload
+    def overloaded_function(x: list[int]) -> int:
+        return x[0]
+
+    @dispatch
+    def overloaded_function(x: Any) -> Any:
+        return None
+
+    return lambda: [overloaded_function(x) for x in MIXED]
@@ -0,0 +1,52 @@
+from collections.abc import Iterable, Mapping
+from typing import Optional
+
+from .core import Result
+
+HEADERS = ("benchmark", "median", "p95", "p99", "allocs/op", "peak", "vs baseline")
+
+
+def format_table(
+    results: Iterable[Result], baseline: Optional[Mapping[str, Result]] = None
+) -> str:
+    rows: list[tuple[str, ...]] = [HEADERS]
+    for result in results:
+        delta = ""
+        if baseline is not None and (reference := baseline.get(result.name)):
+            delta = f"{result.ns_per_op / reference.ns_per_op - 1:+.1%}"
+        rows.append(
+            (
+                result.name,
+                format_time(result.ns_per_op),
+                format_time(result.p95),
+                format_time(result.p99),
+                f"{result.allocations:.1f}",
+                format_size(result.peak_bytes),
+                delta,
+            )
+        )
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(HEADERS))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def format_time(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.1f} ns"
+
+
+def format_size(size: float) -> str:
+    for unit, scale in (("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if size >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size:.0f} B"
@@ -0,0 +1,122 @@
+import argparse
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Protocol
+
+from .core import Benchmark, Result, measure, registry
+
+
+@dataclass(frozen=True, slots=True)
+class Options:
+    # None calibrates the number of loops per sample
+    number: Optional[int] = None
+    repeat: int = 20
+    warmup: int = 1
+    min_time: float = 0.01
+    # CPU the measurements are pinned to, when the platform supports it
+    cpu: Optional[int] = None
+
+
+class Runner(Protocol):
+    def run(
+        self, benchmarks: Sequence[Benchmark], options: Options
+    ) -> list[Result]: ...
+
+
+class InProcessRunner:
+    def run(self, benchmarks: Sequence[Benchmark], options: Options) -> list[Result]:
+        if options.cpu is not None:
+            pin(options.cpu)
+        return [_measure(bench, options) for bench in benchmarks]
+
+
+class SubprocessRunner:
+    """Run each benchmark in a fresh interpreter, so that the state left by one
+    benchmark (caches, heap fragmentation, ...) cannot affect the next one."""
+
+    def __init__(self, executable: str = sys.executable) -> None:
+        self.executable = executable
+        super().__init__()
+
+    def run(self, benchmarks: Sequence[Benchmark], options: Options) -> list[Result]:
+        return [self._run(bench, options) for bench in benchmarks]
+
+    def _run(self, bench: Benchmark, options: Options) -> Result:
+        command = [self.executable, "-m", __name__, bench.name]
+        command += [f"--repeat={options.repeat}", f"--warmup={options.warmup}"]
+        command += [f"--min-time={options.min_time}"]
+        if options.number is not None:
+            command.append(f"--number={options.number}")
+        if options.cpu is not None:
+            command.append(f"--cpu={options.cpu}")
+        output = subprocess.run(
+            command, check=True, capture_output=True, text=True, env=_environment()
+        )
+        values = json.loads(output.stdout)
+        return Result(
+            name=values["name"],
+            ns_per_op=values["ns_per_op"],
+            samples=tuple(values["samples"]),
+            allocations=values["allocations"],
+            peak_bytes=values["peak_bytes"],
+        )
+
+
+RUNNERS: dict[str, type[Runner]] = {
+    "inprocess": InProcessRunner,
+    "subprocess": SubprocessRunner,
+}
+
+
+def pin(cpu: int) -> bool:
+    # sched_setaffinity is only available on some Unix platforms
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+    os.sched_setaffinity(0, {cpu})
+    return True
+
+
+def _environment() -> dict[str, str]:
+    # The worker must import this package even when it is not installed
+    root = str(Path(__file__).resolve().parents[2])
+    paths = [root, *filter(None, [os.environ.get("PYTHONPATH")])]
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(paths)}
+
+
+def _measure(bench: Benchmark, options: Options) -> Result:
+    return measure(
+        bench,
+        number=options.number,
+        repeat=options.repeat,
+        warmup=options.warmup,
+        min_time=options.min_time,
+    )
+
+
+def _worker(argv: Optional[Sequence[str]] = None) -> int:
+    defaults = Options()
+    parser = argparse.ArgumentParser(prog=f"python -m {__name__}")
+    parser.add_argument("name")
+    parser.add_argument("--number", type=int)
+    parser.add_argument("--repeat", type=int, default=defaults.repeat)
+    parser.add_argument("--warmup", type=int, default=defaults.warmup)
+    parser.add_argument("--min-time", type=float, default=defaults.min_time)
+    parser.add_argument("--cpu", type=int)
+    args = parser.parse_args(argv)
+
+    # Names start with their module: the worker imports only that one
+    bench = registry([args.name.partition(".")[0]])[args.name]
+    options = Options(args.number, args.repeat, args.warmup, args.min_time, args.cpu)
+    (result,) = InProcessRunner().run([bench], options)
+    json.dump(dataclasses.asdict(result), sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_worker())
@@ -0,0 +1,197 @@
+import asyncio
+import functools
+import itertools
+import operator
+import re
+import weakref
+
+from .. import regex
+from ..cache import memoize
+from ..scheduler import Scheduler, TaskGenerator
+from .core import Operation, benchmark
+
+VALUES = list(range(1000))
+TEXT = "abc-def-abc " * 100
+
+
+# ______________________________________________________________________________
+# functools
+
+
+@benchmark
+def reduce_add() -> Operation:
+    return lambda: functools.reduce(operator.add, VALUES)
+
+
+@benchmark
+def builtin_sum() -> Operation:
+    return lambda: sum(VALUES)
+
+
+@benchmark
+def partial_call() -> Operation:
+    def sum(x: int, y: int) -> int:
+        return x + y
+
+    f = functools.partial(sum, y=10)
+    return lambda: f(1)
+
+
+@benchmark
+def lru_cache_hit() -> Operation:
+    @functools.lru_cache(maxsize=128)
+    def square(x: int) -> int:
+        return x * x
+
+    return lambda: square(1)
+
+
+@benchmark
+def memoize_hit() -> Operation:
+    @memoize(maxsize=128)
+    def square(x: int) -> int:
+        return x * x
+
+    return lambda: square(1)
+
+
+@benchmark
+def memoize_ttl_lfu_hit() -> Operation:
+    @memoize(maxsize=128, ttl=60, policy="lfu")
+    def square(x: int) -> int:
+        return x * x
+
+    return lambda: square(1)
+
+
+# ______________________________________________________________________________
+# itertools
+
+
+@benchmark
+def chain_iteration() -> Operation:
+    return lambda: sum(itertools.chain(VALUES, VALUES))
+
+
+@benchmark
+def concatenation_iteration() -> Operation:
+    return lambda: sum(VALUES + VALUES)
+
+
+# ______________________________________________________________________________
+# re
+
+
+@benchmark
+def re_module_findall() -> Operation:
+    return lambda: re.findall(r"abc", TEXT)
+
+
+@benchmark
+def re_compiled_findall() -> Operation:
+    pattern = re.compile(r"abc")
+    return lambda: pattern.findall(TEXT)
+
+
+PATTERNS = [rf"key{i}=(\d+)" for i in range(1000)]
+
+
+@benchmark
+def re_module_many_patterns() -> Operation:
+    # More patterns than the cache of the re module holds
+    def operation() -> int:
+        return sum(re.search(pattern, "key999=1") is not None for pattern in PATTERNS)
+
+    return operation
+
+
+@benchmark
+def pattern_cache_many_patterns() -> Operation:
+    def operation() -> int:
+        return sum(
+            regex.search(pattern, "key999=1") is not None for pattern in PATTERNS
+        )
+
+    return operation
+
+
+RULES = {
+    "error": r"ERROR \w+",
+    "warning": r"WARN(?:ING)? \w+",
+    "timeout": r"timeout after \d+ms",
+    "address": r"\d+\.\d+\.\d+\.\d+",
+    "user": r"user=\w+",
+}
+LOG = "\n".join(
+    f"2024-01-01 INFO request {i} from 10.0.0.{i % 255} user=u{i}"
+    + (" ERROR failed" if i % 10 == 0 else "")
+    + (" timeout after 30ms" if i % 7 == 0 else "")
+    for i in range(1000)
+)
+
+
+# With a handful of rules, one scan per rule can beat the combined scan: the
+# alternation is tried at every position of the string
+
+
+@benchmark
+def rules_pattern_loop() -> Operation:
+    patterns = {name: re.compile(pattern) for name, pattern in RULES.items()}
+
+    def operation() -> list[tuple[str, str]]:
+        return [
+            (name, match.group())
+            for name, pattern in patterns.items()
+            for match in pattern.finditer(LOG)
+        ]
+
+    return operation
+
+
+@benchmark
+def rules_pattern_set() -> Operation:
+    rules = regex.PatternSet(RULES)
+    return lambda: [(name, match.group()) for name, match in rules.finditer(LOG)]
+
+
+# ______________________________________________________________________________
+# Context switches: each operation switches between tasks SWITCHES times
+
+
+SWITCHES = 1000
+
+
+@benchmark
+def asyncio_switches() -> Operation:
+    loop = asyncio.new_event_loop()
+
+    async def task() -> None:
+        for _ in range(SWITCHES // 2):
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        await asyncio.gather(task(), task())
+
+    def operation() -> None:
+        loop.run_until_complete(main())
+
+    # Operations have no teardown: the loop is closed with the operation
+    weakref.finalize(operation, loop.close)
+    return operation
+
+
+@benchmark
+def scheduler_switches() -> Operation:
+    scheduler = Scheduler()
+
+    def task() -> TaskGenerator[None]:
+        for _ in range(SWITCHES // 2):
+            yield
+
+    def operation() -> None:
+        scheduler.spawn(task())
+        scheduler.spawn(task())
+        scheduler.run()
+
+    weakref.finalize(operation, scheduler.close)
+    return operation
@@ -0,0 +1,488 @@
+import asyncio
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import update_wrapper
+from typing import Any, Generic, Literal, Optional, ParamSpec, TypeVar, overload
+
+type Policy = Literal["lru", "lfu"]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+Y = TypeVar("Y")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    maxsize: Optional[int]
+    currsize: int
+    max_bytes: Optional[int]
+    currbytes: int
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("value", "size", "expires", "frequency")
+
+    def __init__(self, value: V, size: int, expires: float) -> None:
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.frequency = 1
+        super().__init__()
+
+
+class _Store(Generic[K, V]):
+    # Not thread-safe: callers serialize the accesses
+
+    def __init__(
+        self,
+        maxsize: Optional[int],
+        max_bytes: Optional[int],
+        ttl: Optional[float],
+        policy: Policy,
+        sizeof: Callable[[Any], int],
+        clock: Callable[[], float],
+    ) -> None:
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"unknown eviction policy: {policy!r}")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.policy = policy
+        self.sizeof = sizeof
+        self.clock = clock
+        # LRU: insertion order is recency order
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        # LFU: keys grouped by frequency, least recently used first in each group
+        self._frequencies: dict[int, OrderedDict[K, None]] = {}
+        self._min_frequency = 0
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        super().__init__()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[_Entry[V]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires <= self.clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._touch(key, entry)
+        self.hits += 1
+        return entry
+
+    def put(self, key: K, value: V) -> None:
+        size = self.sizeof(value)
+        if self.maxsize == 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+        if key in self._entries:
+            self._remove(key)
+        # Room is made before inserting: under LFU the new key, used once, would
+        # be its own victim
+        while self._entries and self._overflows(size):
+            self._remove(self._victim())
+            self.evictions += 1
+        expires = self.clock() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = _Entry(value, size, expires)
+        self.bytes += size
+        if self.policy == "lfu":
+            self._frequencies.setdefault(1, OrderedDict())[key] = None
+            self._min_frequency = 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._frequencies.clear()
+        self._min_frequency = 0
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+            max_bytes=self.max_bytes,
+            currbytes=self.bytes,
+        )
+
+    def _overflows(self, size: int) -> bool:
+        # Whether an entry of size more would exceed the bounds
+        return (self.maxsize is not None and len(self._entries) >= self.maxsize) or (
+            self.max_bytes is not None and self.bytes + size > self.max_bytes
+        )
+
+    def _touch(self, key: K, entry: _Entry[V]) -> None:
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+            return
+        keys = self._frequencies[entry.frequency]
+        del keys[key]
+        if not keys:
+            del self._frequencies[entry.frequency]
+            if self._min_frequency == entry.frequency:
+                self._min_frequency += 1
+        entry.frequency += 1
+        self._frequencies.setdefault(entry.frequency, OrderedDict())[key] = None
+
+    def _victim(self) -> K:
+        if self.policy == "lru":
+            return next(iter(self._entries))
+        return next(iter(self._frequencies[self._min_frequency]))
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        if self.policy == "lfu":
+            keys = self._frequencies[entry.frequency]
+            del keys[key]
+            if not keys:
+                del self._frequencies[entry.frequency]
+                if self._min_frequency == entry.frequency and self._frequencies:
+                    self._min_frequency = min(self._frequencies)
+
+
+class _Call(Generic[V]):
+    # A computation in flight, shared by the threads that missed the same key
+    __slots__ = ("event", "value", "exception")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.value: Optional[V] = None
+        self.exception: Optional[BaseException] = None
+        super().__init__()
+
+
+class Memoized(Generic[P, R]):
+    def __init__(
+        self,
+        function: Callable[P, R],
+        maxsize: Optional[int],
+        max_bytes: Optional[int],
+        ttl: Optional[float],
+        policy: Policy,
+        typed: bool,
+        sizeof: Callable[[Any], int],
+        clock: Callable[[], float],
+    ) -> None:
+        self.__wrapped__ = function
+        self._typed = typed
+        self._store = _Store[Hashable, R](
+            maxsize, max_bytes, ttl, policy, sizeof, clock
+        )
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[R]] = {}
+        update_wrapper(self, function)
+        super().__init__()
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        key = make_key(args, kwargs, self._typed)
+        with self._lock:
+            if (entry := self._store.get(key)) is not None:
+                return entry.value
+            call = self._calls.get(key)
+            owner = call is None
+            if call is None:
+                call = self._calls[key] = _Call[R]()
+
+        if not owner:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.value  # type: ignore
+
+        try:
+            call.value = self.__wrapped__(*args, **kwargs)
+        except BaseException as exception:
+            call.exception = exception
+            raise
+        else:
+            with self._lock:
+                self._store.put(key, call.value)
+            return call.value
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return self._store.info()
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+
+def memoize(
+    maxsize: Optional[int] = 128,
+    *,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    policy: Policy = "lru",
+    typed: bool = False,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+    clock: Callable[[], float] = time.monotonic,
+) -> Callable[[Callable[P, R]], Memoized[P, R]]:
+    """Thread-safe memoization: concurrent misses on the same key call the function
+    once (single-flight) and the other callers wait for its result.
+
+    None disables a bound. Values are measured with sizeof, shallow by default."""
+
+    def decorator(function: Callable[P, R]) -> Memoized[P, R]:
+        return Memoized(function, maxsize, max_bytes, ttl, policy, typed, sizeof, clock)
+
+    return decorator
+
+
+class AsyncMemoized(Generic[P, R]):
+    def __init__(
+        self, function: Callable[P, Awaitable[R]], typed: bool, store: _Store[Any, R]
+    ) -> None:
+        self.__wrapped__ = function
+        self._typed = typed
+        self._store = store
+        self._tasks: dict[Hashable, asyncio.Future[R]] = {}
+        update_wrapper(self, function)
+        super().__init__()
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        key = make_key(args, kwargs, self._typed)
+        if (entry := self._store.get(key)) is not None:
+            return entry.value
+        if (task := self._tasks.get(key)) is None:
+            task = self._tasks[key] = asyncio.ensure_future(
+                self.__wrapped__(*args, **kwargs)
+            )
+            task.add_done_callback(lambda task: self._done(key, task))
+        # A cancelled caller must not cancel the task the other callers await
+        return await asyncio.shield(task)
+
+    def cache_info(self) -> CacheInfo:
+        return self._store.info()
+
+    def cache_clear(self) -> None:
+        self._store.clear()
+
+    def _done(self, key: Hashable, task: asyncio.Future[R]) -> None:
+        del self._tasks[key]
+        if not task.cancelled() and task.exception() is None:
+            self._store.put(key, task.result())
+
+
+class _Recording(Generic[V]):
+    # The items of an async generator, pulled on demand by any of its consumers
+
+    def __init__(
+        self,
+        start: Callable[[], AsyncIterator[V]],
+        done: Callable[["_Recording[V]"], None],
+    ) -> None:
+        self.start = start
+        self.generator: Optional[AsyncIterator[V]] = None
+        self.done = done
+        self.items: list[V] = []
+        self.exception: Optional[BaseException] = None
+        self.finished = False
+        self.consumers = 0
+        self.lock = asyncio.Lock()
+        super().__init__()
+
+    async def next(self, index: int) -> V:
+        # The item at index, pulled from the generator if needed
+        while True:
+            if index < len(self.items):
+                return self.items[index]
+            if self.exception is not None:
+                raise self.exception
+            if self.finished:
+                raise StopAsyncIteration
+            async with self.lock:
+                if index == len(self.items) and not self.finished:
+                    await self._pull()
+
+    def leave(self) -> None:
+        # The last consumer gone, a recording not complete is dropped
+        self.consumers -= 1
+        if not self.consumers and not self.finished and self.exception is None:
+            self.done(self)
+
+    async def _pull(self) -> None:
+        try:
+            if self.generator is None:
+                # A cancelled consumer cancels the run: a new run skips the
+                # items recorded, as a memoized function returns the same ones
+                self.generator = self.start()
+                for _ in self.items:
+                    await anext(self.generator)
+            self.items.append(await anext(self.generator))
+        except StopAsyncIteration:
+            self.finished = True
+            self.done(self)
+        except asyncio.CancelledError:
+            # Raised in the generator by the cancellation of one consumer only
+            self.generator = None
+            raise
+        except BaseException as exception:
+            self.exception = exception
+            self.done(self)
+            raise
+
+
+class _Replay(AsyncIterator[V]):
+    # A consumer of a recording: an object, as a generator that is never
+    # started does not run its finally clause
+    def __init__(self, recording: _Recording[V]) -> None:
+        self._recording: Optional[_Recording[V]] = recording
+        self._index = 0
+        recording.consumers += 1
+        super().__init__()
+
+    async def __anext__(self) -> V:
+        if self._recording is None:
+            raise StopAsyncIteration
+        try:
+            item = await self._recording.next(self._index)
+        except BaseException:
+            self._leave()
+            raise
+        self._index += 1
+        return item
+
+    async def aclose(self) -> None:
+        self._leave()
+
+    def __del__(self) -> None:
+        self._leave()
+
+    def _leave(self) -> None:
+        if self._recording is not None:
+            self._recording.leave()
+            self._recording = None
+
+
+class AsyncGeneratorMemoized(Generic[P, Y]):
+    """Replay the items of completed async generators without running them again.
+
+    Concurrent consumers of the same key share one run of the generator."""
+
+    def __init__(
+        self,
+        function: Callable[P, AsyncIterator[Y]],
+        typed: bool,
+        store: _Store[Any, tuple[Y, ...]],
+    ) -> None:
+        self.__wrapped__ = function
+        self._typed = typed
+        self._store = store
+        self._recordings: dict[Hashable, _Recording[Y]] = {}
+        update_wrapper(self, function)
+        super().__init__()
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> AsyncIterator[Y]:
+        key = make_key(args, kwargs, self._typed)
+        if (entry := self._store.get(key)) is not None:
+            return _replay(entry.value)
+        if (recording := self._recordings.get(key)) is None:
+            recording = self._recordings[key] = _Recording(
+                lambda: self.__wrapped__(*args, **kwargs),
+                lambda recording: self._done(key, recording),
+            )
+        return _Replay(recording)
+
+    def cache_info(self) -> CacheInfo:
+        return self._store.info()
+
+    def cache_clear(self) -> None:
+        self._store.clear()
+
+    def _done(self, key: Hashable, recording: _Recording[Y]) -> None:
+        # Complete, failed or abandoned: new calls do not join it
+        if self._recordings.get(key) is recording:
+            del self._recordings[key]
+        if recording.finished:
+            self._store.put(key, tuple(recording.items))
+
+
+async def _replay(items: tuple[Y, ...]) -> AsyncIterator[Y]:
+    for item in items:
+        yield item
+
+
+class _AsyncDecorator:
+    def __init__(self, typed: bool, store: Callable[[], _Store[Any, Any]]) -> None:
+        self.typed = typed
+        self.store = store
+        super().__init__()
+
+    @overload
+    def __call__(
+        self, function: Callable[P, AsyncIterator[Y]]
+    ) -> AsyncGeneratorMemoized[P, Y]: ...
+
+    @overload
+    def __call__(self, function: Callable[P, Awaitable[R]]) -> AsyncMemoized[P, R]: ...
+
+    def __call__(self, function: Callable[P, Any]) -> Any:
+        if inspect.isasyncgenfunction(function):
+            return AsyncGeneratorMemoized(function, self.typed, self.store())
+        return AsyncMemoized(function, self.typed, self.store())
+
+
+def async_memoize(
+    maxsize: Optional[int] = 128,
+    *,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    policy: Policy = "lru",
+    typed: bool = False,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+    clock: Callable[[], float] = time.monotonic,
+) -> _AsyncDecorator:
+    """Memoization of coroutine and async generator functions, with the bounds of
+    memoize. Concurrent misses on the same key share one asyncio.Task.
+
+    Async generators are cached once exhausted, as the tuple of their items."""
+    return _AsyncDecorator(
+        typed, lambda: _Store(maxsize, max_bytes, ttl, policy, sizeof, clock)
+    )
+
+
+class _KeywordMark:
+    pass
+
+
+_KEYWORD_MARK = _KeywordMark()
+
+
+def make_key(
+    args: tuple[Any, ...], kwargs: dict[str, Any], typed: bool = False
+) -> Hashable:
+    # Same layout as functools.lru_cache keys
+    key: tuple[Any, ...] = args
+    if kwargs:
+        key += (_KEYWORD_MARK, *kwargs.items())
+    if typed:
+        key += tuple(value.__class__ for value in args)
+        key += tuple(value.__class__ for value in kwargs.values())
+    elif len(key) == 1 and type(key[0]) in (int, str):
+        return key[0]
+    return key
@@ -0,0 +1,116 @@
+import argparse
+from collections.abc import Sequence
+
+# This module is imported on every launch: it must not import more than what
+# parsing the command line needs, e.g. typing costs several milliseconds
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m about_python")
+    subparsers = parser.add_subparsers(dest="command")
+
+    bench = subparsers.add_parser("bench", help="run the micro-benchmarks")
+    bench.add_argument("pattern", nargs="?", help="glob matched against the names")
+    bench.add_argument("--list", action="store_true", help="list the benchmarks")
+    bench.add_argument("--runner", choices=["inprocess", "subprocess"])
+    bench.add_argument("--number", type=int, help="loops per sample (calibrated)")
+    bench.add_argument("--repeat", type=int, default=20, help="samples")
+    bench.add_argument("--warmup", type=int, default=1, help="warmup loops")
+    bench.add_argument("--min-time", type=float, default=0.01, help="seconds/sample")
+    bench.add_argument("--cpu", type=int, help="CPU the measurements are pinned to")
+    bench.add_argument("--baseline", help="JSON baseline compared with this run")
+    bench.add_argument("--save", help="save this run as a JSON baseline")
+    bench.add_argument("--threshold", type=float, default=0.1, help="regression")
+    bench.set_defaults(handler=_bench)
+
+    startup = subparsers.add_parser("startup", help="profile the startup imports")
+    startup.add_argument("--budget-ms", type=float, help="fail above this time")
+    startup.add_argument("--top", type=int, default=10, help="imports shown")
+    startup.add_argument(
+        "arguments",
+        nargs=argparse.REMAINDER,
+        help="arguments of the profiled interpreter, after -- (default: -m about_python)",
+    )
+    startup.set_defaults(handler=_startup)
+
+    return parser
+
+
+def run(argv: Sequence[str] | None = None) -> int:
+    args = parser().parse_args(argv)
+    if args.command is None:
+        print(__package__)
+        return 0
+    return args.handler(args)
+
+
+def _bench(args: argparse.Namespace) -> int:
+    from fnmatch import fnmatchcase
+
+    from .bench import (
+        RUNNERS,
+        Options,
+        compare,
+        index,
+        load_baseline,
+        save_baseline,
+        select,
+        sources,
+    )
+    from .bench.core import MODULES
+    from .bench.report import format_table
+    from .snapshot import load_or_build
+
+    modules: set[str] | tuple[str, ...] = MODULES
+    if args.pattern is not None:
+        # The snapshot of the index spares importing the modules nothing matches
+        modules = {
+            module
+            for name, module in load_or_build("bench-index", index, sources()).items()
+            if fnmatchcase(name, args.pattern)
+        }
+    benchmarks = select(args.pattern, modules)
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return 0
+
+    # Pinned runs default to isolated processes, so nothing else shares the CPU
+    runner = args.runner or ("subprocess" if args.cpu is not None else "inprocess")
+    options = Options(args.number, args.repeat, args.warmup, args.min_time, args.cpu)
+    results = RUNNERS[runner]().run(benchmarks, options)
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    print(format_table(results, baseline))
+    if args.save:
+        save_baseline(args.save, results)
+    if baseline is not None and (
+        regressions := compare(results, baseline, args.threshold)
+    ):
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+def _startup(args: argparse.Namespace) -> int:
+    import subprocess
+
+    from .startup import BudgetExceeded, check, format_profile, profile
+
+    # "--" separates the options of this command from the profiled arguments
+    arguments = args.arguments[1:] if args.arguments[:1] == ["--"] else args.arguments
+    try:
+        result = profile(arguments) if arguments else profile()
+    except subprocess.CalledProcessError as exception:
+        print(f"{exception}\n{exception.stderr}")
+        return 1
+    print(format_profile(result, args.top))
+    if args.budget_ms is not None:
+        try:
+            check(result, args.budget_ms)
+        except BudgetExceeded as exception:
+            print(f"\n{exception}")
+            return 1
+    return 0
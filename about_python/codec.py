@@ -0,0 +1,182 @@
+import dataclasses
+import struct
+from collections.abc import Buffer, Callable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from itertools import starmap
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    Optional,
+    TypeVar,
+    get_args,
+    get_origin,
+    get_type_hints,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Format:
+    """The struct format of a field, e.g. Annotated[int, Format("H")]."""
+
+    code: str
+
+
+# Formats of the plain annotations
+FORMATS: dict[Any, str] = {int: "q", float: "d", bool: "?"}
+
+
+class Codec(Generic[T]):
+    """A fixed binary layout derived from the annotations of a NamedTuple or of
+    a dataclass, read and written in place in any buffer (bytes, bytearray,
+    mmap, memoryview, ...).
+
+    str fields need an explicit size, e.g. Annotated[str, Format("16s")]: they
+    are encoded in UTF-8 and padded with NUL bytes, and pack raises ValueError
+    when the encoding does not fit."""
+
+    def __init__(self, cls: type[T], byteorder: str = "<") -> None:
+        names = _fields(cls)
+        hints = get_type_hints(cls, include_extras=True)
+        codes = [_format(name, hints[name]) for name in names]
+        self.cls = cls
+        self.fields: tuple[str, ...] = names
+        self.struct = struct.Struct(byteorder + "".join(codes))
+        self.size = self.struct.size
+        strings = [i for i, name in enumerate(names) if _base(hints[name]) is str]
+        self._strings = strings
+        # The bytes each str field holds: struct would truncate longer values
+        # silently, possibly inside a UTF-8 sequence
+        self._sizes = [_size(codes[i]) for i in strings]
+        self._tuple = issubclass(cls, tuple)
+        self._make = _maker(cls)
+        super().__init__()
+
+    def pack(self, record: T) -> bytes:
+        return self.struct.pack(*self._values(record))
+
+    def pack_into(self, buffer: Buffer, offset: int, record: T) -> None:
+        self.struct.pack_into(buffer, offset, *self._values(record))
+
+    def unpack(self, buffer: Buffer) -> T:
+        return self.unpack_from(buffer, 0)
+
+    def unpack_from(self, buffer: Buffer, offset: int = 0) -> T:
+        return self._make(self._decode(self.struct.unpack_from(buffer, offset)))
+
+    def iter_unpack(self, buffer: Buffer) -> Iterator[T]:
+        # The buffer length must be a multiple of the record size
+        values = self.struct.iter_unpack(buffer)
+        if self._strings:
+            values = map(self._decode, values)
+        if self._tuple:
+            return map(self._make, values)
+        return starmap(self.cls, values)
+
+    def view(self, buffer: Buffer) -> "RecordView[T]":
+        return RecordView(self, buffer)
+
+    def _values(self, record: T) -> list[Any]:
+        values = [getattr(record, name) for name in self.fields]
+        for index, size in zip(self._strings, self._sizes):
+            encoded = values[index] = values[index].encode()
+            if len(encoded) > size:
+                name = self.fields[index]
+                raise ValueError(f"field {name!r}: {len(encoded)} bytes, max {size}")
+        return values
+
+    def _decode(self, values: tuple[Any, ...]) -> tuple[Any, ...]:
+        if not self._strings:
+            return values
+        decoded = list(values)
+        for index in self._strings:
+            decoded[index] = decoded[index].rstrip(b"\0").decode()
+        return tuple(decoded)
+
+
+class RecordView(Sequence[T]):
+    """A lazy sequence of the records of a buffer: records are decoded when
+    accessed, slices share the buffer."""
+
+    def __init__(self, codec: Codec[T], buffer: Buffer) -> None:
+        self.codec = codec
+        view = memoryview(buffer).cast("B")
+        self._buffer = view[: len(view) - len(view) % codec.size]
+        super().__init__()
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self.codec.size
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordView[T]": ...
+
+    def __getitem__(self, index: int | slice) -> "T | RecordView[T]":
+        size = self.codec.size
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("RecordView slices must be contiguous")
+            return RecordView(self.codec, self._buffer[start * size : stop * size])
+        return self.codec.unpack_from(self._buffer, self._offset(index))
+
+    def __setitem__(self, index: int, record: T) -> None:
+        self.codec.pack_into(self._buffer, self._offset(index), record)
+
+    def __iter__(self) -> Iterator[T]:
+        return self.codec.iter_unpack(self._buffer)
+
+    def release(self) -> None:
+        # Required before closing an mmap the view was created from
+        self._buffer.release()
+
+    def _offset(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("RecordView index out of range")
+        return index * self.codec.size
+
+
+def _fields(cls: type) -> tuple[str, ...]:
+    # NamedTuple classes are tuples with _fields
+    fields: Optional[tuple[str, ...]] = getattr(cls, "_fields", None)
+    if fields is not None and tuple in cls.__mro__:
+        return fields
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls} is neither a NamedTuple nor a dataclass")
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+def _format(name: str, hint: Any) -> str:
+    if get_origin(hint) is Annotated:
+        for metadata in get_args(hint)[1:]:
+            if isinstance(metadata, Format):
+                return metadata.code
+    if hint in FORMATS:
+        return FORMATS[hint]
+    raise TypeError(f"field {name!r}: no struct format for {hint!r}")
+
+
+def _size(code: str) -> int:
+    # Pascal strings store their length in their first byte
+    size = struct.calcsize(code)
+    return min(size - 1, 255) if code.endswith("p") else size
+
+
+def _base(hint: Any) -> Any:
+    return get_args(hint)[0] if get_origin(hint) is Annotated else hint
+
+
+def _maker(cls: type[T]) -> Callable[[tuple[Any, ...]], T]:
+    if issubclass(cls, tuple):
+        # NamedTuple._make without the length check
+        return partial(tuple.__new__, cls)  # type: ignore
+    return lambda values: cls(*values)
@@ -0,0 +1,158 @@
+import dataclasses
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Generic, MutableSequence, TypeVar, get_type_hints
+
+T = TypeVar("T")
+
+# array.array typecodes of the annotations stored unboxed
+TYPECODES: dict[Any, str] = {int: "q", float: "d", bool: "b"}
+
+
+class _Strings:
+    # Strings are interned into a side table: the column stores their indices
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self.indices: dict[str, int] = {}
+        super().__init__()
+
+    def intern(self, value: str) -> int:
+        if (index := self.indices.get(value)) is None:
+            index = self.indices[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+class Columnar(Generic[T]):
+    """Rows of a dataclass stored column by column.
+
+    int, float and bool fields are stored in array.array, str fields as indices
+    into a table of interned strings and any other field in a list.
+
+    Indexing returns a view: an instance of a subclass of the dataclass that
+    reads and writes the columns instead of owning the values."""
+
+    def __init__(self, cls: type[T], rows: Iterable[T] = ()) -> None:
+        if not dataclasses.is_dataclass(cls):
+            raise TypeError(f"{cls.__name__} is not a dataclass")
+        hints = get_type_hints(cls)
+        self.cls = cls
+        self.fields: tuple[str, ...] = tuple(f.name for f in dataclasses.fields(cls))
+        self._strings = _Strings()
+        self._columns: dict[str, MutableSequence[Any]] = {}
+        # Stored values that are not the field values themselves
+        self._interned: set[str] = set()
+        self._decoders: dict[str, Callable[[Any], Any]] = {}
+        for name in self.fields:
+            hint = hints[name]
+            if hint is str:
+                self._columns[name] = array("L")
+                self._interned.add(name)
+                self._decoders[name] = self._strings.values.__getitem__
+            elif hint in TYPECODES:
+                self._columns[name] = array(TYPECODES[hint])
+                if hint is bool:
+                    self._decoders[name] = bool
+            else:
+                self._columns[name] = []
+        self._view = _view_class(self)
+        super().__init__()
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return len(self._columns[self.fields[0]]) if self.fields else 0
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Columnar index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._view, range(len(self)))
+
+    def append(self, row: T) -> None:
+        values = [self._encode(name, getattr(row, name)) for name in self.fields]
+        columns = [self._columns[name] for name in self.fields]
+        # The arrays check the values as they append them: on error, take the
+        # value back from the columns already extended
+        for appended, (column, value) in enumerate(zip(columns, values)):
+            try:
+                column.append(value)
+            except BaseException:
+                for extended in columns[:appended]:
+                    extended.pop()
+                raise
+
+    def extend(self, rows: Iterable[T]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def column(self, name: str) -> list[Any]:
+        values = self._columns[name]
+        if (decode := self._decoders.get(name)) is not None:
+            return list(map(decode, values))
+        return list(values)
+
+    def asdict(self) -> dict[str, list[Any]]:
+        return {name: self.column(name) for name in self.fields}
+
+    def astuple(self) -> list[tuple[Any, ...]]:
+        return list(zip(*(self.column(name) for name in self.fields)))
+
+    @property
+    def nbytes(self) -> int:
+        # Memory of the columns and of the string table, not of the boxed objects
+        # referenced by list columns
+        size = sum(sys.getsizeof(column) for column in self._columns.values())
+        size += sys.getsizeof(self._strings.values)
+        size += sys.getsizeof(self._strings.indices)
+        return size + sum(sys.getsizeof(value) for value in self._strings.values)
+
+    def _encode(self, name: str, value: Any) -> Any:
+        return self._strings.intern(value) if name in self._interned else value
+
+    def _get(self, name: str, index: int) -> Any:
+        value = self._columns[name][index]
+        decode = self._decoders.get(name)
+        return value if decode is None else decode(value)
+
+    def _set(self, name: str, index: int, value: Any) -> None:
+        self._columns[name][index] = self._encode(name, value)
+
+
+def _view_class(store: Columnar[T]) -> Any:
+    def field(name: str) -> property:
+        def get(view: Any) -> Any:
+            return store._get(name, view._index)  # type: ignore
+
+        def set(view: Any, value: Any) -> None:
+            store._set(name, view._index, value)  # type: ignore
+
+        return property(get, set)
+
+    def __init__(view: Any, index: int) -> None:
+        set_index(view, index)
+
+    def __eq__(view: Any, other: Any) -> Any:
+        # The __eq__ of a dataclass requires the exact class: a view equals the
+        # rows of the store, and the other views, with the same fields
+        if not isinstance(other, store.cls):
+            return NotImplemented
+        return all(getattr(view, name) == getattr(other, name) for name in store.fields)
+
+    namespace: dict[str, Any] = {
+        "__slots__": ("_index",),
+        "__init__": __init__,
+        "__eq__": __eq__,
+        "__hash__": store.cls.__hash__,
+    }
+    namespace |= {name: field(name) for name in store.fields}
+    view_class = type(f"{store.cls.__name__}View", (store.cls,), namespace)
+
+    # Write the slot directly: frozen dataclasses forbid __setattr__
+    set_index = view_class.__dict__["_index"].__set__
+    return view_class
@@ -0,0 +1,226 @@
+import inspect
+import types
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any, Generic, Optional, Self, TypeVar, overload
+
+from .dispatch import Check, checker
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+# The value of an attribute not set yet, in the __dict__ of an instance
+_MISSING: Any = object()
+
+
+class cached_field(Generic[T, V]):
+    """functools.cached_property, for classes with __slots__ too.
+
+    cached_property stores the value in the __dict__ of the instance. A class
+    with __slots__ declares a slot named "_" + name instead, and the value is
+    stored there: the first access computes it, reset forgets it."""
+
+    def __init__(self, function: Callable[[T], V]) -> None:
+        self.function = function
+        self.__doc__ = function.__doc__
+        self.name = function.__name__
+        self.slot: Optional[types.MemberDescriptorType] = None
+        # The computed fields to reset with this one, and their classes
+        self.dependents: list[tuple[type, "cached_field[Any, Any]"]] = []
+        super().__init__()
+
+    def __set_name__(self, owner: type[T], name: str) -> None:
+        self.name = name
+        self.slot = _slot(owner, "_" + name)
+        if self.slot is None and not owner.__dictoffset__:
+            raise TypeError(f"{owner.__qualname__} has no slot _{name} for {name}")
+        # Reads the slot, raising AttributeError until it is set
+        self._get = self.slot.__get__ if self.slot is not None else _unset
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type[T]] = None) -> Self: ...
+
+    @overload
+    def __get__(self, obj: T, objtype: Optional[type[T]] = None) -> V: ...
+
+    def __get__(self, obj: Optional[T], objtype: Optional[type[T]] = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self._get(obj)
+        except AttributeError:
+            value = self.function(obj)
+            if self.slot is None:
+                # The next lookups find the value in __dict__, before this one
+                obj.__dict__[self.name] = value
+            else:
+                self.slot.__set__(obj, value)
+            return value
+
+    def reset(self, obj: T) -> None:
+        if self.slot is None:
+            obj.__dict__.pop(self.name, None)
+        else:
+            with suppress(AttributeError):
+                self.slot.__delete__(obj)
+        for owner, dependent in self.dependents:
+            if isinstance(obj, owner):
+                dependent.reset(obj)
+
+
+class Computed(cached_field[T, V]):
+    """A cached_field reset when one of its inputs is set.
+
+    The inputs are the attributes the function reads: setting one of them, or
+    resetting a cached_field among them, resets the computed value, that is
+    not computed again until it is read. A read costs what a cached_field read
+    does, the inputs are not compared."""
+
+    def __init__(self, function: Callable[[T], V], inputs: tuple[str, ...]) -> None:
+        self.inputs = inputs
+        super().__init__(function)
+
+    def __set_name__(self, owner: type[T], name: str) -> None:
+        super().__set_name__(owner, name)
+        for input in self.inputs:
+            attribute = _lookup(owner, input)
+            if isinstance(attribute, cached_field):
+                attribute.dependents.append((owner, self))
+            elif isinstance(attribute, _Invalidating) and input in owner.__dict__:
+                attribute.dependents.append(self)
+            else:
+                # Sets go through the attribute wrapped, then reset this one
+                setattr(owner, input, _Invalidating(input, attribute, self))
+
+
+def computed(*inputs: str) -> Callable[[Callable[[T], V]], Computed[T, V]]:
+    def decorator(function: Callable[[T], V]) -> Computed[T, V]:
+        return Computed(function, inputs)
+
+    return decorator
+
+
+class _Invalidating:
+    # An attribute that resets the computed fields that read it when it is set
+    def __init__(self, name: str, attribute: Any, dependent: cached_field[Any, Any]):
+        self.name = name
+        # A data descriptor, e.g. a slot, or the default value in the class
+        data = inspect.isdatadescriptor(attribute)
+        self.descriptor: Any = attribute if data else None
+        self.default = _MISSING if data else attribute
+        self.dependents = [dependent]
+        super().__init__()
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        if self.descriptor is not None:
+            return self.descriptor.__get__(obj, objtype)
+        value = obj.__dict__.get(self.name, self.default)
+        if value is _MISSING:
+            raise AttributeError(self.name)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if self.descriptor is not None:
+            self.descriptor.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+        for dependent in self.dependents:
+            dependent.reset(obj)
+
+    def __delete__(self, obj: Any) -> None:
+        if self.descriptor is not None:
+            self.descriptor.__delete__(obj)
+        elif obj.__dict__.pop(self.name, _MISSING) is _MISSING:
+            raise AttributeError(self.name)
+        for dependent in self.dependents:
+            dependent.reset(obj)
+
+
+class Typed(Generic[T, V]):
+    """An attribute whose values are checked against its annotation.
+
+    The check is compiled once, at the first assignment: an isinstance for
+    classes and unions, plus the elements for list[int], dict[str, int], ...
+    The validator, if any, checks the values of the right type."""
+
+    def __init__(self, validator: Optional[Callable[[V], bool]] = None) -> None:
+        self.validator = validator
+        super().__init__()
+
+    def __set_name__(self, owner: type[T], name: str) -> None:
+        annotations = inspect.get_annotations(owner)
+        if name not in annotations:
+            raise TypeError(f"{owner.__qualname__}.{name} has no annotation")
+        self.owner = owner
+        self.annotation: Any = annotations[name]
+        self.check: Check = self._resolve
+        self.name = name
+        self.qualname = f"{owner.__qualname__}.{name}"
+        self.slot = _slot(owner, "_" + name)
+        if self.slot is None and not owner.__dictoffset__:
+            raise TypeError(f"{owner.__qualname__} has no slot _{name} for {name}")
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type[T]] = None) -> Self: ...
+
+    @overload
+    def __get__(self, obj: T, objtype: Optional[type[T]] = None) -> V: ...
+
+    def __get__(self, obj: Optional[T], objtype: Optional[type[T]] = None) -> Any:
+        if obj is None:
+            return self
+        if self.slot is not None:
+            return self.slot.__get__(obj, objtype)
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj: T, value: V) -> None:
+        if not self.check(value):
+            raise TypeError(
+                f"{self.qualname} must be {_name(self.annotation)},"
+                f" not {type(value).__name__}"
+            )
+        if self.validator is not None and not self.validator(value):
+            raise ValueError(f"invalid {self.qualname}: {value!r}")
+        if self.slot is not None:
+            self.slot.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+    def _resolve(self, value: Any) -> bool:
+        # The annotation can name a class that did not exist yet when the owner
+        # was created, such as the owner itself: evaluated at the first check
+        annotations = inspect.get_annotations(self.owner, eval_str=True)
+        self.annotation = annotations[self.name]
+        self.check = checker(self.annotation)
+        return self.check(value)
+
+
+def typed(validator: Optional[Callable[[Any], bool]] = None) -> Any:
+    # x: int = typed(): the class declares the type, the descriptor checks it
+    return Typed[Any, Any](validator)
+
+
+def _unset(obj: Any) -> Any:
+    # Without a slot, the descriptor is only called when __dict__ has no value
+    raise AttributeError
+
+
+def _lookup(owner: type, name: str) -> Any:
+    for base in owner.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return _MISSING
+
+
+def _slot(owner: type, name: str) -> Optional[types.MemberDescriptorType]:
+    attribute = _lookup(owner, name)
+    return attribute if isinstance(attribute, types.MemberDescriptorType) else None
+
+
+def _name(annotation: Any) -> str:
+    return annotation.__name__ if isinstance(annotation, type) else str(annotation)
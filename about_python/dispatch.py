@@ -0,0 +1,281 @@
+import ast
+import inspect
+import textwrap
+import types
+from collections.abc import Callable, Collection, Mapping
+from functools import cached_property, update_wrapper
+from typing import (
+    Any,
+    Generic,
+    Optional,
+    ParamSpec,
+    Self,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_overloads,
+    get_type_hints,
+    overload,
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Checks the parts of an argument its type does not tell, e.g. list elements
+type Check = Callable[[Any], bool]
+
+# Checks all the arguments of a call
+type ArgumentsCheck = Callable[[tuple[Any, ...]], bool]
+
+# An overload that accepts the types of the arguments of a call, and its checks
+type _Candidate[T] = tuple[Callable[..., T], ArgumentsCheck]
+
+
+class _Overload:
+    def __init__(self, stub: Callable[..., Any], function: Callable[..., Any]) -> None:
+        self.stub = stub
+        self.function = function
+        self.signature = inspect.signature(stub)
+        parameters = [
+            parameter
+            for parameter in self.signature.parameters.values()
+            if parameter.kind
+            in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        self.required = sum(p.default is p.empty for p in parameters)
+        self.positional = [p.name for p in parameters]
+        super().__init__()
+
+    @cached_property
+    def hints(self) -> dict[str, Any]:
+        # Resolved at the first call: the annotations of a method can name its
+        # class, which does not exist yet when the overloads are decorated
+        return get_type_hints(self.stub)
+
+    @cached_property
+    def annotations(self) -> list[Any]:
+        return [self.hints.get(name, Any) for name in self.positional]
+
+    def candidate(self, classes: tuple[type, ...]) -> bool:
+        if not self.required <= len(classes) <= len(self.annotations):
+            return False
+        return all(_accepts(a, c) for a, c in zip(self.annotations, classes))
+
+    def arguments_check(self, arity: int) -> Optional[ArgumentsCheck]:
+        checks = [
+            (index, check)
+            for index, annotation in enumerate(self.annotations[:arity])
+            if (check := _check(annotation)) is not None
+        ]
+        if not checks:
+            return None
+        return lambda args: all(check(args[index]) for index, check in checks)
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+        try:
+            bound = self.signature.bind(*args, **kwargs)
+        except TypeError:
+            return False
+        for name, value in bound.arguments.items():
+            annotation = self.hints.get(name, Any)
+            if not _accepts(annotation, value.__class__):
+                return False
+            if (check := _check(annotation)) is not None and not check(value):
+                return False
+        return True
+
+
+class Dispatcher(Generic[P, R]):
+    """Calls the first @overload of the function whose annotations accept the
+    arguments, or the function itself when none does.
+
+    Overloads with a body are called directly, overloads that are stubs (...)
+    call the function. The overloads that accept the types of the positional
+    arguments are computed once per tuple of types; parameterized annotations
+    (list[int], dict[str, int], ...) check the elements at each call.
+
+    A call costs two Python calls and a dictionary lookup: faster than
+    functools.singledispatch, but about 2.5 times slower than a hand-written
+    chain of isinstance, which remains the choice for hot paths."""
+
+    def __init__(self, function: Callable[P, R]) -> None:
+        stubs = get_overloads(function)
+        if not stubs:
+            raise TypeError(f"{function.__qualname__} has no @overload")
+        self.__wrapped__: Callable[..., R] = function
+        self.overloads = [
+            _Overload(stub, function if _is_stub(stub) else stub) for stub in stubs
+        ]
+        # The function to call for each key: an overload, the function itself,
+        # or a closure that checks the candidates in order
+        self._routes: dict[Any, Callable[..., R]] = {}
+        update_wrapper(self, function)
+        super().__init__()
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        if kwargs:
+            for overload in self.overloads:
+                if overload.bind(args, kwargs):
+                    return overload.function(*args, **kwargs)
+            return self.__wrapped__(*args, **kwargs)
+
+        # Most calls have one argument: its type is the key, without a tuple
+        key = type(args[0]) if len(args) == 1 else tuple(map(type, args))
+        if (route := self._routes.get(key)) is None:
+            route = self._routes[key] = self._route(tuple(map(type, args)))
+        return route(*args)
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type] = None) -> Self: ...
+
+    @overload
+    def __get__(
+        self, obj: object, objtype: Optional[type] = None
+    ) -> Callable[..., R]: ...
+
+    def __get__(self, obj: Optional[object], objtype: Optional[type] = None) -> Any:
+        # Dispatches methods too: the instance is the first argument
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+    def cache_clear(self) -> None:
+        self._routes.clear()
+
+    def _route(self, classes: tuple[type, ...]) -> Callable[..., R]:
+        candidates: list[_Candidate[R]] = []
+        for overload in self.overloads:
+            if not overload.candidate(classes):
+                continue
+            check = overload.arguments_check(len(classes))
+            if check is None:
+                if not candidates:
+                    return overload.function
+                # Nothing after a candidate without checks can be called
+                candidates.append((overload.function, lambda args: True))
+                break
+            candidates.append((overload.function, check))
+        fallback = self.__wrapped__
+        if not candidates:
+            return fallback
+
+        def route(*args: Any) -> R:
+            for function, check in candidates:
+                if check(args):
+                    return function(*args)
+            return fallback(*args)
+
+        return route
+
+
+def dispatch(function: Callable[P, R]) -> Dispatcher[P, R]:
+    return Dispatcher(function)
+
+
+def checker(annotation: Any) -> Check:
+    """The check of the values that match the annotation, computed once: an
+    isinstance for classes and unions of classes, the elements of the
+    parameterized collections too."""
+    if annotation is Any or annotation is object:
+        return lambda value: True
+    if annotation is None:
+        annotation = type(None)
+    if isinstance(annotation, type) and not get_args(annotation):
+        return lambda value: isinstance(value, annotation)
+    origin = get_origin(annotation)
+    members = get_args(annotation)
+    if (origin is Union or origin is types.UnionType) and all(
+        isinstance(member, type) and not get_args(member) for member in members
+    ):
+        return lambda value: isinstance(value, members)
+    check = _check(annotation)
+    if check is None:
+        return lambda value: _accepts(annotation, value.__class__)
+    return lambda value: _accepts(annotation, value.__class__) and check(value)
+
+
+def _is_stub(function: Callable[..., Any]) -> bool:
+    # Whether the body is ..., after the docstring if any: a body that returns
+    # None compiles to the same bytecode, which is only compared without the
+    # source (.pyc only, zipapps, exec, ...)
+    try:
+        node = ast.parse(textwrap.dedent(inspect.getsource(function))).body[0]
+    except (OSError, TypeError, SyntaxError):
+        code = getattr(function, "__code__", None)
+        return code is not None and code.co_code == _stub.__code__.co_code
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+    body = node.body
+    if ast.get_docstring(node) is not None:
+        body = body[1:]
+    return (
+        len(body) == 1
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+        and body[0].value.value is Ellipsis
+    )
+
+
+def _stub() -> None: ...
+
+
+def _accepts(annotation: Any, cls: type) -> bool:
+    # Whether instances of cls can match the annotation: elements are not checked
+    if annotation is Any or annotation is object:
+        return True
+    if isinstance(annotation, TypeVar):
+        bound = annotation.__bound__
+        return bound is None or _accepts(bound, cls)
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return any(_accepts(member, cls) for member in get_args(annotation))
+    if annotation is None or annotation is type(None):
+        return cls is type(None)
+    if origin is not None:
+        annotation = origin
+    if isinstance(annotation, type):
+        return issubclass(cls, annotation)
+    # Annotations that cannot be checked at runtime accept everything
+    return True
+
+
+def _check(annotation: Any) -> Optional[Check]:
+    # The check of what _accepts cannot tell, None when there is nothing left
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union or origin is types.UnionType:
+        checks = [(member, _check(member)) for member in args]
+        if all(check is None for _, check in checks):
+            return None
+        return lambda value: any(
+            _accepts(member, value.__class__) and (check is None or check(value))
+            for member, check in checks
+        )
+    if origin is None or not args or not isinstance(origin, type):
+        return None
+
+    def element(annotation: Any) -> Check:
+        check = _check(annotation)
+        if check is None and isinstance(annotation, type):
+            return lambda value: isinstance(value, annotation)
+        return lambda value: _accepts(annotation, value.__class__) and (
+            check is None or check(value)
+        )
+
+    if issubclass(origin, tuple):
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = element(args[0])
+            return lambda value: all(map(item, value))
+        items = [element(arg) for arg in args]
+        return lambda value: len(value) == len(items) and all(
+            item(v) for item, v in zip(items, value)
+        )
+    if issubclass(origin, Mapping):
+        key, item = element(args[0]), element(args[-1])
+        return lambda value: all(key(k) and item(v) for k, v in value.items())
+    # Only collections: checking an iterator would consume it
+    if len(args) == 1 and issubclass(origin, Collection):
+        item = element(args[0])
+        return lambda value: all(map(item, value))
+    return None
@@ -0,0 +1,40 @@
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def attach(
+    package: str,
+    attributes: Mapping[str, Iterable[str]] = {},
+    submodules: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """The __getattr__, __dir__ and __all__ of a package whose public names are
+    imported on first access.
+
+    attributes maps modules, relative to the package, to the names exported
+    from them; submodules are exported themselves. Usage, in __init__.py:
+
+        __getattr__, __dir__, __all__ = attach(
+            __name__, {".my_module.my_file": ["my_function"]}
+        )
+    """
+    origins = {name: module for module, names in attributes.items() for name in names}
+    modules = set(submodules)
+    __all__ = sorted(origins.keys() | modules)
+
+    def __getattr__(name: str) -> Any:
+        if name in origins:
+            value = getattr(importlib.import_module(origins[name], package), name)
+        elif name in modules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Later accesses find the name in the namespace and skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(vars(sys.modules[package]).keys() | set(__all__))
+
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,434 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, Protocol, TypeVar
+
+from .stats import Histogram
+
+V = TypeVar("V")
+V_co = TypeVar("V_co", covariant=True)
+
+
+@dataclass(slots=True)
+class LockStats:
+    acquisitions: int = 0
+    # Acquisitions that had to wait, and the nanoseconds each one waited
+    contended: int = 0
+    wait: Histogram = field(default_factory=Histogram)
+
+    @property
+    def contention(self) -> float:
+        return self.contended / self.acquisitions if self.acquisitions else 0.0
+
+    def record(self, wait_ns: Optional[int]) -> None:
+        # None for an acquisition that did not wait
+        self.acquisitions += 1
+        if wait_ns is not None:
+            self.contended += 1
+            self.wait.record(wait_ns)
+
+
+def merge(stats: list[LockStats]) -> LockStats:
+    total = LockStats()
+    for s in stats:
+        total.acquisitions += s.acquisitions
+        total.contended += s.contended
+        total.wait.merge(s.wait)
+    return total
+
+
+class Lockable(Protocol[V_co]):
+    def lock(self) -> V_co: ...
+
+    def unlock(self) -> None: ...
+
+
+class AsyncLockable(Protocol[V_co]):
+    async def lock(self) -> V_co: ...
+
+    def unlock(self) -> None: ...
+
+
+class LockGuard(Generic[V]):
+    def __init__(self, lock: Lockable[V]) -> None:
+        self._lock = lock
+        super().__init__()
+
+    def __enter__(self) -> V:
+        return self._lock.lock()
+
+    def __exit__(
+        self,
+        exception_type: Optional[Any],
+        exception_value: Optional[Any],
+        traceback: Optional[Any],
+    ) -> None:
+        self._lock.unlock()
+
+
+class AsyncLockGuard(Generic[V]):
+    def __init__(self, lock: AsyncLockable[V]) -> None:
+        self._lock = lock
+        super().__init__()
+
+    async def __aenter__(self) -> V:
+        return await self._lock.lock()
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Any],
+        exception_value: Optional[Any],
+        traceback: Optional[Any],
+    ) -> None:
+        self._lock.unlock()
+
+
+# ______________________________________________________________________________
+# Threads
+
+
+class Lock(Generic[V]):
+    # A mutex guarding a value, that counts the acquisitions that waited
+    def __init__(self, value: V) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+        self.stats = LockStats()
+        super().__init__()
+
+    def lock(self) -> V:
+        if self._lock.acquire(blocking=False):
+            self.stats.record(None)
+        else:
+            start = time.perf_counter_ns()
+            self._lock.acquire()
+            self.stats.record(time.perf_counter_ns() - start)
+        return self._value
+
+    def unlock(self) -> None:
+        self._lock.release()
+
+
+class RWLock(Generic[V]):
+    """Many readers or one writer.
+
+    Writers have priority: a reader waits while a writer waits, so that a
+    stream of readers cannot starve the writers."""
+
+    def __init__(self, value: V) -> None:
+        self._value = value
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self.reader = _Side(self, read=True)
+        self.writer = _Side(self, read=False)
+        super().__init__()
+
+    def read(self) -> LockGuard[V]:
+        return LockGuard(self.reader)
+
+    def write(self) -> LockGuard[V]:
+        return LockGuard(self.writer)
+
+    # The reader and writer lock through these, and record the waits in stats
+    def lock_read(self, stats: LockStats) -> V:
+        with self._condition:
+            wait_ns = None
+            if self._writer or self._waiting_writers:
+                start = time.perf_counter_ns()
+                while self._writer or self._waiting_writers:
+                    self._condition.wait()
+                wait_ns = time.perf_counter_ns() - start
+            self._readers += 1
+            stats.record(wait_ns)
+        return self._value
+
+    def unlock_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def lock_write(self, stats: LockStats) -> V:
+        with self._condition:
+            wait_ns = None
+            if self._writer or self._readers:
+                start = time.perf_counter_ns()
+                self._waiting_writers += 1
+                try:
+                    while self._writer or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                wait_ns = time.perf_counter_ns() - start
+            self._writer = True
+            stats.record(wait_ns)
+        return self._value
+
+    def unlock_write(self) -> None:
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+
+class _Side(Generic[V]):
+    # The read or the write side of a RWLock, with its own stats
+    def __init__(self, lock: RWLock[V], read: bool) -> None:
+        self._rwlock = lock
+        self._read = read
+        self.stats = LockStats()
+        super().__init__()
+
+    def lock(self) -> V:
+        if self._read:
+            return self._rwlock.lock_read(self.stats)
+        return self._rwlock.lock_write(self.stats)
+
+    def unlock(self) -> None:
+        if self._read:
+            self._rwlock.unlock_read()
+        else:
+            self._rwlock.unlock_write()
+
+
+class StripedLock:
+    """A lock per hash of the keys, out of a fixed number of stripes: keys
+    that share a stripe exclude each other, the others run in parallel.
+
+    The stats of each stripe show the hot ones."""
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._locks = [Lock(index) for index in range(stripes)]
+        super().__init__()
+
+    def lock(self, key: Hashable) -> LockGuard[int]:
+        # The guard returns the index of the stripe
+        return LockGuard(self._locks[hash(key) % len(self._locks)])
+
+    @property
+    def stats(self) -> list[LockStats]:
+        return [lock.stats for lock in self._locks]
+
+
+class FairSemaphore:
+    """A semaphore that hands the permits out in the order they were asked
+    for: threading.Semaphore wakes any waiter."""
+
+    def __init__(self, value: int = 1) -> None:
+        self._value = value
+        self._mutex = threading.Lock()
+        # A locked lock per waiter, released to hand it a permit
+        self._waiters: deque[threading.Lock] = deque()
+        self.stats = LockStats()
+        super().__init__()
+
+    def lock(self) -> None:
+        with self._mutex:
+            if self._value and not self._waiters:
+                self._value -= 1
+                self.stats.record(None)
+                return
+            waiter = threading.Lock()
+            waiter.acquire()
+            self._waiters.append(waiter)
+        start = time.perf_counter_ns()
+        waiter.acquire()
+        wait_ns = time.perf_counter_ns() - start
+        with self._mutex:
+            self.stats.record(wait_ns)
+
+    def unlock(self) -> None:
+        with self._mutex:
+            if self._waiters:
+                # The permit goes to the first waiter, not back to the pool
+                self._waiters.popleft().release()
+            else:
+                self._value += 1
+
+    def __enter__(self) -> None:
+        self.lock()
+
+    def __exit__(self, *exception: Any) -> None:
+        self.unlock()
+
+
+# ______________________________________________________________________________
+# asyncio
+
+
+class AsyncLock(Generic[V]):
+    def __init__(self, value: V) -> None:
+        self._value = value
+        self._lock = asyncio.Lock()
+        self.stats = LockStats()
+        super().__init__()
+
+    async def lock(self) -> V:
+        if not self._lock.locked():
+            await self._lock.acquire()
+            self.stats.record(None)
+        else:
+            start = time.perf_counter_ns()
+            await self._lock.acquire()
+            self.stats.record(time.perf_counter_ns() - start)
+        return self._value
+
+    def unlock(self) -> None:
+        self._lock.release()
+
+
+class AsyncRWLock(Generic[V]):
+    """RWLock for tasks, with priority to the writers too.
+
+    Unlocking hands the lock to the waiters: the first writer, or all the
+    readers when no writer waits."""
+
+    def __init__(self, value: V) -> None:
+        self._value = value
+        self._readers = 0
+        self._writer = False
+        self._waiting_readers: deque[asyncio.Future[None]] = deque()
+        self._waiting_writers: deque[asyncio.Future[None]] = deque()
+        self.reader = _AsyncSide(self, read=True)
+        self.writer = _AsyncSide(self, read=False)
+        super().__init__()
+
+    def read(self) -> AsyncLockGuard[V]:
+        return AsyncLockGuard(self.reader)
+
+    def write(self) -> AsyncLockGuard[V]:
+        return AsyncLockGuard(self.writer)
+
+    # As RWLock: for the reader and writer
+    async def lock_read(self, stats: LockStats) -> V:
+        if self._writer or self._waiting_writers:
+            await self._wait(self._waiting_readers, stats, self.unlock_read)
+        else:
+            self._readers += 1
+            stats.record(None)
+        return self._value
+
+    def unlock_read(self) -> None:
+        self._readers -= 1
+        self._wake()
+
+    async def lock_write(self, stats: LockStats) -> V:
+        if self._writer or self._readers:
+            await self._wait(self._waiting_writers, stats, self.unlock_write)
+        else:
+            self._writer = True
+            stats.record(None)
+        return self._value
+
+    def unlock_write(self) -> None:
+        self._writer = False
+        self._wake()
+
+    async def _wait(
+        self,
+        waiters: deque[asyncio.Future[None]],
+        stats: LockStats,
+        unlock: Callable[[], None],
+    ) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        start = time.perf_counter_ns()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Handed the lock, but cancelled before running
+                unlock()
+            else:
+                waiters.remove(waiter)
+                self._wake()
+            raise
+        stats.record(time.perf_counter_ns() - start)
+
+    def _wake(self) -> None:
+        if self._writer:
+            return
+        if self._waiting_writers:
+            if not self._readers:
+                self._writer = True
+                self._waiting_writers.popleft().set_result(None)
+            return
+        while self._waiting_readers:
+            self._readers += 1
+            self._waiting_readers.popleft().set_result(None)
+
+
+class _AsyncSide(Generic[V]):
+    def __init__(self, lock: AsyncRWLock[V], read: bool) -> None:
+        self._rwlock = lock
+        self._read = read
+        self.stats = LockStats()
+        super().__init__()
+
+    async def lock(self) -> V:
+        if self._read:
+            return await self._rwlock.lock_read(self.stats)
+        return await self._rwlock.lock_write(self.stats)
+
+    def unlock(self) -> None:
+        if self._read:
+            self._rwlock.unlock_read()
+        else:
+            self._rwlock.unlock_write()
+
+
+class AsyncStripedLock:
+    def __init__(self, stripes: int = 64) -> None:
+        self._locks = [AsyncLock(index) for index in range(stripes)]
+        super().__init__()
+
+    def lock(self, key: Hashable) -> AsyncLockGuard[int]:
+        return AsyncLockGuard(self._locks[hash(key) % len(self._locks)])
+
+    @property
+    def stats(self) -> list[LockStats]:
+        return [lock.stats for lock in self._locks]
+
+
+class AsyncFairSemaphore:
+    # FairSemaphore for tasks: a cancelled waiter passes its permit on
+    def __init__(self, value: int = 1) -> None:
+        self._value = value
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.stats = LockStats()
+        super().__init__()
+
+    async def lock(self) -> None:
+        if self._value and not self._waiters:
+            self._value -= 1
+            self.stats.record(None)
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter_ns()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.unlock()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        self.stats.record(time.perf_counter_ns() - start)
+
+    def unlock(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._value += 1
+
+    async def __aenter__(self) -> None:
+        await self.lock()
+
+    async def __aexit__(self, *exception: Any) -> None:
+        self.unlock()
@@ -0,0 +1,167 @@
+import bisect
+import mmap
+import os
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Self, TypeVar, overload
+
+from .codec import Codec
+
+T = TypeVar("T")
+
+# Bytes copied at a time by iteration
+_CHUNK = 64 * 1024
+
+
+class MmapSequence(Sequence[T]):
+    """The fixed-width records of a file, mapped in memory and decoded on access.
+
+    Slices are views sharing the mapping. When the file is sorted by key,
+    __contains__ and index use a binary search instead of a linear scan."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        codec: Codec[T] | type[T],
+        *,
+        sorted: bool = False,
+        key: Optional[Callable[[T], Any]] = None,
+        writable: bool = False,
+    ) -> None:
+        self.codec = codec if isinstance(codec, Codec) else Codec(codec)
+        self.sorted = sorted
+        self.key = key
+        self._map: mmap.mmap | bytes = b""
+        with open(path, "r+b" if writable else "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size:
+                access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+                self._map = mmap.mmap(file.fileno(), 0, access=access)
+        self._start = 0
+        self._length = size // self.codec.size
+        super().__init__()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MmapSequence[T]": ...
+
+    def __getitem__(self, index: int | slice) -> "T | MmapSequence[T]":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError("MmapSequence slices must be contiguous")
+            return self._slice(start, max(stop - start, 0))
+        return self.codec.unpack_from(self._map, self._offset(index))
+
+    def __setitem__(self, index: int, record: T) -> None:
+        if not isinstance(self._map, mmap.mmap):
+            raise IndexError("MmapSequence index out of range")
+        self.codec.pack_into(self._map, self._offset(index), record)
+
+    def __iter__(self) -> Iterator[T]:
+        size = self.codec.size
+        begin = self._start * size
+        end = begin + self._length * size
+        # Decode copies of the chunks: a view exported from the mapping would
+        # prevent closing it until the iterator is exhausted
+        step = max(_CHUNK // size, 1) * size
+        for offset in range(begin, end, step):
+            yield from self.codec.iter_unpack(
+                self._map[offset : min(offset + step, end)]
+            )
+
+    def __contains__(self, value: object) -> bool:
+        if not self.sorted:
+            return super().__contains__(value)
+        return self._find(value, 0, self._length) >= 0  # type: ignore
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        if not self.sorted:
+            return super().index(value, start, self._length if stop is None else stop)
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if (index := self._find(value, start, stop)) < 0:
+            raise ValueError(f"{value!r} is not in MmapSequence")
+        return index
+
+    def prefetch(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """Ask the kernel to read ahead the pages of the records in [start, stop)."""
+        self._advise(getattr(mmap, "MADV_WILLNEED", None), start, stop)
+
+    def advise_sequential(self) -> None:
+        self._advise(getattr(mmap, "MADV_SEQUENTIAL", None), 0, None)
+
+    def advise_random(self) -> None:
+        self._advise(getattr(mmap, "MADV_RANDOM", None), 0, None)
+
+    def flush(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.flush()
+
+    def close(self) -> None:
+        # Slices share the mapping: closing one closes all of them
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def _slice(self, start: int, length: int) -> "MmapSequence[T]":
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view._start = self._start + start
+        view._length = length
+        return view
+
+    def _offset(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("MmapSequence index out of range")
+        return (self._start + index) * self.codec.size
+
+    def _find(self, value: T, start: int, stop: int) -> int:
+        # Records with the key of value follow the bisection point: compare
+        # them all, the first one need not be equal to value
+        key = self.key
+        target = value if key is None else key(value)
+        for index in range(max(self._bisect(value), start), stop):
+            record = self[index]
+            if record == value:
+                return index
+            if (record if key is None else key(record)) != target:
+                break
+        return -1
+
+    def _bisect(self, value: T) -> int:
+        if self.key is None:
+            return bisect.bisect_left(self, value)  # type: ignore
+        return bisect.bisect_left(self, self.key(value), key=self.key)
+
+    def _advise(self, option: Optional[int], start: int, stop: Optional[int]) -> None:
+        # madvise is not available on every platform: hints are best effort
+        if option is None or not isinstance(self._map, mmap.mmap):
+            return
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return
+        size = self.codec.size
+        begin = (self._start + start) * size
+        end = (self._start + stop) * size
+        # The start of the range must be aligned to a page
+        aligned = begin - begin % mmap.PAGESIZE
+        self._map.madvise(option, aligned, end - aligned)
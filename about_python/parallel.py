@@ -0,0 +1,159 @@
+import functools
+import itertools
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Adaptive chunks run for about this long: long enough to hide the cost of
+# sending a chunk to a process, short enough to balance the workers
+TARGET_NS = 10_000_000
+
+_MISSING: Any = object()
+
+
+def pmap(
+    function: Callable[..., R],
+    iterable: Iterable[Any],
+    /,
+    *iterables: Iterable[Any],
+    executor: Optional[Executor] = None,
+    threads: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    window: Optional[int] = None,
+) -> Generator[R]:
+    """map, with the calls run by a pool of processes, or of threads.
+
+    Results are in order. At most window chunks, two per worker by default,
+    are submitted and not consumed yet, so an infinite input is fine. Without
+    a chunksize, chunks grow or shrink until one takes about TARGET_NS.
+
+    The pool is created and shut down by pmap unless an executor is given:
+    close the generator to shut it down before the end of the input.
+    A process pool needs a picklable function: not a lambda."""
+    with _pool(executor, threads, max_workers) as (pool, workers):
+        items = zip(iterable, *iterables)
+        window = window or 2 * workers
+        for results in _run(_map_chunk, function, items, pool, chunksize, window):
+            yield from results
+
+
+def preduce(
+    function: Callable[[T, T], T],
+    iterable: Iterable[T],
+    initial: T = _MISSING,
+    /,
+    *,
+    executor: Optional[Executor] = None,
+    threads: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    window: Optional[int] = None,
+) -> T:
+    """functools.reduce, as a tree: the workers reduce chunks of the input,
+    then chunks of the partial results, until one is left.
+
+    The function must be associative, e.g. operator.add: the order of the
+    operands is kept, it does not have to be commutative."""
+    with _pool(executor, threads, max_workers) as (pool, workers):
+        window = window or 2 * workers
+        partials = list(
+            _run(_reduce_chunk, function, iter(iterable), pool, chunksize, window)
+        )
+        while len(partials) > 1:
+            group = max(2, -(-len(partials) // workers))
+            partials = list(
+                _run(_reduce_chunk, function, iter(partials), pool, group, window)
+            )
+
+    if not partials:
+        if initial is _MISSING:
+            raise TypeError("preduce() of empty iterable with no initial value")
+        return initial
+    return partials[0] if initial is _MISSING else function(initial, partials[0])
+
+
+class _Chunks:
+    def __init__(self, size: Optional[int]) -> None:
+        self.adaptive = size is None
+        self.size = size or 1
+        super().__init__()
+
+    def take(self, items: Iterator[T]) -> list[T]:
+        return list(itertools.islice(items, self.size))
+
+    def update(self, count: int, elapsed_ns: int) -> None:
+        # The last chunk of the input can be short, and says little
+        if not self.adaptive or count < self.size:
+            return
+        ideal = TARGET_NS * count // max(elapsed_ns, 1)
+        # Chunks at most double: a fast first call does not make a huge chunk
+        self.size = max(1, min(ideal, 2 * self.size))
+
+
+@contextmanager
+def _pool(
+    executor: Optional[Executor], threads: bool, max_workers: Optional[int]
+) -> Generator[tuple[Executor, int]]:
+    workers = max_workers or os.process_cpu_count() or 1
+    if executor is not None:
+        yield executor, workers
+        return
+    cls = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    pool = cls(workers)
+    try:
+        yield pool, workers
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _run(
+    task: Callable[[Callable[..., Any], list[Any]], tuple[R, int]],
+    function: Callable[..., Any],
+    items: Iterator[Any],
+    pool: Executor,
+    chunksize: Optional[int],
+    window: int,
+) -> Iterator[R]:
+    # The results of task over the chunks of items, in order
+    chunks = _Chunks(chunksize)
+    pending: deque[tuple[int, Future[tuple[R, int]]]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                if chunk := chunks.take(items):
+                    pending.append((len(chunk), pool.submit(task, function, chunk)))
+                else:
+                    exhausted = True
+            if not pending:
+                return
+            count, future = pending.popleft()
+            result, elapsed_ns = future.result()
+            chunks.update(count, elapsed_ns)
+            yield result
+    finally:
+        # The consumer stopped early, or a call raised
+        for _, future in pending:
+            future.cancel()
+
+
+def _map_chunk(
+    function: Callable[..., R], chunk: list[tuple[Any, ...]]
+) -> tuple[list[R], int]:
+    start = time.perf_counter_ns()
+    results = list(itertools.starmap(function, chunk))
+    return results, time.perf_counter_ns() - start
+
+
+def _reduce_chunk(function: Callable[[T, T], T], chunk: list[T]) -> tuple[T, int]:
+    start = time.perf_counter_ns()
+    result = functools.reduce(function, chunk)
+    return result, time.perf_counter_ns() - start
@@ -0,0 +1,130 @@
+import weakref
+from abc import ABCMeta
+from typing import Any, Optional, Protocol, TypeVar, runtime_checkable
+
+T = TypeVar("T", bound=type)
+
+# typeshed declares Protocol as a special form, not as a class
+_ProtocolMeta: type[ABCMeta] = type(Protocol)  # pyright: ignore[reportAssignmentType]
+
+# Protocols decorated with fast_runtime_checkable
+_protocols: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+# The members of a protocol missing from each type checked: the types are
+# weakly referenced, so that the classes created on the fly can be collected
+type _Cache = weakref.WeakKeyDictionary[type, frozenset[str]]
+
+# The types that have all the members of a protocol, by id: the entries are
+# removed when the types are collected, before their ids can be reused
+type _Positives = dict[int, weakref.ref[type]]
+
+
+class _FastProtocolMeta(_ProtocolMeta):
+    def __instancecheck__(cls, instance: object) -> bool:
+        cache: Optional[_Cache] = cls.__dict__.get("__instance_cache__")
+        if cache is None:
+            # A sub-protocol or a nominal subclass of a fast protocol
+            return super().__instancecheck__(instance)
+
+        instance_type = type(instance)
+        if (missing := cache.get(instance_type)) is None:
+            missing = cache[instance_type] = _missing(cls, instance_type)
+        if not missing:
+            positives: _Positives = cls.__dict__["__instance_positives__"]
+            key = id(instance_type)
+            positives[key] = weakref.ref(
+                instance_type, lambda _: positives.pop(key, None)
+            )
+            return True
+        if not instance_type.__dictoffset__:
+            return False
+        # The members missing from the type can still be instance attributes
+        try:
+            attributes = object.__getattribute__(instance, "__dict__")
+        except AttributeError:
+            return False
+        if attributes.keys().isdisjoint(missing):
+            return False
+        return super().__instancecheck__(instance)
+
+
+def fast_runtime_checkable(cls: T) -> T:
+    """runtime_checkable, with the structural verdict cached per concrete type.
+
+    The verdict of a type depends on the dictionaries of the classes in its
+    MRO: call invalidate after changing them, or derive the classes from
+    Tracked, which invalidates the verdicts when a class attribute changes.
+
+    Once a type has all the members of the protocol, checking its instances
+    costs an identity check and a dictionary lookup, where runtime_checkable
+    goes through the ABC machinery each time.
+
+    Type checkers only accept isinstance with the protocols they see decorated
+    with runtime_checkable: stack both decorators."""
+    cls = runtime_checkable(cls)
+    positives: _Positives = {}
+
+    def __instancecheck__(checked: type, instance: object) -> bool:
+        # The common case first, with as few lookups as possible: an instance
+        # of a type known to have all the members of this very protocol
+        if checked is cls and id(type(instance)) in positives:
+            return True
+        return _FastProtocolMeta.__instancecheck__(checked, instance)
+
+    # A metaclass per protocol, whose __instancecheck__ holds its verdicts
+    namespace = {"__instancecheck__": __instancecheck__}
+    metaclass = type(_FastProtocolMeta.__name__, (_FastProtocolMeta,), namespace)
+    cls.__class__ = metaclass  # pyright: ignore[reportAttributeAccessIssue]
+    cache: _Cache = weakref.WeakKeyDictionary()
+    type.__setattr__(cls, "__instance_cache__", cache)
+    type.__setattr__(cls, "__instance_positives__", positives)
+    _protocols.add(cls)
+    return cls
+
+
+def invalidate(cls: Optional[type] = None) -> None:
+    """Forget the verdicts of cls and of its subclasses, or all of them."""
+    for protocol in list(_protocols):
+        cache: _Cache = protocol.__dict__["__instance_cache__"]
+        positives: _Positives = protocol.__dict__["__instance_positives__"]
+        if cls is None:
+            cache.clear()
+            positives.clear()
+        else:
+            for stale in [t for t in cache if cls in t.__mro__]:
+                del cache[stale]
+                positives.pop(id(stale), None)
+        # The ABC machinery caches the verdicts of __subclasshook__ too
+        protocol._abc_caches_clear()  # type: ignore
+
+
+class TrackedType(type):
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        invalidate(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        invalidate(cls)
+
+
+class Tracked(metaclass=TrackedType):
+    pass
+
+
+def _missing(protocol: type, cls: type) -> frozenset[str]:
+    # The members of the protocol missing from cls, none when cls is a subclass
+    # of the protocol: nominal, registered, or structural
+    if ABCMeta.__subclasscheck__(protocol, cls):
+        return frozenset()
+    members: set[str] = getattr(protocol, "__protocol_attrs__")
+    data: set[str] = getattr(protocol, "__non_callable_proto_members__")
+    return frozenset(name for name in members if not _has(cls, name, name in data))
+
+
+def _has(cls: type, name: str, data: bool) -> bool:
+    # As typing: a method set to None is not implemented
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return data or base.__dict__[name] is not None
+    return False
@@ -0,0 +1,206 @@
+import inspect
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+# The special methods a proxy forwards when the class defines them: Python
+# looks them up on the type, a __getattr__ never sees them
+_SPECIAL = frozenset(
+    (
+        "__len__",
+        "__length_hint__",
+        "__iter__",
+        "__reversed__",
+        "__next__",
+        "__contains__",
+        "__getitem__",
+        "__setitem__",
+        "__delitem__",
+        "__call__",
+        "__enter__",
+        "__exit__",
+        "__aiter__",
+        "__anext__",
+        "__aenter__",
+        "__aexit__",
+        "__await__",
+        "__bool__",
+    )
+)
+
+# The signature of the methods forwarding any arguments
+_ANY = ("self, /, *args, **kwargs", "*args, **kwargs")
+
+
+def make_proxy(
+    cls: type[T],
+    overrides: Optional[Mapping[str, Callable[..., Any]]] = None,
+    *,
+    hooks: Optional[Mapping[str, Callable[[int], None]]] = None,
+) -> Callable[[T], T]:
+    """A proxy class for the instances of cls, that wraps one in __wrapped__.
+
+    A method per public method of cls forwards the calls to the wrapped
+    instance, and a property per public attribute of the class: they are
+    found by the normal lookup, where a __getattr__ proxy runs only after it
+    failed, at each call. __getattr__ is kept for the instance attributes.
+
+    The overrides replace the methods forwarded, or add methods, and receive
+    the proxy: self.__wrapped__ is the instance. A hook is called with the
+    nanoseconds each call of its method took, e.g. Histogram.record."""
+    overrides = dict(overrides or {})
+    hooks = hooks or {}
+    api = _api(cls)
+    unknown = set(hooks) - set(overrides) - set(api)
+    if unknown:
+        raise ValueError(f"no methods {', '.join(sorted(unknown))} to time")
+
+    namespace: dict[str, Any] = {"__clock": time.perf_counter_ns}
+    lines: list[str] = []
+    properties: dict[str, property] = {}
+    for name, method in api.items():
+        if name in overrides:
+            continue
+        if method:
+            parameters, arguments = _signature(cls, name, namespace)
+            call = f"self.__wrapped__.{name}({arguments})"
+            lines += _method(name, parameters, call, name in hooks)
+        else:
+            properties[name] = _property(cls, name)
+    for name in overrides:
+        namespace[f"__override_{name}"] = overrides[name]
+        if name in hooks:
+            call = f"__override_{name}(self, *args, **kwargs)"
+            lines += _method(name, _ANY[0], call, True)
+    for name, hook in hooks.items():
+        namespace[f"__hook_{name}"] = hook
+    exec("\n".join(lines), namespace)
+
+    qualname = f"{cls.__qualname__}Proxy"
+    body: dict[str, Any] = {
+        "__slots__": ("__wrapped__",),
+        "__module__": cls.__module__,
+        "__qualname__": qualname,
+        "__getattr__": _getattr,
+        "__repr__": _repr,
+    }
+    body.update(overrides)
+    body.update(properties)
+    for line in lines:
+        if line.startswith("def "):
+            name = line[4 : line.index("(")]
+            body[name] = namespace[name]
+            body[name].__qualname__ = f"{qualname}.{name}"
+    proxy = type(qualname.rpartition(".")[2], (), body)
+
+    # A closure over the class: super(type(self), self) would call this same
+    # __init__ again from a subclass
+    def __init__(self: Any, wrapped: Any) -> None:
+        self.__wrapped__ = wrapped
+        super(proxy, self).__init__()
+
+    __init__.__qualname__ = f"{qualname}.__init__"
+    type.__setattr__(proxy, "__init__", __init__)
+    return cast(Callable[[T], T], proxy)
+
+
+def _api(cls: type) -> dict[str, bool]:
+    # The public names of cls, and whether they are methods
+    api: dict[str, bool] = {}
+    for name in dir(cls):
+        if name.startswith("_") and name not in _SPECIAL:
+            continue
+        attribute = inspect.getattr_static(cls, name)
+        api[name] = isinstance(attribute, (staticmethod, classmethod)) or (
+            callable(attribute) and not isinstance(attribute, type)
+        )
+    return api
+
+
+def _signature(cls: type, name: str, namespace: dict[str, Any]) -> tuple[str, str]:
+    # The parameters of the method forwarding name, and the arguments it passes:
+    # those of the method of cls, as *args and **kwargs disable the inlining of
+    # the call, that costs several times the call itself
+    try:
+        signature = inspect.signature(getattr(cls, name))
+    except (TypeError, ValueError):
+        return _ANY
+    parameters = list(signature.parameters.values())
+    if not isinstance(inspect.getattr_static(cls, name), (staticmethod, classmethod)):
+        parameters = parameters[1:]
+    # The names of the forwarding methods are self and names starting with __:
+    # a parameter of the same name would hide them
+    if any(p.name == "self" or p.name.startswith("__") for p in parameters):
+        return _ANY
+
+    # self first and positional only, then the parameters of the method
+    declared = ["self"]
+    passed: list[str] = []
+    for parameter in parameters:
+        kind, parameter_name = parameter.kind, parameter.name
+        if kind is not parameter.POSITIONAL_ONLY and "/" not in declared:
+            declared.append("/")
+        if kind is parameter.KEYWORD_ONLY and not any(
+            d.startswith("*") for d in declared
+        ):
+            declared.append("*")
+        if kind is parameter.VAR_POSITIONAL:
+            declared.append(f"*{parameter_name}")
+            passed.append(f"*{parameter_name}")
+        elif kind is parameter.VAR_KEYWORD:
+            declared.append(f"**{parameter_name}")
+            passed.append(f"**{parameter_name}")
+        else:
+            declaration = parameter_name
+            if parameter.default is not parameter.empty:
+                default = f"__default_{name}_{parameter_name}"
+                namespace[default] = parameter.default
+                declaration += f"={default}"
+            declared.append(declaration)
+            keyword = kind is parameter.KEYWORD_ONLY
+            passed.append(
+                f"{parameter_name}={parameter_name}" if keyword else parameter_name
+            )
+    if "/" not in declared:
+        declared.append("/")
+    return ", ".join(declared), ", ".join(passed)
+
+
+def _method(name: str, parameters: str, call: str, timed: bool) -> list[str]:
+    if not timed:
+        return [f"def {name}({parameters}):", f"    return {call}"]
+    return [
+        f"def {name}({parameters}):",
+        "    __start = __clock()",
+        "    try:",
+        f"        return {call}",
+        "    finally:",
+        f"        __hook_{name}(__clock() - __start)",
+    ]
+
+
+def _property(cls: type, name: str) -> property:
+    def get(self: Any) -> Any:
+        return getattr(self.__wrapped__, name)
+
+    def put(self: Any, value: Any) -> None:
+        setattr(self.__wrapped__, name, value)
+
+    # Settable if the class attribute is, e.g. a property with a setter
+    attribute = inspect.getattr_static(cls, name)
+    data = inspect.isdatadescriptor(attribute)
+    doc = attribute.__doc__ if isinstance(attribute, property) else None
+    return property(get, put if data else None, doc=doc)
+
+
+def _getattr(self: Any, name: str) -> Any:
+    # Only for the attributes the class does not declare, e.g. instance ones
+    if name == "__wrapped__":
+        raise AttributeError(name)
+    return getattr(self.__wrapped__, name)
+
+
+def _repr(self: Any) -> str:
+    return f"<{type(self).__qualname__} of {self.__wrapped__!r}>"
@@ -0,0 +1,238 @@
+from dataclasses import FrozenInstanceError
+from types import MemberDescriptorType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Optional,
+    Self,
+    dataclass_transform,
+    get_origin,
+)
+
+# Defaults shared by all the instances: they would be modified through any of them
+_MUTABLE: tuple[type, ...] = (list, dict, set, bytearray)
+
+
+@dataclass_transform()
+class RecordType(type):
+    """Generates the methods of a record class from its annotations, as
+    dataclass does, with exec: __init__, __repr__, __eq__, __hash__, the
+    orderings with order=True, __match_args__, __reduce__ and __replace__.
+
+    The fields are slots, the class has no __dict__. A frozen record raises
+    FrozenInstanceError on assignments, but its __init__ does not pay for it:
+    it stores the fields with the __set__ of the slots, not with setattr.
+    Methods defined in the class are kept, and so are the slots it declares
+    besides the fields.
+
+    A record derived from a frozen one is frozen: type checkers only know it
+    when the class passes frozen=True too."""
+
+    __fields__: dict[str, Any]
+    __frozen__: bool
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        *,
+        frozen: Optional[bool] = None,
+        order: bool = False,
+        eq: bool = True,
+        **kwargs: Any,
+    ) -> "RecordType":
+        # Fields, with their defaults or _NO_DEFAULT, in the order of the bases
+        fields: dict[str, Any] = {}
+        for base in reversed(bases):
+            fields.update(getattr(base, "__fields__", {}))
+        inherited = set(fields)
+
+        annotations: dict[str, Any] = namespace.get("__annotations__", {})
+        for field, annotation in annotations.items():
+            if annotation is ClassVar or get_origin(annotation) is ClassVar:
+                continue
+            default = namespace.pop(field, _NO_DEFAULT)
+            if isinstance(default, _MUTABLE):
+                raise ValueError(
+                    f"mutable default {type(default).__name__} for {field}"
+                )
+            fields[field] = default
+
+        _check_defaults(name, fields)
+        slots = tuple(namespace.get("__slots__", ()))
+        namespace["__slots__"] = slots + tuple(f for f in fields if f not in inherited)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        frozen_bases = any(getattr(base, "__frozen__", False) for base in bases)
+        if frozen is None:
+            frozen = frozen_bases
+        elif frozen_bases and not frozen:
+            raise TypeError(f"{name}: a record derived from a frozen one is frozen")
+        cls.__fields__ = fields
+        cls.__frozen__ = frozen
+
+        methods = _methods(cls, fields, frozen, order, eq)
+        for method_name, method in methods.items():
+            if method_name not in namespace:
+                if method is not None:
+                    method.__qualname__ = f"{cls.__qualname__}.{method_name}"
+                type.__setattr__(cls, method_name, method)
+        if "__match_args__" not in namespace:
+            type.__setattr__(cls, "__match_args__", tuple(fields))
+        return cls
+
+
+class _NoDefault:
+    def __repr__(self) -> str:
+        return "<no default>"
+
+
+_NO_DEFAULT: Any = _NoDefault()
+
+
+def _check_defaults(name: str, fields: dict[str, Any]) -> None:
+    default = None
+    for field, value in fields.items():
+        if value is not _NO_DEFAULT:
+            default = field
+        elif default is not None:
+            raise TypeError(
+                f"{name}: field {field} without a default follows {default}"
+            )
+
+
+def _methods(
+    cls: type, fields: dict[str, Any], frozen: bool, order: bool, eq: bool
+) -> dict[str, Any]:
+    # The source of the methods, and the names it reads besides the builtins
+    namespace: dict[str, Any] = {
+        "FrozenInstanceError": FrozenInstanceError,
+        "__cls": cls,
+        "__new": object.__new__,
+    }
+    lines: list[str] = []
+
+    parameters: list[str] = []
+    body: list[str] = []
+    for field, default in fields.items():
+        if default is _NO_DEFAULT:
+            parameters.append(field)
+        else:
+            namespace[f"__default_{field}"] = default
+            parameters.append(f"{field}=__default_{field}")
+        if frozen:
+            # The __set__ of the slot, found by the normal lookup of the class
+            namespace[f"__set_{field}"] = getattr(cls, field).__set__
+            body.append(f"    __set_{field}(self, {field})")
+        else:
+            body.append(f"    self.{field} = {field}")
+    lines.append(f"def __init__(self, {', '.join(parameters)}):")
+    lines += body or ["    pass"]
+
+    # A copy sharing the fields not changed, without calling __init__ again
+    lines.append("def __replace__(self, /, **changes):")
+    lines.append("    new = __new(__cls)")
+    for field in fields:
+        value = f"changes.pop({field!r}) if {field!r} in changes else self.{field}"
+        if frozen:
+            lines.append(f"    __set_{field}(new, {value})")
+        else:
+            lines.append(f"    new.{field} = {value}")
+    lines += [
+        "    if changes:",
+        "        raise TypeError(f'{__cls.__qualname__} has no field {next(iter(changes))}')",
+        "    return new",
+    ]
+
+    values = "".join(f"self.{field}, " for field in fields)
+    other_values = "".join(f"other.{field}, " for field in fields)
+    items = ", ".join(f"{field}={{self.{field}!r}}" for field in fields)
+    lines += [
+        "def __repr__(self):",
+        f"    return f'{cls.__qualname__}({items})'",
+        "def __reduce__(self):",
+        f"    return self.__class__, ({values})",
+    ]
+
+    if eq:
+        lines += [
+            "def __eq__(self, other):",
+            "    if other.__class__ is self.__class__:",
+            f"        return ({values}) == ({other_values})",
+            "    return NotImplemented",
+        ]
+    if order:
+        for name, operator in (("lt", "<"), ("le", "<="), ("gt", ">"), ("ge", ">=")):
+            lines += [
+                f"def __{name}__(self, other):",
+                "    if other.__class__ is self.__class__:",
+                f"        return ({values}) {operator} ({other_values})",
+                "    return NotImplemented",
+            ]
+    if frozen and isinstance(getattr(cls, "_hash", None), MemberDescriptorType):
+        # Computed once, in the _hash slot of the instance
+        namespace["__get_hash"] = getattr(cls, "_hash").__get__
+        namespace["__set_hash"] = getattr(cls, "_hash").__set__
+        lines += [
+            "def __hash__(self):",
+            "    try:",
+            "        return __get_hash(self)",
+            "    except AttributeError:",
+            f"        value = hash(({values}))",
+            "        __set_hash(self, value)",
+            "        return value",
+        ]
+    elif frozen:
+        lines += [
+            "def __hash__(self):",
+            f"    return hash(({values}))",
+        ]
+    if frozen:
+        lines += [
+            "def __setattr__(self, name, value):",
+            "    raise FrozenInstanceError(f'cannot assign to field {name!r}')",
+            "def __delattr__(self, name):",
+            "    raise FrozenInstanceError(f'cannot delete field {name!r}')",
+        ]
+
+    exec("\n".join(lines), namespace)
+    methods: dict[str, Any] = {
+        line[4 : line.index("(")]: namespace[line[4 : line.index("(")]]
+        for line in lines
+        if line.startswith("def ")
+    }
+    if eq and not frozen:
+        # As dataclass: mutable records that compare by value are not hashable
+        methods["__hash__"] = None
+    return methods
+
+
+# The base class is created once the helpers of the metaclass exist
+class Record(metaclass=RecordType):
+    # class Point(Record, frozen=True): x: int; y: int = 0
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        # Generated for each record class, as copy.replace expects
+        def __replace__(self, /, **changes: Any) -> Self: ...
+
+
+class Frozen(Record, frozen=True):
+    """A frozen record that caches its hash, for immutable objects created
+    and hashed at high rates: configurations, events, keys.
+
+    replace and evolve make a copy with some fields changed: the other ones
+    are copied from slot to slot, __init__ is not called again."""
+
+    __slots__ = ("_hash",)
+
+    def replace(self, /, **changes: Any) -> Self:
+        return self.__replace__(**changes)
+
+    evolve = replace
+
+
+def fields(record: type | Record) -> tuple[str, ...]:
+    cls = record if isinstance(record, type) else type(record)
+    return tuple(getattr(cls, "__fields__"))
@@ -0,0 +1,282 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any, AnyStr, Generic, Optional, Protocol, TypeVar
+
+from .cache import CacheInfo, memoize
+
+type Flags = int | re.RegexFlag
+
+
+class PatternCache:
+    """A bounded LRU cache of compiled patterns.
+
+    The cache of the re module holds a few hundred patterns and is cleared
+    when it is full: past that, every call compiles its pattern again."""
+
+    def __init__(self, maxsize: Optional[int] = 4096) -> None:
+        self._compile = memoize(maxsize)(re.compile)
+        super().__init__()
+
+    def compile(self, pattern: AnyStr, flags: Flags = 0) -> re.Pattern[AnyStr]:
+        return self._compile(pattern, flags)
+
+    def info(self) -> CacheInfo:
+        return self._compile.cache_info()
+
+    def clear(self) -> None:
+        self._compile.cache_clear()
+
+
+_cache = PatternCache()
+
+
+def compile(pattern: AnyStr, flags: Flags = 0) -> re.Pattern[AnyStr]:
+    return _cache.compile(pattern, flags)
+
+
+def cache_info() -> CacheInfo:
+    return _cache.info()
+
+
+def match(
+    pattern: AnyStr, string: AnyStr, flags: Flags = 0
+) -> Optional[re.Match[AnyStr]]:
+    return _cache.compile(pattern, flags).match(string)
+
+
+def fullmatch(
+    pattern: AnyStr, string: AnyStr, flags: Flags = 0
+) -> Optional[re.Match[AnyStr]]:
+    return _cache.compile(pattern, flags).fullmatch(string)
+
+
+def search(
+    pattern: AnyStr, string: AnyStr, flags: Flags = 0
+) -> Optional[re.Match[AnyStr]]:
+    return _cache.compile(pattern, flags).search(string)
+
+
+def findall(pattern: AnyStr, string: AnyStr, flags: Flags = 0) -> list[Any]:
+    return _cache.compile(pattern, flags).findall(string)
+
+
+def finditer(
+    pattern: AnyStr, string: AnyStr, flags: Flags = 0
+) -> Iterator[re.Match[AnyStr]]:
+    return _cache.compile(pattern, flags).finditer(string)
+
+
+def split(
+    pattern: AnyStr, string: AnyStr, maxsplit: int = 0, flags: Flags = 0
+) -> list[AnyStr | Any]:
+    return _cache.compile(pattern, flags).split(string, maxsplit)
+
+
+def sub(
+    pattern: AnyStr,
+    repl: AnyStr | Callable[[re.Match[AnyStr]], AnyStr],
+    string: AnyStr,
+    count: int = 0,
+    flags: Flags = 0,
+) -> AnyStr:
+    return _cache.compile(pattern, flags).sub(repl, string, count)
+
+
+def subn(
+    pattern: AnyStr,
+    repl: AnyStr | Callable[[re.Match[AnyStr]], AnyStr],
+    string: AnyStr,
+    count: int = 0,
+    flags: Flags = 0,
+) -> tuple[AnyStr, int]:
+    return _cache.compile(pattern, flags).subn(repl, string, count)
+
+
+class PatternSet:
+    """Named patterns combined into one alternation of named groups, so that a
+    single scan finds the matches of every rule.
+
+    As in a lexer, at each position the first rule that matches wins. The
+    patterns must not use numbered backreferences: combining them shifts the
+    group numbers."""
+
+    def __init__(self, patterns: Mapping[str, str], flags: Flags = 0) -> None:
+        if not patterns:
+            raise ValueError("PatternSet needs at least one pattern")
+        self.names: tuple[str, ...] = tuple(patterns)
+        self.patterns: tuple[str, ...] = tuple(patterns.values())
+        self.flags = flags
+        # The alternations of the rules left by matched: kept out of the module
+        # cache, where they would evict the patterns of the user
+        self._patterns = PatternCache(64)
+        self.pattern = self._combine(range(len(self.names)))
+        super().__init__()
+
+    def match(self, string: str, pos: int = 0) -> Optional[tuple[str, re.Match[str]]]:
+        if match := self.pattern.match(string, pos):
+            return self._name(match), match
+        return None
+
+    def search(self, string: str, pos: int = 0) -> Optional[tuple[str, re.Match[str]]]:
+        if match := self.pattern.search(string, pos):
+            return self._name(match), match
+        return None
+
+    def finditer(self, string: str) -> Iterator[tuple[str, re.Match[str]]]:
+        for match in self.pattern.finditer(string):
+            yield self._name(match), match
+
+    def matched(self, string: str) -> set[str]:
+        """The names of all the rules that match somewhere in the string.
+
+        A rule can be hidden by the matches of the rules before it: the string
+        is scanned again without the rules already found, until a scan finds
+        nothing new. Most strings need one or two scans."""
+        remaining = list(range(len(self.names)))
+        found: set[str] = set()
+        while remaining:
+            pattern = self._combine(remaining)
+            indices = {_index(match) for match in pattern.finditer(string)}
+            if not indices:
+                break
+            found.update(self.names[index] for index in indices)
+            remaining = [index for index in remaining if index not in indices]
+        return found
+
+    def _combine(self, indices: Iterable[int]) -> re.Pattern[str]:
+        # Group names are positions: rule names do not have to be identifiers
+        alternatives = (f"(?P<_{index}>{self.patterns[index]})" for index in indices)
+        return self._patterns.compile("|".join(alternatives), self.flags)
+
+    def _name(self, match: re.Match[str]) -> str:
+        return self.names[_index(match)]
+
+
+def _index(match: re.Match[str]) -> int:
+    # lastgroup is the outermost named group: inner groups close before it
+    group = match.lastgroup
+    assert group is not None
+    return int(group[1:])
+
+
+# ______________________________________________________________________________
+# Streams
+
+
+AnyStr_co = TypeVar("AnyStr_co", str, bytes, covariant=True)
+
+
+class Readable(Protocol[AnyStr_co]):
+    def read(self, size: int = -1, /) -> AnyStr_co: ...
+
+
+@dataclass(frozen=True, slots=True)
+class StreamMatch(Generic[AnyStr]):
+    # Offsets in the whole stream, not in the chunk that contains the match
+    start: int
+    end: int
+    match: re.Match[AnyStr]
+
+    def group(self, *groups: int | str) -> Any:
+        return self.match.group(*groups)
+
+
+class _Scanner(Generic[AnyStr]):
+    """Incremental finditer over the chunks of a stream.
+
+    A match starting at least max_match characters before the end of the
+    buffer cannot change when more data arrives, so it is final. The buffer
+    keeps max_match characters before the resume position, for lookbehinds
+    and word boundaries, and is bounded by one chunk plus twice max_match."""
+
+    def __init__(self, pattern: re.Pattern[AnyStr], max_match: int) -> None:
+        if max_match < 1:
+            raise ValueError("max_match must be positive")
+        self.pattern = pattern
+        self.max_match = max_match
+        self.buffer: Optional[AnyStr] = None
+        # Offset in the stream of buffer[0]
+        self.base = 0
+        # Position in the buffer the next search starts from
+        self.pos = 0
+        # Stream offset of the last empty match, not to be reported twice
+        self.empty = -1
+        super().__init__()
+
+    def feed(self, chunk: AnyStr) -> list[StreamMatch[AnyStr]]:
+        self.buffer = chunk if self.buffer is None else self.buffer + chunk
+        return self._scan(final=False)
+
+    def close(self) -> list[StreamMatch[AnyStr]]:
+        if self.buffer is None:
+            # An empty stream: empty matches are still found, as by re.finditer
+            self.buffer = self.pattern.pattern[:0]
+        return self._scan(final=True)
+
+    def _scan(self, final: bool) -> list[StreamMatch[AnyStr]]:
+        buffer = self.buffer
+        assert buffer is not None
+        limit = len(buffer) if final else len(buffer) - self.max_match
+        matches: list[StreamMatch[AnyStr]] = []
+        resume = self.pos
+        for match in self.pattern.finditer(buffer, self.pos):
+            start, end = match.span()
+            if start > limit:
+                break
+            if start == end:
+                if self.base + start == self.empty:
+                    continue
+                self.empty = self.base + start
+            matches.append(StreamMatch(self.base + start, self.base + end, match))
+            resume = end
+
+        # No match starts between the last match and the limit
+        resume = max(resume, limit + 1)
+        drop = max(0, resume - self.max_match)
+        self.buffer = buffer[drop:]
+        self.base += drop
+        self.pos = resume - drop
+        return matches
+
+
+def finditer_stream(
+    pattern: AnyStr | re.Pattern[AnyStr],
+    file: Readable[AnyStr],
+    *,
+    chunk_size: int = 1 << 16,
+    max_match: int = 1 << 12,
+    flags: Flags = 0,
+) -> Iterator[StreamMatch[AnyStr]]:
+    """finditer over a file read in chunks, with offsets in the whole file.
+
+    Matches, lookaheads included, must be at most max_match long: longer ones
+    can be missed or truncated at the boundaries of the chunks."""
+    scanner = _Scanner(_compile(pattern, flags), max_match)
+    while chunk := file.read(chunk_size):
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+
+async def afinditer_stream(
+    pattern: bytes | re.Pattern[bytes],
+    reader: asyncio.StreamReader,
+    *,
+    chunk_size: int = 1 << 16,
+    max_match: int = 1 << 12,
+    flags: Flags = 0,
+) -> AsyncIterator[StreamMatch[bytes]]:
+    """finditer_stream over an asyncio.StreamReader, e.g. of a socket."""
+    scanner = _Scanner(_compile(pattern, flags), max_match)
+    while chunk := await reader.read(chunk_size):
+        for match in scanner.feed(chunk):
+            yield match
+    for match in scanner.close():
+        yield match
+
+
+def _compile(pattern: AnyStr | re.Pattern[AnyStr], flags: Flags) -> re.Pattern[AnyStr]:
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return compile(pattern, flags)
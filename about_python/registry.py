@@ -0,0 +1,120 @@
+from collections.abc import Hashable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar, Optional, Self
+
+from .records import Frozen
+
+
+class Registry:
+    """A base class whose subclasses register when they are created.
+
+    class Codec(Registry): ...  # the root of a registry
+    class Json(Codec, key="json", tags={"text"}): ...
+
+    Each direct subclass of Registry is the root of its own registry, shared
+    by its subclasses. A subclass is indexed by its key, if any, by its tags,
+    inherited ones included, and under each of its registered ancestors: a
+    lookup is a dict access instead of a walk over __subclasses__(). freeze
+    returns an immutable copy of the indexes, that pickles with the classes
+    by reference, e.g. for worker processes."""
+
+    __slots__ = ()
+
+    __registry__: ClassVar["_Index"]
+    key: ClassVar[Optional[Hashable]] = None
+    tags: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(
+        cls,
+        /,
+        key: Optional[Hashable] = None,
+        tags: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        if Registry in cls.__bases__:
+            cls.__registry__ = _Index()
+        cls.key = key
+        cls.tags = frozenset(tags).union(
+            *(getattr(base, "tags", ()) for base in cls.__bases__)
+        )
+        cls.__registry__.add(cls)
+
+    # lookup and tagged search the whole registry of cls
+    @classmethod
+    def lookup(cls, key: Hashable) -> type[Self]:
+        return cls.__registry__.by_key[key]
+
+    @classmethod
+    def tagged(cls, tag: str) -> tuple[type[Self], ...]:
+        return cls.__registry__.by_tag.get(tag, ())
+
+    @classmethod
+    def descendants(cls) -> tuple[type[Self], ...]:
+        # The registered subclasses of cls, at any depth, in definition order
+        return cls.__registry__.by_ancestor[cls]
+
+    @classmethod
+    def freeze(cls) -> "Snapshot":
+        index = cls.__registry__
+        return _snapshot(index.by_key, index.by_tag, index.by_ancestor)
+
+
+class Snapshot(Frozen, frozen=True):
+    by_key: Mapping[Hashable, type[Any]]
+    by_tag: Mapping[str, tuple[type[Any], ...]]
+    by_ancestor: Mapping[type[Any], tuple[type[Any], ...]]
+
+    # Mapping proxies are not hashable: neither is a snapshot
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def lookup(self, key: Hashable) -> type[Any]:
+        return self.by_key[key]
+
+    def tagged(self, tag: str) -> tuple[type[Any], ...]:
+        return self.by_tag.get(tag, ())
+
+    def descendants(self, cls: type[Any]) -> tuple[type[Any], ...]:
+        return self.by_ancestor[cls]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Mapping proxies do not pickle: the dicts they wrap do
+        return _snapshot, (
+            dict(self.by_key),
+            dict(self.by_tag),
+            dict(self.by_ancestor),
+        )
+
+
+class _Index:
+    # The tuples are rebuilt by each registration, so that lookups return them
+    def __init__(self) -> None:
+        self.by_key: dict[Hashable, type[Any]] = {}
+        self.by_tag: dict[str, tuple[type[Any], ...]] = {}
+        self.by_ancestor: dict[type[Any], tuple[type[Any], ...]] = {}
+        super().__init__()
+
+    def add(self, cls: type[Registry]) -> None:
+        if cls.key is not None:
+            if cls.key in self.by_key:
+                other = self.by_key[cls.key].__qualname__
+                raise ValueError(f"{cls.key!r} is already the key of {other}")
+            self.by_key[cls.key] = cls
+        for tag in cls.tags:
+            self.by_tag[tag] = self.by_tag.get(tag, ()) + (cls,)
+        for ancestor in cls.__mro__[1:]:
+            if ancestor in self.by_ancestor:
+                self.by_ancestor[ancestor] += (cls,)
+        self.by_ancestor[cls] = ()
+
+
+def _snapshot(
+    by_key: Mapping[Hashable, type[Any]],
+    by_tag: Mapping[str, tuple[type[Any], ...]],
+    by_ancestor: Mapping[type[Any], tuple[type[Any], ...]],
+) -> Snapshot:
+    return Snapshot(
+        MappingProxyType(dict(by_key)),
+        MappingProxyType(dict(by_tag)),
+        MappingProxyType(dict(by_ancestor)),
+    )
@@ -0,0 +1,312 @@
+import heapq
+import itertools
+import selectors
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Generator
+from typing import Any, Generic, Optional, TypeVar
+
+R = TypeVar("R")
+
+# The generator of a task: it yields None to let the other tasks run, or a trap
+# to wait for something, and the value sent back is the result of the trap
+type TaskGenerator[R] = Generator[Optional["Trap"], Any, R]
+
+
+class Cancelled(Exception):
+    pass
+
+
+class Task(Generic[R]):
+    def __init__(
+        self, scheduler: "Scheduler", generator: TaskGenerator[R], name: str
+    ) -> None:
+        self.scheduler = scheduler
+        self.generator = generator
+        self.name = name
+        self.done = False
+        # Cancelled is thrown into the generator the next time it runs
+        self.cancelling = False
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+        # The tasks joining this one
+        self._joiners: list[Task[Any]] = []
+        # Undoes the wait of the task, if it is waiting
+        self._undo: Optional[Callable[[], None]] = None
+        super().__init__()
+
+    def __repr__(self) -> str:
+        state = "done" if self.done else "waiting" if self._undo else "ready"
+        return f"<Task {self.name} {state}>"
+
+    def result(self) -> R:
+        if not self.done:
+            raise RuntimeError(f"{self.name} is not done")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def cancel(self) -> bool:
+        if self.done:
+            return False
+        if self._undo is not None:
+            self._undo()
+            self._undo = None
+            self.scheduler.resume(self, None, Cancelled())
+        else:
+            self.cancelling = True
+        return True
+
+    def wait(self, undo: Callable[[], None]) -> None:
+        # Suspends the task until wake: undo stops the wait, e.g. on cancel
+        self._undo = undo
+
+    def wake(
+        self, value: Any = None, exception: Optional[BaseException] = None
+    ) -> None:
+        self._undo = None
+        self.scheduler.resume(self, value, exception)
+
+    def join(self, joiner: "Task[Any]") -> None:
+        # Wakes joiner with the result of the task, or its exception
+        if self.done:
+            self.scheduler.resume(joiner, self._result, self._exception)
+            return
+        self._joiners.append(joiner)
+        joiner.wait(lambda: self._joiners.remove(joiner))
+
+    def finish(self, result: Any, exception: Optional[BaseException]) -> None:
+        # Called by the scheduler when the generator returns or raises
+        self.done = True
+        self._result = result
+        self._exception = exception
+        for joiner in self._joiners:
+            joiner.wake(result, exception)
+        self._joiners.clear()
+
+
+class Trap(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def handle(self, scheduler: "Scheduler", task: Task[Any]) -> None: ...
+
+
+class Scheduler:
+    """A cooperative scheduler of generators, as asyncio before async/await.
+
+    The run queue holds the tasks to resume with send, or with throw for the
+    exceptions of the tasks they join and for cancellations. Sleeping tasks
+    wait in a heap of timers, tasks waiting for a file in a selector; both are
+    polled once per round over the run queue."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        # (task, value to send, exception to throw)
+        self._ready: deque[tuple[Task[Any], Any, Optional[BaseException]]] = deque()
+        # [deadline, sequence, task]: the task is None when the timer is cancelled
+        self._timers: list[list[Any]] = []
+        self._sequence = itertools.count()
+        # The timers not cancelled
+        self._sleeping = 0
+        self._selector = selectors.DefaultSelector()
+        # The files registered in the selector
+        self._files = 0
+        super().__init__()
+
+    def spawn(self, generator: TaskGenerator[R], name: Optional[str] = None) -> Task[R]:
+        task = Task(self, generator, name or getattr(generator, "__name__", "task"))
+        self._ready.append((task, None, None))
+        return task
+
+    def resume(
+        self,
+        task: Task[Any],
+        value: Any = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        # Sends value to the task in the next round, or throws exception into it
+        self._ready.append((task, value, exception))
+
+    def sleep(self, task: Task[Any], seconds: float) -> None:
+        timer: list[Any] = [self.clock() + seconds, next(self._sequence), task]
+        heapq.heappush(self._timers, timer)
+        self._sleeping += 1
+
+        def undo() -> None:
+            timer[2] = None
+            self._sleeping -= 1
+
+        task.wait(undo)
+
+    def wait(self, task: Task[Any], fileobj: Any, event: int) -> None:
+        # Wakes the task when the selector reports event for fileobj
+        try:
+            waiters: dict[int, Task[Any]] = self._selector.get_key(fileobj).data
+        except KeyError:
+            waiters = {}
+        if event in waiters:
+            error = RuntimeError(f"another task waits for {fileobj!r}")
+            self.resume(task, None, error)
+            return
+        if waiters:
+            self._selector.modify(fileobj, sum(waiters) | event, waiters)
+        else:
+            self._selector.register(fileobj, event, waiters)
+            self._files += 1
+        waiters[event] = task
+
+        def undo() -> None:
+            del waiters[event]
+            self._update(fileobj, waiters)
+
+        task.wait(undo)
+
+    def run(self, main: Optional[TaskGenerator[R]] = None) -> Optional[R]:
+        # Runs until no task can make progress, and returns the result of main
+        task = None if main is None else self.spawn(main)
+        while self._ready or self._sleeping or self._files:
+            self._round()
+            if task is not None and task.done:
+                break
+        if task is None:
+            return None
+        if not task.done:
+            raise RuntimeError(f"{task.name} waits for a task that cannot finish")
+        return task.result()
+
+    def close(self) -> None:
+        self._selector.close()
+
+    def _round(self) -> None:
+        ready = self._ready
+        # The tasks made ready during this round run in the next one
+        for _ in range(len(ready)):
+            task, value, exception = ready.popleft()
+            if task.cancelling:
+                task.cancelling = False
+                exception = Cancelled()
+            try:
+                if exception is None:
+                    trap = task.generator.send(value)
+                else:
+                    trap = task.generator.throw(exception)
+            except StopIteration as stop:
+                task.finish(stop.value, None)
+                continue
+            except Exception as error:
+                task.finish(None, error)
+                continue
+            if trap is None:
+                ready.append((task, None, None))
+            else:
+                trap.handle(self, task)
+        self._poll()
+
+    def _poll(self) -> None:
+        timers = self._timers
+        while timers and timers[0][2] is None:
+            heapq.heappop(timers)
+        # Nothing to poll: the common case of tasks switching with yield
+        if not timers and not self._files:
+            return
+        timeout: Optional[float] = 0
+        if not self._ready:
+            timeout = max(0.0, timers[0][0] - self.clock()) if timers else None
+        if self._files:
+            for key, mask in self._selector.select(timeout):
+                self._wake(key, mask)
+        elif timeout:
+            time.sleep(timeout)
+
+        now = self.clock()
+        while timers and timers[0][0] <= now:
+            task: Optional[Task[Any]] = heapq.heappop(timers)[2]
+            if task is not None:
+                self._sleeping -= 1
+                task.wake()
+
+    def _wake(self, key: selectors.SelectorKey, mask: int) -> None:
+        waiters: dict[int, Task[Any]] = key.data
+        for event in (selectors.EVENT_READ, selectors.EVENT_WRITE):
+            if mask & event and (task := waiters.pop(event, None)) is not None:
+                task.wake()
+        self._update(key.fileobj, waiters)
+
+    def _update(self, fileobj: Any, waiters: dict[int, "Task[Any]"]) -> None:
+        if waiters:
+            self._selector.modify(fileobj, sum(waiters), waiters)
+        else:
+            self._selector.unregister(fileobj)
+            self._files -= 1
+
+
+# ______________________________________________________________________________
+# Traps
+
+
+class _Sleep(Trap):
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def handle(self, scheduler: Scheduler, task: Task[Any]) -> None:
+        scheduler.sleep(task, self.seconds)
+
+
+class _Wait(Trap):
+    __slots__ = ("fileobj", "event")
+
+    def __init__(self, fileobj: Any, event: int) -> None:
+        self.fileobj = fileobj
+        self.event = event
+
+    def handle(self, scheduler: Scheduler, task: Task[Any]) -> None:
+        scheduler.wait(task, self.fileobj, self.event)
+
+
+class _Spawn(Trap):
+    __slots__ = ("generator", "name")
+
+    def __init__(self, generator: TaskGenerator[Any], name: Optional[str]) -> None:
+        self.generator = generator
+        self.name = name
+
+    def handle(self, scheduler: Scheduler, task: Task[Any]) -> None:
+        scheduler.resume(task, scheduler.spawn(self.generator, self.name))
+
+
+class _Join(Trap):
+    __slots__ = ("task",)
+
+    def __init__(self, task: Task[Any]) -> None:
+        self.task = task
+
+    def handle(self, scheduler: Scheduler, task: Task[Any]) -> None:
+        self.task.join(task)
+
+
+def sleep(seconds: float) -> Trap:
+    # yield sleep(seconds)
+    return _Sleep(seconds)
+
+
+def readable(fileobj: Any) -> Trap:
+    # yield readable(file): resumed when reading it does not block
+    return _Wait(fileobj, selectors.EVENT_READ)
+
+
+def writable(fileobj: Any) -> Trap:
+    return _Wait(fileobj, selectors.EVENT_WRITE)
+
+
+def spawn(generator: TaskGenerator[Any], name: Optional[str] = None) -> Trap:
+    # task = yield spawn(generator)
+    return _Spawn(generator, name)
+
+
+def join(task: Task[Any]) -> Trap:
+    # result = yield join(task): raises the exception of the task, if any
+    return _Join(task)
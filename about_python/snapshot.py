@@ -0,0 +1,98 @@
+import hashlib
+import os
+import pickle
+import sys
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+# The stamp of each source, and the digest of its content
+type _Stamps = dict[str, tuple[tuple[int, int], str]]
+
+# Bumped when the layout of the snapshots changes
+VERSION = 1
+
+
+def directory() -> Path:
+    if path := os.environ.get("ABOUT_PYTHON_CACHE"):
+        return Path(path)
+    cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache) / "about_python"
+
+
+def load_or_build(
+    name: str,
+    build: Callable[[], T],
+    sources: Iterable[Path | str],
+    cache: Path | None = None,
+) -> T:
+    """The value of build(), stored in a snapshot and reused until one of the
+    sources it was computed from changes.
+
+    A snapshot is read with a single read. Sources whose modification time
+    changed are hashed: the snapshot is still valid if their content did not,
+    and is stored again with their new stamps, not to hash them at each run."""
+    path = (cache or directory()) / f"{name}.pickle"
+    stamps = {str(source): _stamp(Path(source)) for source in sources}
+    try:
+        snapshot: dict[str, Any] = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        snapshot = {}
+    if (refreshed := _valid(snapshot, stamps)) is not None:
+        if refreshed != snapshot["stamps"]:
+            _store(path, {**snapshot, "stamps": refreshed})
+        return snapshot["value"]
+
+    value = build()
+    digests = {
+        source: (stamp, _digest(Path(source))) for source, stamp in stamps.items()
+    }
+    _store(path, {"version": _version(), "stamps": digests, "value": value})
+    return value
+
+
+def _version() -> tuple[int, str]:
+    return VERSION, sys.version
+
+
+def _stamp(source: Path) -> tuple[int, int]:
+    stat = source.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _valid(
+    snapshot: dict[str, Any], stamps: dict[str, tuple[int, int]]
+) -> Optional[_Stamps]:
+    # The stored stamps updated with the current ones, None if a source changed
+    if snapshot.get("version") != _version():
+        return None
+    stored: _Stamps = snapshot["stamps"]
+    if stored.keys() != stamps.keys():
+        return None
+    refreshed: _Stamps = {}
+    for source, stamp in stamps.items():
+        stored_stamp, digest = stored[source]
+        if stored_stamp != stamp and _digest(Path(source)) != digest:
+            return None
+        refreshed[source] = stamp, digest
+    return refreshed
+
+
+def _digest(source: Path) -> str:
+    return hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def _store(path: Path, snapshot: dict[str, Any]) -> None:
+    # Write and rename, so that a concurrent process never reads half a snapshot
+    temporary = path.with_name(f"{path.name}.{os.getpid()}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_bytes(pickle.dumps(snapshot, pickle.HIGHEST_PROTOCOL))
+        os.replace(temporary, path)
+    except OSError:
+        # A read-only cache only costs the warm start
+        with suppress(OSError):
+            temporary.unlink()
@@ -0,0 +1,151 @@
+import heapq
+import itertools
+import os
+import pickle
+import sys
+import tempfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+type Key = Optional[Callable[[Any], Any]]
+
+# Items pickled together: one pickle per item is several times slower
+_BATCH = 1024
+
+# Runs merged at once: each one holds an open file and a batch in memory
+_FAN_IN = 64
+
+
+def external_sorted(
+    iterable: Iterable[T],
+    *,
+    key: Key = None,
+    reverse: bool = False,
+    max_memory: int = 1 << 26,
+    parallel: int = 0,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+    directory: Optional[str] = None,
+) -> Iterator[T]:
+    """sorted for inputs that do not fit in memory, as a generator.
+
+    The input is cut into runs of about max_memory bytes, as measured by
+    sizeof, that are sorted and spilled to temporary files, then merged with
+    heapq.merge. key and reverse are those of sorted, and the sort is stable.
+
+    With parallel > 0, runs are sorted by a pool of that many processes: key
+    must be picklable, e.g. operator.itemgetter, not a lambda. The memory is
+    then shared by the runs being sorted and the one being filled."""
+    budget = max_memory // (parallel + 1)
+    items = iter(iterable)
+    chunk = _take(items, budget, sizeof)
+    # An input that fits in memory is not written to disk
+    if not (following := list(itertools.islice(items, 1))):
+        _sort(chunk, key, reverse)
+        yield from chunk
+        return
+    items = itertools.chain(following, items)
+
+    with tempfile.TemporaryDirectory(prefix="external_sorted-", dir=directory) as path:
+        names = (os.path.join(path, f"{index}.run") for index in itertools.count())
+        chunks = itertools.chain(
+            [chunk], iter(lambda: _take(items, budget, sizeof), [])
+        )
+        del chunk
+        if parallel:
+            runs = _spill_parallel(chunks, names, key, reverse, parallel)
+        else:
+            runs = _spill_serial(chunks, names, key, reverse)
+        yield from _merge(runs, names, key, reverse)
+
+
+def _take(items: Iterator[T], budget: int, sizeof: Callable[[Any], int]) -> list[T]:
+    # At least one item, so that an item larger than the budget makes progress
+    chunk: list[T] = []
+    size = 0
+    for item in items:
+        chunk.append(item)
+        # The list holds a pointer to each item
+        size += sizeof(item) + 8
+        if size >= budget:
+            break
+    return chunk
+
+
+def _sort(chunk: list[Any], key: Key, reverse: bool) -> None:
+    # The items are compared with each other when key is None
+    chunk.sort(key=key, reverse=reverse)
+
+
+def _spill(chunk: list[T], name: str, key: Key, reverse: bool) -> str:
+    _sort(chunk, key, reverse)
+    return _write(chunk, name)
+
+
+def _spill_serial(
+    chunks: Iterable[list[T]], names: Iterator[str], key: Key, reverse: bool
+) -> list[str]:
+    runs: list[str] = []
+    for chunk in chunks:
+        runs.append(_spill(chunk, next(names), key, reverse))
+        # Free the run before the next one is read
+        del chunk
+    return runs
+
+
+def _spill_parallel(
+    chunks: Iterable[list[T]],
+    names: Iterator[str],
+    key: Key,
+    reverse: bool,
+    parallel: int,
+) -> list[str]:
+    # At most parallel runs are submitted at once: the others wait in the input.
+    # Runs are collected in input order, which keeps the merge stable.
+    runs: list[str] = []
+    pending: deque[Future[str]] = deque()
+    with ProcessPoolExecutor(parallel) as executor:
+        for chunk in chunks:
+            if len(pending) == parallel:
+                runs.append(pending.popleft().result())
+            pending.append(executor.submit(_spill, chunk, next(names), key, reverse))
+            del chunk
+        runs.extend(future.result() for future in pending)
+    return runs
+
+
+def _merge(
+    runs: list[str], names: Iterator[str], key: Key, reverse: bool
+) -> Iterable[Any]:
+    # Too many runs are merged in several passes, to bound the open files
+    while len(runs) > _FAN_IN:
+        groups = [runs[i : i + _FAN_IN] for i in range(0, len(runs), _FAN_IN)]
+        runs = [
+            _write(
+                heapq.merge(*map(_read, group), key=key, reverse=reverse), next(names)
+            )
+            for group in groups
+        ]
+        for name in itertools.chain.from_iterable(groups):
+            os.remove(name)
+    return heapq.merge(*map(_read, runs), key=key, reverse=reverse)
+
+
+def _write(items: Iterable[Any], name: str) -> str:
+    with open(name, "wb") as file:
+        for batch in itertools.batched(items, _BATCH):
+            pickle.dump(batch, file, pickle.HIGHEST_PROTOCOL)
+    return name
+
+
+def _read(name: str) -> Iterator[Any]:
+    with open(name, "rb") as file:
+        while True:
+            try:
+                batch = pickle.load(file)
+            except EOFError:
+                return
+            yield from batch
@@ -0,0 +1,129 @@
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+# A line written by -X importtime, e.g. "import time:  2679 |  11336 |   about_python"
+_LINE = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( +)(\S+)")
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRecord:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: tuple["ImportRecord", ...] = field(default=())
+
+    def walk(self) -> Iterator["ImportRecord"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def chain(self) -> list["ImportRecord"]:
+        # The path through the most expensive child, down to a leaf
+        chain: list[ImportRecord] = [self]
+        while chain[-1].children:
+            chain.append(max(chain[-1].children, key=lambda r: r.cumulative_us))
+        return chain
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    roots: tuple[ImportRecord, ...]
+    wall_ms: float
+
+    @property
+    def import_ms(self) -> float:
+        return sum(root.cumulative_us for root in self.roots) / 1000
+
+    def records(self) -> Iterator[ImportRecord]:
+        for root in self.roots:
+            yield from root.walk()
+
+    def slowest(self, count: int = 10) -> list[ImportRecord]:
+        return sorted(self.records(), key=lambda r: r.self_us, reverse=True)[:count]
+
+    def chains(self, count: int = 5) -> list[list[ImportRecord]]:
+        roots = sorted(self.roots, key=lambda r: r.cumulative_us, reverse=True)
+        return [root.chain() for root in roots[:count]]
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, profile: Profile, budget_ms: float) -> None:
+        super().__init__(profile, budget_ms)
+
+    def __str__(self) -> str:
+        return f"startup imports took {self.profile.import_ms:.1f} ms, budget {self.budget_ms:.1f} ms"
+
+    @property
+    def profile(self) -> Profile:
+        return self.args[0]
+
+    @property
+    def budget_ms(self) -> float:
+        return self.args[1]
+
+
+def parse(output: str) -> tuple[ImportRecord, ...]:
+    # Imports are written after the imports they trigger, indented one level more
+    pending: defaultdict[int, list[ImportRecord]] = defaultdict(list)
+    for line in output.splitlines():
+        if (match := _LINE.match(line)) is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        children = tuple(pending.pop(depth + 1, ()))
+        record = ImportRecord(name, int(self_us), int(cumulative_us), children)
+        pending[depth].append(record)
+    return tuple(pending[0])
+
+
+def profile(
+    arguments: Sequence[str] = ("-m", "about_python"),
+    executable: str = sys.executable,
+) -> Profile:
+    """Run the interpreter with -X importtime and collect the import tree.
+
+    Raises CalledProcessError when the interpreter fails, with its stderr
+    without the lines of -X importtime."""
+    command = [executable, "-X", "importtime", *arguments]
+    start = time.perf_counter()
+    process = subprocess.run(command, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if process.returncode:
+        lines = process.stderr.splitlines()
+        errors = "\n".join(
+            line for line in lines if not line.startswith("import time:")
+        )
+        raise subprocess.CalledProcessError(
+            process.returncode, command, process.stdout, errors
+        )
+    return Profile(roots=parse(process.stderr), wall_ms=wall_ms)
+
+
+def check(profile: Profile, budget_ms: float) -> None:
+    if profile.import_ms > budget_ms:
+        raise BudgetExceeded(profile, budget_ms)
+
+
+def format_profile(profile: Profile, count: int = 10) -> str:
+    lines = [
+        f"wall time: {profile.wall_ms:.1f} ms, imports: {profile.import_ms:.1f} ms",
+        "",
+        "slowest imports (self, cumulative):",
+    ]
+    for record in profile.slowest(count):
+        lines.append(
+            f"  {record.self_us / 1000:8.2f} ms {record.cumulative_us / 1000:8.2f} ms"
+            f"  {record.name}"
+        )
+    lines += ["", "slowest import chains (cumulative):"]
+    for chain in profile.chains(count):
+        lines.append(
+            f"  {chain[0].cumulative_us / 1000:8.2f} ms  "
+            + " -> ".join(record.name for record in chain)
+        )
+    return "\n".join(lines)
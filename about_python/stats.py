@@ -0,0 +1,88 @@
+import math
+from collections.abc import Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    # Linear interpolation between closest ranks, as numpy's default method
+    if not values:
+        raise ValueError("percentile of an empty sequence")
+    if not 0 <= q <= 100:
+        raise ValueError(f"percentile out of range: {q}")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Histogram:
+    """Counts of non-negative integers, e.g. latencies in nanoseconds, in
+    logarithmic buckets: four per power of two.
+
+    Recording is constant time and memory grows with the range of the values,
+    not with their number. Percentiles are exact to within 25%."""
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        super().__init__()
+
+    def record(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f"negative value: {value}")
+        index = _bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        # The upper bound of the bucket of the value at rank q
+        if not self.count:
+            raise ValueError("percentile of an empty histogram")
+        if not 0 <= q <= 100:
+            raise ValueError(f"percentile out of range: {q}")
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(_bounds(index)[1] - 1, self.min), self.max)
+        return self.max
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        # (lower bound, upper bound excluded, count) of the buckets with values
+        return [(*_bounds(index), self.counts[index]) for index in sorted(self.counts)]
+
+    def merge(self, other: "Histogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.count and (not self.count or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+
+def _bucket(value: int) -> int:
+    # Values below 8 have a bucket each, then the top three bits choose it
+    bits = value.bit_length()
+    if bits <= 3:
+        return value
+    return (bits - 2) * 4 + (value >> (bits - 3)) - 4
+
+
+def _bounds(index: int) -> tuple[int, int]:
+    if index < 8:
+        return index, index + 1
+    shift = index // 4 - 1
+    top = index % 4 + 4
+    return top << shift, (top + 1) << shift
@@ -0,0 +1,277 @@
+import itertools
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+# A stage takes the items of the stage before it and yields its own
+type Stage = Callable[[Iterable[Any]], Iterable[Any]]
+
+_END: Any = object()
+
+
+def batched(
+    iterable: Iterable[T],
+    n: Optional[int] = None,
+    *,
+    max_bytes: Optional[int] = None,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+) -> Iterator[tuple[T, ...]]:
+    """itertools.batched, with batches also bounded by the sum of the sizes of
+    their items. An item larger than max_bytes is a batch on its own."""
+    if n is None and max_bytes is None:
+        raise ValueError("batched needs n, max_bytes or both")
+    if n is not None and n < 1:
+        raise ValueError("n must be at least one")
+    batch: list[T] = []
+    size = 0
+    for item in iterable:
+        item_size = sizeof(item) if max_bytes is not None else 0
+        if batch and max_bytes is not None and size + item_size > max_bytes:
+            yield tuple(batch)
+            batch.clear()
+            size = 0
+        batch.append(item)
+        size += item_size
+        if len(batch) == n:
+            yield tuple(batch)
+            batch.clear()
+            size = 0
+    if batch:
+        yield tuple(batch)
+
+
+def window(iterable: Iterable[T], n: int) -> Iterator[tuple[T, ...]]:
+    # The sliding windows of n items: (a, b, c, d), 3 -> (a, b, c), (b, c, d)
+    if n < 1:
+        raise ValueError("n must be at least one")
+    items = iter(iterable)
+    last = deque(itertools.islice(items, n - 1), maxlen=n)
+    for item in items:
+        last.append(item)
+        yield tuple(last)
+
+
+def throttle(
+    iterable: Iterable[T],
+    rate: float,
+    *,
+    burst: int = 1,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[T]:
+    """At most rate items per second, with bursts of up to burst items after
+    a pause: a token bucket."""
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    tokens = float(burst)
+    last = clock()
+    for item in iterable:
+        now = clock()
+        tokens = min(burst, tokens + (now - last) * rate)
+        last = now
+        if tokens < 1:
+            sleep((1 - tokens) / rate)
+            now = clock()
+            tokens += (now - last) * rate
+            last = now
+        tokens -= 1
+        yield item
+
+
+def dedupe_within(
+    iterable: Iterable[T], n: int, *, key: Optional[Callable[[T], Hashable]] = None
+) -> Iterator[T]:
+    # Drops the items equal to one of the n items before them: memory is bounded
+    # by n, unlike a set of everything seen
+    recent: deque[Hashable] = deque()
+    counts: dict[Hashable, int] = {}
+    for item in iterable:
+        k = item if key is None else key(item)
+        if k not in counts:
+            yield item
+        recent.append(k)
+        counts[k] = counts.get(k, 0) + 1
+        if len(recent) > n:
+            old = recent.popleft()
+            if counts[old] == 1:
+                del counts[old]
+            else:
+                counts[old] -= 1
+
+
+def interleave(*iterables: Iterable[T]) -> Iterator[T]:
+    # One item of each iterable in turn, skipping the exhausted ones
+    iterators = deque(iter(iterable) for iterable in iterables)
+    while iterators:
+        iterator = iterators.popleft()
+        for item in iterator:
+            yield item
+            iterators.append(iterator)
+            break
+
+
+def tee(
+    iterable: Iterable[T], n: int = 2, *, maxsize: int = 1024
+) -> tuple[Iterator[T], ...]:
+    """itertools.tee, with at most maxsize items buffered for each iterator.
+
+    itertools.tee keeps every item a slow iterator has not read yet. Here an
+    iterator that would get more than maxsize items ahead of another raises
+    BufferError, before reading from the input, and can be read again once
+    the others catch up. Iterators closed, collected, exhausted or whose input
+    raised are not waited for."""
+    source = iter(iterable)
+    # The buffers of the iterators that can still be read
+    active: list[deque[T]] = []
+    return tuple(_TeeIterator(source, active, maxsize) for _ in range(n))
+
+
+class _TeeIterator(Iterator[T]):
+    # Not a generator: the finally of one that never started does not run, and
+    # an iterator deleted unread would hold the others back
+    def __init__(self, source: Iterator[T], active: list[deque[T]], maxsize: int):
+        self.source = source
+        self.active = active
+        self.maxsize = maxsize
+        self.buffer: Optional[deque[T]] = deque()
+        active.append(self.buffer)
+        super().__init__()
+
+    def __next__(self) -> T:
+        buffer = self.buffer
+        if buffer is None:
+            raise StopIteration
+        if buffer:
+            return buffer.popleft()
+        # Not closing: the iterator can go on once the others catch up
+        if any(
+            len(other) >= self.maxsize for other in self.active if other is not buffer
+        ):
+            raise BufferError(
+                f"tee buffer full: an iterator is {self.maxsize} items behind"
+            )
+        try:
+            item = next(self.source)
+        except BaseException:
+            # StopIteration included: the iterator is done
+            self.close()
+            raise
+        for other in self.active:
+            if other is not buffer:
+                other.append(item)
+        return item
+
+    def close(self) -> None:
+        if self.buffer is None:
+            return
+        # By identity: list.remove would compare the contents of the deques
+        for index, other in enumerate(self.active):
+            if other is self.buffer:
+                del self.active[index]
+                break
+        self.buffer = None
+
+    def __del__(self) -> None:
+        self.close()
+
+
+# ______________________________________________________________________________
+# Pipelines
+
+
+@dataclass(slots=True)
+class StageStats:
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    # Items read since the stage last yielded, e.g. the ones batched holds
+    depth: int = 0
+    max_depth: int = 0
+    # Time spent producing the items of the stage, and reading its input
+    total_ns: int = field(default=0, repr=False)
+    input_ns: int = field(default=0, repr=False)
+
+    @property
+    def seconds(self) -> float:
+        # Time spent in the stage itself
+        return (self.total_ns - self.input_ns) / 1e9
+
+    @property
+    def throughput(self) -> float:
+        # Items yielded per second of the stage itself
+        return self.items_out / self.seconds if self.seconds > 0 else 0.0
+
+
+class Pipeline(Generic[T]):
+    """Stages chained lazily, each reading the items of the one before it.
+
+    Iterating runs the pipeline and collects the StageStats of its stages:
+    the items each one read and yielded, the time spent in it, and how many
+    items it is holding."""
+
+    def __init__(self, source: Iterable[T]) -> None:
+        self.source = source
+        self.stages: list[tuple[str, Stage]] = []
+        self.stats: list[StageStats] = []
+        super().__init__()
+
+    def pipe(
+        self,
+        stage: Callable[..., Iterable[Any]],
+        /,
+        *args: Any,
+        name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "Pipeline[Any]":
+        # stage(items, *args, **kwargs), e.g. pipe(batched, 100)
+        label: str = name or getattr(stage, "__name__", "stage")
+        self.stages.append((label, lambda items: stage(items, *args, **kwargs)))
+        return self
+
+    def __iter__(self) -> Iterator[T]:
+        self.stats = [StageStats(name) for name, _ in self.stages]
+        items: Iterator[Any] = iter(self.source)
+        for (_, stage), stats in zip(self.stages, self.stats):
+            items = _output(iter(stage(_input(items, stats))), stats)
+        return items
+
+    def report(self) -> str:
+        lines = [f"{'stage':<20} {'in':>10} {'out':>10} {'items/s':>12} {'depth':>6}"]
+        for s in self.stats:
+            lines.append(
+                f"{s.name:<20} {s.items_in:>10} {s.items_out:>10}"
+                f" {s.throughput:>12.0f} {s.max_depth:>6}"
+            )
+        return "\n".join(lines)
+
+
+def _input(items: Iterator[T], stats: StageStats) -> Iterator[T]:
+    clock = time.perf_counter_ns
+    while True:
+        start = clock()
+        item = next(items, _END)
+        stats.input_ns += clock() - start
+        if item is _END:
+            return
+        stats.items_in += 1
+        stats.depth += 1
+        stats.max_depth = max(stats.max_depth, stats.depth)
+        yield item
+
+
+def _output(items: Iterator[T], stats: StageStats) -> Iterator[T]:
+    clock = time.perf_counter_ns
+    while True:
+        start = clock()
+        item = next(items, _END)
+        stats.total_ns += clock() - start
+        if item is _END:
+            return
+        stats.items_out += 1
+        stats.depth = 0
+        yield item
@@ -0,0 +1,101 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from about_python.async_stream import AsyncPipeline
+
+
+async def _collect(pipeline: AsyncPipeline[int]) -> list[int]:
+    return [item async for item in pipeline]
+
+
+async def _slow_double(x: int) -> int:
+    # The first items take the longest
+    await asyncio.sleep((10 - x) / 1000)
+    return 2 * x
+
+
+async def _repeat(x: int) -> AsyncIterator[int]:
+    for _ in range(x):
+        await asyncio.sleep(0)
+        yield x
+
+
+def test_ordered() -> None:
+    pipeline = AsyncPipeline(range(10)).pipe(_slow_double, concurrency=4)
+    assert asyncio.run(_collect(pipeline)) == [2 * x for x in range(10)]
+    (stats,) = pipeline.stats
+    assert (stats.name, stats.items_in, stats.items_out) == ("_slow_double", 10, 10)
+    assert stats.latency.count == 10
+    assert stats.latency.max >= 9_000_000
+
+
+def test_unordered() -> None:
+    pipeline = AsyncPipeline(range(10)).pipe(
+        _slow_double, concurrency=10, ordered=False
+    )
+    result = asyncio.run(_collect(pipeline))
+    assert sorted(result) == [2 * x for x in range(10)]
+    assert result != sorted(result)
+
+
+def test_generator_stage() -> None:
+    async def source() -> AsyncIterator[int]:
+        for x in range(4):
+            yield x
+
+    pipeline = (
+        AsyncPipeline(source())
+        .pipe(_repeat, concurrency=3)
+        .pipe(_slow_double, concurrency=2, name="double")
+    )
+    assert asyncio.run(_collect(pipeline)) == [2, 4, 4, 6, 6, 6]
+    assert [s.name for s in pipeline.stats] == ["_repeat", "double"]
+    assert "double" in pipeline.report()
+
+
+def test_backpressure() -> None:
+    read = 0
+
+    def source() -> Iterator[int]:
+        nonlocal read
+        for x in range(1000):
+            read += 1
+            yield x
+
+    async def main() -> None:
+        pipeline = AsyncPipeline(source(), maxsize=2).pipe(_slow_double, maxsize=2)
+        iterator = aiter(pipeline)
+        await anext(iterator)
+        await asyncio.sleep(0.01)
+        # Bounded by the queues and the item being processed
+        assert read <= 8
+        await iterator.aclose()  # type: ignore
+
+    asyncio.run(main())
+
+
+def test_failure_cancels() -> None:
+    cancelled = asyncio.Event()
+
+    async def fail(x: int) -> int:
+        if x == 3:
+            raise ValueError(x)
+        return x
+
+    async def wait(x: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return x
+
+    async def main() -> None:
+        pipeline = AsyncPipeline(range(10)).pipe(fail).pipe(wait, concurrency=2)
+        with pytest.raises(ValueError):
+            await _collect(pipeline)
+        assert cancelled.is_set()
+
+    asyncio.run(main())
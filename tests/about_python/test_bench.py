@@ -0,0 +1,88 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from about_python.bench import (
+    RegressionError,
+    Result,
+    calibrate,
+    check,
+    compare,
+    load_baseline,
+    measure,
+    registry,
+    save_baseline,
+    select,
+)
+from about_python.bench.core import MODULES
+from about_python.stats import percentile
+
+
+def make_result(name: str, ns_per_op: float, peak_bytes: int = 100) -> Result:
+    return Result(
+        name=name,
+        ns_per_op=ns_per_op,
+        samples=(ns_per_op,),
+        allocations=1,
+        peak_bytes=peak_bytes,
+    )
+
+
+def test_registry() -> None:
+    groups = {bench.group for bench in registry().values()}
+    assert groups == set(MODULES)
+    assert [bench.name for bench in select("classes.slots_*")] == [
+        "classes.slots_attribute_access",
+        "classes.slots_construction",
+    ]
+
+
+def test_measure() -> None:
+    (bench,) = select("classes.slots_construction")
+    result = measure(bench, number=10, repeat=3)
+    assert result.name == "classes.slots_construction"
+    assert len(result.samples) == 3
+    assert result.ns_per_op > 0
+    assert result.allocations >= 1
+    assert result.peak_bytes > 0
+
+
+def test_baseline(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    results = [make_result("a", 10), make_result("b", 20)]
+    save_baseline(path, results)
+    assert load_baseline(path) == {result.name: result for result in results}
+
+
+def test_compare() -> None:
+    baseline = {"a": make_result("a", 10), "b": make_result("b", 20)}
+    current = [make_result("a", 10.5), make_result("b", 30), make_result("c", 1)]
+
+    (regression,) = compare(current, baseline, threshold=0.1)
+    assert (regression.name, regression.metric) == ("b", "ns_per_op")
+    assert regression.ratio == 1.5
+
+    check(current, baseline, threshold=0.6)
+    with pytest.raises(RegressionError) as info:
+        check([make_result("a", 10, peak_bytes=200)], baseline)
+    assert [r.metric for r in info.value.regressions] == ["peak_bytes"]
+
+
+def test_calibrate() -> None:
+    # One call is at least 1 ms long, so two calls last at least 2 ms
+    assert calibrate(lambda: time.sleep(0.001), min_time=0.002) in (1, 2)
+
+
+def test_percentile() -> None:
+    result = Result(
+        name="a",
+        ns_per_op=50,
+        samples=tuple(float(x) for x in range(101)),
+        allocations=0,
+        peak_bytes=0,
+    )
+    assert (result.p95, result.p99) == (95, 99)
+    assert percentile([1, 2], 50) == 1.5
+    with pytest.raises(ValueError):
+        percentile([], 50)
@@ -0,0 +1,258 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from about_python.cache import async_memoize, memoize
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        super().__init__()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memoize_lru() -> None:
+    calls: list[int] = []
+
+    @memoize(maxsize=2)
+    def square(x: int) -> int:
+        """square doc"""
+        calls.append(x)
+        return x * x
+
+    assert [square(1), square(2), square(1), square(3), square(2)] == [1, 4, 1, 9, 4]
+    # 2 is the least recently used when 3 is inserted
+    assert calls == [1, 2, 3, 2]
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+    assert square.__doc__ == "square doc"
+
+    square.cache_clear()
+    assert square.cache_info().currsize == 0
+
+
+def test_memoize_lfu() -> None:
+    calls: list[int] = []
+
+    @memoize(maxsize=2, policy="lfu")
+    def identity(x: int) -> int:
+        calls.append(x)
+        return x
+
+    identity(1)
+    identity(1)
+    identity(2)
+    identity(3)  # evicts 2, used once
+    identity(1)
+    identity(2)
+    assert calls == [1, 2, 3, 2]
+
+
+def test_memoize_lfu_new_key() -> None:
+    calls: list[int] = []
+
+    @memoize(maxsize=2, policy="lfu")
+    def identity(x: int) -> int:
+        calls.append(x)
+        return x
+
+    for x in (1, 1, 2, 2):
+        identity(x)
+    # 3 replaces 1, least recently used of the most used, and stays cached
+    identity(3)
+    identity(3)
+    assert calls == [1, 2, 3]
+    assert identity.cache_info().evictions == 1
+
+
+def test_memoize_ttl() -> None:
+    clock = Clock()
+
+    @memoize(ttl=10, clock=clock)
+    def identity(x: int) -> int:
+        return x
+
+    identity(1)
+    clock.now = 5
+    identity(1)
+    clock.now = 11
+    identity(1)
+    info = identity.cache_info()
+    assert (info.hits, info.misses, info.expirations) == (1, 2, 1)
+
+
+def test_memoize_max_bytes() -> None:
+    @memoize(maxsize=None, max_bytes=10, sizeof=len)
+    def text(n: int) -> str:
+        return "x" * n
+
+    text(4)
+    text(4)
+    text(5)
+    assert text.cache_info().currbytes == 9
+    text(3)  # evicts text(4)
+    info = text.cache_info()
+    assert (info.currsize, info.currbytes, info.evictions) == (2, 8, 1)
+    text(20)  # larger than the cache: never stored
+    assert text.cache_info().currsize == 2
+
+
+def test_memoize_single_flight() -> None:
+    calls: list[int] = []
+    barrier = threading.Barrier(8)
+
+    @memoize()
+    def slow(x: int) -> int:
+        calls.append(x)
+        time.sleep(0.05)
+        return x
+
+    def worker() -> None:
+        barrier.wait()
+        assert slow(1) == 1
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+
+
+def test_memoize_exceptions_are_not_cached() -> None:
+    calls: list[int] = []
+
+    @memoize()
+    def fail(x: int) -> int:
+        calls.append(x)
+        raise ValueError(x)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            fail(1)
+    assert calls == [1, 1]
+
+
+def test_async_memoize() -> None:
+    calls: list[int] = []
+
+    @async_memoize(maxsize=2)
+    async def square(x: int) -> int:
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * x
+
+    async def coroutine() -> None:
+        # Concurrent callers share one task
+        assert await asyncio.gather(*(square(2) for _ in range(5))) == [4] * 5
+        assert calls == [2]
+        assert await square(2) == 4
+        assert calls == [2]
+        assert await square(3) == 9
+        assert calls == [2, 3]
+
+    asyncio.run(coroutine())
+    assert square.cache_info().currsize == 2
+
+
+def test_async_memoize_cancellation() -> None:
+    @async_memoize()
+    async def slow(x: int) -> int:
+        await asyncio.sleep(0.01)
+        return x
+
+    async def coroutine() -> None:
+        cancelled = asyncio.ensure_future(slow(1))
+        other = asyncio.ensure_future(slow(1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        assert await other == 1
+
+    asyncio.run(coroutine())
+
+
+def test_async_memoize_generator() -> None:
+    calls: list[int] = []
+
+    @async_memoize()
+    async def count(n: int) -> AsyncIterator[int]:
+        calls.append(n)
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
+
+    async def consume(n: int) -> list[int]:
+        return [i async for i in count(n)]
+
+    async def coroutine() -> None:
+        assert await asyncio.gather(consume(3), consume(3)) == [[0, 1, 2]] * 2
+        assert await consume(3) == [0, 1, 2]
+        assert calls == [3]
+
+        # A generator that is not exhausted is not cached
+        async for _ in count(4):
+            break
+        assert count.cache_info().currsize == 1
+
+    asyncio.run(coroutine())
+
+
+def test_async_memoize_generator_abandoned() -> None:
+    calls: list[int] = []
+
+    @async_memoize()
+    async def count(n: int) -> AsyncIterator[int]:
+        calls.append(n)
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
+
+    async def coroutine() -> None:
+        # Never started, then partly consumed: neither recording is kept
+        iterator = count(3)
+        del iterator
+        async for _ in count(3):
+            break
+        assert not count._recordings  # type: ignore
+        assert [i async for i in count(3)] == [0, 1, 2]
+        assert count.cache_info().currsize == 1
+
+        # A cancelled consumer does not fail the others
+        async def consume(n: int) -> list[int]:
+            return [i async for i in count(n)]
+
+        first = asyncio.create_task(consume(4))
+        second = asyncio.create_task(consume(4))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == [0, 1, 2, 3]
+        assert first.cancelled()
+        assert count.cache_info().currsize == 2
+
+    asyncio.run(coroutine())
+    assert calls == [3, 3, 4, 4]
+
+
+def test_async_memoize_generator_exceptions() -> None:
+    calls: list[int] = []
+
+    @async_memoize()
+    async def fail(n: int) -> AsyncIterator[int]:
+        calls.append(n)
+        yield n
+        raise ValueError(n)
+
+    async def coroutine() -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                async for _ in fail(1):
+                    pass
+
+    asyncio.run(coroutine())
+    assert calls == [1, 1]
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from about_python import main
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setenv("ABOUT_PYTHON_CACHE", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def test_main(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main([]) == 0
+    assert capsys.readouterr().out == "about_python\n"
+
+
+def test_bench_list(cache: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for _ in range(2):
+        assert main(["bench", "--list", "classes.slots_*"]) == 0
+        assert capsys.readouterr().out == (
+            "classes.slots_attribute_access\nclasses.slots_construction\n"
+        )
+    assert (cache / "bench-index.pickle").exists()
+
+
+@pytest.mark.parametrize("runner", ["inprocess", "subprocess"])
+def test_bench_baseline(
+    runner: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "baseline.json"
+    options = ["--runner", runner, "--number=10", "--repeat=3"]
+    assert main(["bench", "language.closure_call", *options, "--save", str(path)]) == 0
+    assert "language.closure_call" in capsys.readouterr().out
+
+    # Make the stored run impossibly fast, so that the new run regresses
+    document = json.loads(path.read_text())
+    document["results"]["language.closure_call"]["ns_per_op"] = 1e-3
+    path.write_text(json.dumps(document))
+
+    assert (
+        main(["bench", "language.closure_call", *options, "--baseline", str(path)]) == 1
+    )
+    assert "1 regression(s)" in capsys.readouterr().out
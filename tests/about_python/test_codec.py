@@ -0,0 +1,96 @@
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, NamedTuple
+
+import pytest
+
+from about_python.codec import Codec, Format
+
+
+class MyNamedTuple(NamedTuple):
+    x: int
+    y: Annotated[float, Format("f")]
+    name: Annotated[str, Format("8s")]
+
+
+@dataclass(slots=True)
+class DataClass:
+    x: Annotated[int, Format("H")]
+    flag: bool
+
+
+def test_codec_named_tuple() -> None:
+    codec = Codec(MyNamedTuple)
+    assert codec.size == 8 + 4 + 8
+
+    record = MyNamedTuple(1, 0.5, "abc")
+    data = codec.pack(record)
+    assert len(data) == codec.size
+    assert codec.unpack(data) == record
+
+    buffer = bytearray(codec.size * 2)
+    codec.pack_into(buffer, codec.size, record)
+    assert codec.unpack_from(buffer, codec.size) == record
+    assert list(codec.iter_unpack(buffer)) == [MyNamedTuple(0, 0, ""), record]
+
+
+def test_codec_string_size() -> None:
+    codec = Codec(MyNamedTuple)
+    assert codec.unpack(codec.pack(MyNamedTuple(1, 0.5, "abcdefgh"))).name == "abcdefgh"
+    # Too long, or cut inside the UTF-8 encoding of a character
+    for name in ["abcdefghi", "abcdefgé"]:
+        with pytest.raises(ValueError):
+            codec.pack(MyNamedTuple(1, 0.5, name))
+        with pytest.raises(ValueError):
+            codec.pack_into(bytearray(codec.size), 0, MyNamedTuple(1, 0.5, name))
+
+
+def test_codec_dataclass() -> None:
+    codec = Codec(DataClass)
+    records = [DataClass(i, i % 2 == 0) for i in range(3)]
+    data = b"".join(codec.pack(record) for record in records)
+    assert list(codec.iter_unpack(data)) == records
+
+
+def test_codec_unsupported() -> None:
+    class Bad(NamedTuple):
+        name: str
+
+    with pytest.raises(TypeError):
+        Codec(Bad)
+    with pytest.raises(TypeError):
+        Codec(int)
+
+
+def test_record_view() -> None:
+    codec = Codec(DataClass)
+    buffer = bytearray(codec.size * 4 + 1)  # a trailing partial record is ignored
+    view = codec.view(buffer)
+    assert len(view) == 4
+
+    for i in range(len(view)):
+        view[i] = DataClass(i, True)
+    assert view[-1] == DataClass(3, True)
+    assert list(view[1:3]) == [DataClass(1, True), DataClass(2, True)]
+    assert DataClass(2, True) in view
+    with pytest.raises(IndexError):
+        view[4]
+
+    # Slices share the buffer
+    view[1:3][0] = DataClass(10, False)
+    assert view[1] == DataClass(10, False)
+
+
+def test_record_view_mmap(tmp_path: Path) -> None:
+    codec = Codec(MyNamedTuple)
+    records = [MyNamedTuple(i, i / 2, str(i)) for i in range(100)]
+    path = tmp_path / "records.bin"
+    path.write_bytes(b"".join(map(codec.pack, records)))
+
+    with path.open("rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            view = codec.view(buffer)
+            assert list(view) == records
+            assert view[50] == records[50]
+            view.release()
@@ -0,0 +1,94 @@
+import dataclasses
+from dataclasses import dataclass
+
+import pytest
+
+from about_python.columnar import Columnar
+
+
+@dataclass(slots=True)
+class DataClass:
+    string_value: str
+    int_value: int = 0
+    float_value: float = 0.0
+    bool_value: bool = False
+    list_value: list[int] = dataclasses.field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDataClass:
+    x: int
+    y: int
+
+
+def test_columnar() -> None:
+    rows = [DataClass("a", 1, 1.5, True, [1]), DataClass("b", 2), DataClass("a", 3)]
+    table = Columnar(DataClass, rows)
+
+    assert len(table) == 3
+    row = table[0]
+    assert isinstance(row, DataClass)
+    assert row == table[0]
+    # Views compare with the rows by value, both ways
+    assert row == rows[0] and rows[0] == row
+    assert row != rows[1] and table[1] == DataClass("b", 2)
+    assert row.string_value == "a"
+    assert row.bool_value is True
+    assert row.list_value == [1]
+    assert table[-1].int_value == 3
+    with pytest.raises(IndexError):
+        table[3]
+
+    assert dataclasses.asdict(row) == dataclasses.asdict(rows[0])
+    assert [r.int_value for r in table] == [1, 2, 3]
+
+    # Views write through to the columns
+    row.int_value = 10
+    row.string_value = "c"
+    assert table[0].int_value == 10
+    assert table.column("string_value") == ["c", "b", "a"]
+
+
+def test_columnar_export() -> None:
+    table = Columnar(DataClass)
+    table.extend([DataClass("a", 1), DataClass("a", 2)])
+    assert table.asdict() == {
+        "string_value": ["a", "a"],
+        "int_value": [1, 2],
+        "float_value": [0.0, 0.0],
+        "bool_value": [False, False],
+        "list_value": [[], []],
+    }
+    assert table.astuple() == [("a", 1, 0.0, False, []), ("a", 2, 0.0, False, [])]
+
+
+def test_columnar_append_error() -> None:
+    table = Columnar(DataClass, [DataClass("a", 1)])
+    with pytest.raises(OverflowError):
+        table.append(DataClass("b", 2**63))
+    with pytest.raises(TypeError):
+        table.append(DataClass("b", 2, "c"))  # type: ignore
+    # The columns extended before the error are rolled back
+    assert len(table) == 1
+    assert table.astuple() == [("a", 1, 0.0, False, [])]
+
+
+def test_columnar_frozen() -> None:
+    table = Columnar(FrozenDataClass, [FrozenDataClass(1, 2)])
+    row = table[0]
+    assert row == FrozenDataClass(1, 2)
+    assert hash(row) == hash(FrozenDataClass(1, 2))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        row.x = 10  # type: ignore
+
+
+def test_columnar_nbytes() -> None:
+    rows = [FrozenDataClass(i, i) for i in range(10_000)]
+    table = Columnar(FrozenDataClass, rows)
+    # Two 8 bytes integers per row, plus the over-allocation of the arrays
+    assert table.nbytes < 2 * 8 * len(rows) * 1.2
+
+
+def test_columnar_requires_dataclass() -> None:
+    with pytest.raises(TypeError):
+        Columnar(int)
@@ -0,0 +1,153 @@
+from typing import Optional
+
+import pytest
+
+from about_python.descriptors import cached_field, computed, typed
+
+
+def test_cached_field() -> None:
+    calls: list[str] = []
+
+    class Slotted:
+        __slots__ = ("side", "_area")
+
+        def __init__(self, side: int) -> None:
+            self.side = side
+            super().__init__()
+
+        @cached_field
+        def area(self) -> int:
+            calls.append("slots")
+            return self.side * self.side
+
+    class WithDict:
+        def __init__(self, side: int) -> None:
+            self.side = side
+            super().__init__()
+
+        @cached_field
+        def area(self) -> int:
+            calls.append("dict")
+            return self.side * self.side
+
+    for cls in (Slotted, WithDict):
+        instance = cls(3)
+        assert instance.area == 9
+        instance.side = 4
+        assert instance.area == 9
+        cls.area.reset(instance)  # pyright: ignore[reportArgumentType]
+        assert instance.area == 16
+    assert calls == ["slots", "slots", "dict", "dict"]
+
+    with pytest.raises(TypeError):
+
+        class NoSlot:  # pyright: ignore[reportUnusedClass]
+            __slots__ = ("side",)
+
+            @cached_field
+            def area(self) -> int:
+                return 0
+
+
+def test_computed() -> None:
+    calls: list[str] = []
+
+    class Rectangle:
+        __slots__ = ("width", "height", "_area", "_perimeter", "_half_area")
+
+        def __init__(self, width: int, height: int) -> None:
+            self.width = width
+            self.height = height
+            super().__init__()
+
+        @computed("width", "height")
+        def area(self) -> int:
+            calls.append("area")
+            return self.width * self.height
+
+        @computed("width")
+        def perimeter(self) -> int:
+            calls.append("perimeter")
+            return 2 * (self.width + self.height)
+
+        @computed("area")
+        def half_area(self) -> float:
+            calls.append("half_area")
+            return self.area / 2
+
+    rectangle = Rectangle(2, 3)
+    assert (rectangle.area, rectangle.perimeter, rectangle.half_area) == (6, 10, 3)
+    assert (rectangle.area, rectangle.perimeter, rectangle.half_area) == (6, 10, 3)
+    assert calls == ["area", "perimeter", "half_area"]
+
+    calls.clear()
+    rectangle.height = 4
+    # perimeter does not declare height
+    assert (rectangle.area, rectangle.perimeter, rectangle.half_area) == (8, 10, 4)
+    assert calls == ["area", "half_area"]
+
+    calls.clear()
+    rectangle.width = 3
+    assert (rectangle.area, rectangle.perimeter) == (12, 14)
+    assert calls == ["area", "perimeter"]
+
+
+def test_computed_dict() -> None:
+    class Point:
+        scale = 1
+
+        def __init__(self, x: int) -> None:
+            self.x = x
+            super().__init__()
+
+        @computed("x", "scale")
+        def scaled(self) -> int:
+            return self.x * self.scale
+
+    point = Point(2)
+    assert point.scaled == 2
+    point.scale = 3
+    assert point.scaled == 6
+    point.x = 1
+    assert point.scaled == 3
+    assert Point(5).scaled == 5
+
+
+class Node:
+    __slots__ = ("_parent",)
+    # The annotation names the class while it is created
+    parent: "Optional[Node]" = typed()
+
+
+def test_typed() -> None:
+    class Model:
+        __slots__ = ("_count", "_tags", "_label")
+        count: int = typed(lambda value: value >= 0)
+        tags: list[str] = typed()
+        label: Optional[str] = typed()
+
+        # Type checkers do not see the descriptors behind the annotations
+        def __init__(self, count: int, tags: list[str]) -> None:
+            self.count = count  # pyright: ignore[reportGeneralTypeIssues]
+            self.tags = tags  # pyright: ignore[reportGeneralTypeIssues]
+            self.label = None  # pyright: ignore[reportGeneralTypeIssues]
+            super().__init__()
+
+    model = Model(1, ["a"])
+    assert (model.count, model.tags, model.label) == (1, ["a"], None)
+    with pytest.raises(TypeError, match="Model.count must be int, not str"):
+        model.count = "1"  # type: ignore
+    with pytest.raises(ValueError):
+        model.count = -1
+    with pytest.raises(TypeError):
+        model.tags = ["a", 1]  # type: ignore
+    model.label = "label"
+    assert model.label == "label"
+
+
+def test_typed_forward_reference() -> None:
+    node = Node()
+    node.parent = Node()
+    node.parent = None
+    with pytest.raises(TypeError, match="Node.parent must be"):
+        node.parent = 1  # type: ignore
@@ -0,0 +1,179 @@
+from typing import Any, Optional, overload
+
+import pytest
+
+from about_python.dispatch import dispatch
+
+
+class Vector:
+    def __init__(self, x: int) -> None:
+        self.x = x
+        super().__init__()
+
+    # The annotations name the class while it is created
+    @overload
+    def add(self, other: "Vector") -> "Vector":
+        return Vector(self.x + other.x)
+
+    @overload
+    def add(self, other: int) -> "Vector": ...
+
+    @dispatch
+    def add(self, other: Any) -> "Vector":
+        return Vector(self.x + other)
+
+
+def test_dispatch() -> None:
+    # The overloaded_function of test_functions_overload, without isinstance
+    @overload
+    def overloaded_function(x: int) -> int:
+        return x
+
+    @overload
+    def overloaded_function(x: list[int]) -> int:
+        return x[0]
+
+    @dispatch
+    def overloaded_function(x: Any) -> Any:
+        return None
+
+    assert overloaded_function(1) == 1
+    assert overloaded_function([1, 2]) == 1
+    assert (
+        overloaded_function(  # pyright: ignore[reportCallIssue]
+            ["a"]  # pyright: ignore[reportArgumentType]
+        )
+        is None
+    )
+    assert (
+        overloaded_function("a")  # pyright: ignore[reportCallIssue, reportArgumentType]
+        is None
+    )
+
+
+def test_dispatch_multiple_arguments() -> None:
+    @overload
+    def f(x: int, y: int) -> str:
+        return "int, int"
+
+    @overload
+    def f(x: int, y: str) -> str:
+        return "int, str"
+
+    @overload
+    def f(x: dict[str, int], y: Optional[tuple[int, ...]] = None) -> str:
+        return "dict, tuple"
+
+    @overload
+    def f(x: object, y: int | str) -> str:
+        return "object, int | str"
+
+    @dispatch
+    def f(x: Any, y: Any = None) -> str:
+        return "fallback"
+
+    assert f(1, 2) == "int, int"
+    assert f(True, "a") == "int, str"
+    assert f({"a": 1}) == "dict, tuple"
+    assert f({"a": 1}, (1, 2)) == "dict, tuple"
+    assert (
+        f({"a": 1}, (1, "a"))  # pyright: ignore[reportCallIssue, reportArgumentType]
+        == "fallback"
+    )
+    assert f({"a": "b"}, 1) == "object, int | str"
+    assert f(1.5, "a") == "object, int | str"
+    assert (
+        f(1.5, 1.5)  # pyright: ignore[reportCallIssue, reportArgumentType]
+        == "fallback"
+    )
+    assert f(1, y=2) == "int, int"
+    assert f(x={"a": 1}) == "dict, tuple"
+
+
+def test_dispatch_stubs() -> None:
+    calls: list[Any] = []
+
+    @overload
+    def g(x: int) -> int: ...
+
+    @overload
+    def g(x: str) -> int: ...
+
+    @dispatch
+    def g(x: Any) -> int:
+        calls.append(x)
+        return 0
+
+    assert g(1) == 0
+    assert g("a") == 0
+    assert calls == [1, "a"]
+
+
+def test_dispatch_body_returning_none() -> None:
+    # Compiles to the bytecode of a stub, but is not one
+    @overload
+    def g(x: int) -> Optional[int]:
+        return None
+
+    @overload
+    def g(x: str) -> Optional[int]: ...
+
+    @dispatch
+    def g(x: Any) -> Optional[int]:
+        return 0
+
+    assert g(1) is None
+    assert g("a") == 0
+
+
+def test_dispatch_without_source() -> None:
+    namespace: dict[str, Any] = {"__name__": "without_source"}
+    source = """
+from typing import Any, overload
+from about_python.dispatch import dispatch
+
+@overload
+def g(x: int) -> int: ...
+
+@overload
+def g(x: str) -> int: ...
+
+@dispatch
+def g(x: Any) -> int:
+    return 1
+"""
+    exec(source, namespace)
+    # The stubs are told from their bytecode
+    assert namespace["g"](1) == 1
+    assert namespace["g"]("a") == 1
+
+
+def test_dispatch_method() -> None:
+    class Shape:
+        @overload
+        def area(self, scale: int) -> str:
+            return "int"
+
+        @overload
+        def area(self, scale: float) -> str: ...
+
+        @dispatch
+        def area(self, scale: Any) -> str:
+            return "fallback"
+
+    assert Shape().area(1) == "int"
+    assert Shape().area(1.5) == "fallback"
+    assert Shape.area(Shape(), 1) == "int"
+
+
+def test_dispatch_method_of_its_class() -> None:
+    assert Vector(1).add(Vector(2)).x == 3
+    assert Vector(1).add(2).x == 3
+
+
+def test_dispatch_without_overloads() -> None:
+    def h(x: int) -> int:
+        return x
+
+    with pytest.raises(TypeError):
+        dispatch(h)
@@ -0,0 +1,30 @@
+import sys
+
+import pytest
+
+
+def test_lazy_package() -> None:
+    for name in [m for m in sys.modules if m.startswith("tests.my_lazy_package")]:
+        del sys.modules[name]
+
+    import tests.my_lazy_package as p
+
+    assert "tests.my_lazy_package.my_module.my_file" not in sys.modules
+    assert p.__all__ == ["my_function", "my_module"]
+    assert "my_function" in dir(p)
+
+    assert p.my_function(1) == 1
+    assert "tests.my_lazy_package.my_module.my_file" in sys.modules
+    assert "my_function" in vars(p)  # cached in the namespace
+
+    assert p.my_module.__name__ == "tests.my_lazy_package.my_module"
+    with pytest.raises(AttributeError):
+        p.missing
+
+
+def test_lazy_package_all() -> None:
+    namespace: dict[str, object] = {}
+    exec("from tests.my_lazy_package import *", namespace)
+    assert "my_function" in namespace
+    assert "my_module" in namespace
+    assert "secret_function" not in namespace
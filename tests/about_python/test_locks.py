@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+
+from about_python.locks import (
+    AsyncFairSemaphore,
+    AsyncLock,
+    AsyncLockGuard,
+    AsyncRWLock,
+    AsyncStripedLock,
+    FairSemaphore,
+    Lock,
+    LockGuard,
+    RWLock,
+    StripedLock,
+    merge,
+)
+
+
+def test_lock() -> None:
+    lock: Lock[list[int]] = Lock([])
+
+    def append() -> None:
+        for i in range(100):
+            with LockGuard(lock) as values:
+                values.append(i)
+
+    threads = [threading.Thread(target=append) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with LockGuard(lock) as values:
+        assert len(values) == 400
+    assert lock.stats.acquisitions == 401
+    assert lock.stats.wait.count == lock.stats.contended
+
+
+def test_rwlock() -> None:
+    lock = RWLock({"value": 0})
+    reading = threading.Barrier(3)
+
+    def reader() -> None:
+        with lock.read():
+            # Both readers hold the lock at once
+            reading.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    with lock.read():
+        reading.wait()
+    for thread in threads:
+        thread.join()
+
+    def write() -> None:
+        with lock.write() as value:
+            value["value"] += 1
+
+    with lock.read():
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.01)
+        # The writer waits for the reader
+        assert writer.is_alive()
+    writer.join()
+    with lock.read() as value:
+        assert value == {"value": 1}
+    assert lock.writer.stats.contended == 1
+    assert lock.reader.stats.acquisitions == 5
+
+
+def test_striped_lock() -> None:
+    lock = StripedLock(4)
+    with lock.lock("a") as stripe:
+        assert stripe == hash("a") % 4
+    # Keys on different stripes do not exclude each other
+    other = next(key for key in range(4) if hash(key) % 4 != hash("a") % 4)
+    with lock.lock("a"), lock.lock(other):
+        pass
+    assert merge(lock.stats).acquisitions == 3
+
+
+def test_fair_semaphore() -> None:
+    semaphore = FairSemaphore(1)
+    order: list[int] = []
+    semaphore.lock()
+
+    def worker(index: int) -> None:
+        with semaphore:
+            order.append(index)
+
+    threads: list[threading.Thread] = []
+    for index in range(5):
+        threads.append(threading.Thread(target=worker, args=(index,)))
+        threads[-1].start()
+        # Each worker waits before the next one asks
+        while len(semaphore._waiters) <= index:  # type: ignore
+            time.sleep(0.001)
+    semaphore.unlock()
+    for thread in threads:
+        thread.join()
+    assert order == list(range(5))
+    assert semaphore.stats.contended == 5
+
+
+def test_async_locks() -> None:
+    async def main() -> None:
+        lock = AsyncLock(0)
+        rwlock = AsyncRWLock([0])
+        order: list[str] = []
+
+        async def reader(name: str) -> None:
+            async with rwlock.read() as values:
+                await asyncio.sleep(0.01)
+                order.append(name)
+                assert values
+
+        async def writer() -> None:
+            async with rwlock.write() as values:
+                values.append(1)
+                order.append("writer")
+
+        async with AsyncLockGuard(lock):
+            task = asyncio.create_task(lock.lock())
+            await asyncio.sleep(0)
+        await task
+        lock.unlock()
+        assert lock.stats.contended == 1
+
+        # The second reader waits for the writer that came before it
+        await asyncio.gather(reader("first"), writer(), reader("second"))
+        assert order == ["first", "writer", "second"]
+        assert rwlock.writer.stats.contended == 1
+
+        striped = AsyncStripedLock(2)
+        async with striped.lock(1) as stripe:
+            assert stripe == 1
+
+    asyncio.run(main())
+
+
+def test_async_fair_semaphore() -> None:
+    async def main() -> None:
+        semaphore = AsyncFairSemaphore(1)
+        order: list[int] = []
+
+        async def worker(index: int) -> None:
+            async with semaphore:
+                order.append(index)
+                await asyncio.sleep(0)
+
+        await semaphore.lock()
+        tasks = [asyncio.create_task(worker(index)) for index in range(4)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        semaphore.unlock()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert order == [0, 2, 3]
+        assert semaphore.stats.contended == 3
+
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+from about_python.codec import Codec
+from about_python.mmap_sequence import MmapSequence
+
+
+class Record(NamedTuple):
+    key: int
+    value: float
+
+
+def write(path: Path, records: list[Record]) -> Path:
+    codec = Codec(Record)
+    path.write_bytes(b"".join(map(codec.pack, records)))
+    return path
+
+
+def test_mmap_sequence(tmp_path: Path) -> None:
+    records = [Record(i, i / 2) for i in range(1000)]
+    path = write(tmp_path / "records.bin", records)
+
+    with MmapSequence(path, Record) as sequence:
+        assert len(sequence) == 1000
+        assert sequence[0] == records[0]
+        assert sequence[-1] == records[-1]
+        assert list(sequence) == records
+        assert Record(10, 5.0) in sequence
+        assert Record(10, 6.0) not in sequence
+        assert sequence.index(Record(10, 5.0)) == 10
+        with pytest.raises(IndexError):
+            sequence[1000]
+
+        part = sequence[100:200]
+        assert len(part) == 100
+        assert part[0] == records[100]
+        assert list(part[10:20]) == records[110:120]
+        assert list(sequence[990:2000]) == records[990:]
+
+        sequence.prefetch(100, 500)
+        sequence.advise_sequential()
+
+
+def test_mmap_sequence_sorted(tmp_path: Path) -> None:
+    records = [Record(i * 2, 0.0) for i in range(1000)]
+    path = write(tmp_path / "records.bin", records)
+
+    with MmapSequence(path, Record, sorted=True) as sequence:
+        assert Record(500, 0.0) in sequence
+        assert Record(501, 0.0) not in sequence
+        assert sequence.index(Record(500, 0.0)) == 250
+
+    with MmapSequence(path, Record, sorted=True, key=lambda r: r.key) as sequence:
+        assert Record(1998, 0.0) in sequence
+        assert Record(2000, 0.0) not in sequence
+        with pytest.raises(ValueError):
+            sequence.index(Record(3, 0.0))
+
+
+def test_mmap_sequence_sorted_duplicate_keys(tmp_path: Path) -> None:
+    records = [Record(0, 0.0), Record(1, 0.0), Record(1, 5.0), Record(2, 0.0)]
+    path = write(tmp_path / "records.bin", records)
+
+    with MmapSequence(path, Record, sorted=True, key=lambda r: r.key) as sequence:
+        # Not the first record with the key
+        assert Record(1, 5.0) in sequence
+        assert sequence.index(Record(1, 5.0)) == 2
+        assert sequence.index(Record(1, 0.0), 1, -1) == 1
+        assert Record(1, 6.0) not in sequence
+        with pytest.raises(ValueError):
+            sequence.index(Record(1, 5.0), 0, 2)
+
+
+def test_mmap_sequence_close_while_iterating(tmp_path: Path) -> None:
+    records = [Record(i, 0.0) for i in range(10_000)]
+    path = write(tmp_path / "records.bin", records)
+
+    sequence = MmapSequence(path, Record)
+    # Several chunks
+    assert list(sequence) == records
+    iterator = iter(sequence)
+    assert next(iterator) == records[0]
+    # The iterator holds no export of the mapping
+    sequence.close()
+
+
+def test_mmap_sequence_writable(tmp_path: Path) -> None:
+    path = write(tmp_path / "records.bin", [Record(0, 0.0), Record(1, 0.0)])
+
+    with MmapSequence(path, Record, writable=True) as sequence:
+        sequence[1] = Record(1, 1.5)
+        sequence.flush()
+
+    with MmapSequence(path, Record) as sequence:
+        assert sequence[1] == Record(1, 1.5)
+
+
+def test_mmap_sequence_empty(tmp_path: Path) -> None:
+    path = write(tmp_path / "records.bin", [])
+
+    with MmapSequence(path, Record) as sequence:
+        assert len(sequence) == 0
+        assert list(sequence) == []
+        assert Record(0, 0.0) not in sequence
@@ -0,0 +1,63 @@
+import itertools
+import operator
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from about_python.parallel import pmap, preduce
+
+
+def test_pmap_processes() -> None:
+    assert list(pmap(abs, range(-100, 0), max_workers=2)) == list(range(100, 0, -1))
+    assert list(pmap(pow, [2, 3, 4], [3, 2], max_workers=2)) == [8, 9]
+
+
+def test_pmap_ordered() -> None:
+    def slow(x: int) -> int:
+        # The first calls finish last
+        time.sleep((10 - x) / 1000)
+        return x
+
+    result = pmap(slow, range(10), threads=True, max_workers=4, chunksize=1)
+    assert list(result) == list(range(10))
+
+
+def test_pmap_window() -> None:
+    consumed = 0
+
+    def numbers() -> Iterator[int]:
+        nonlocal consumed
+        for number in itertools.count():
+            consumed += 1
+            yield number
+
+    with ThreadPoolExecutor(2) as executor:
+        result = pmap(int, numbers(), executor=executor, chunksize=5, window=3)
+        assert list(itertools.islice(result, 12)) == list(range(12))
+        # 12 results are 3 chunks, plus at most 3 chunks in flight
+        assert consumed <= 6 * 5
+        result.close()
+
+
+def test_pmap_error() -> None:
+    with pytest.raises(TypeError):
+        list(pmap(abs, ["a"], threads=True))
+
+
+def test_preduce() -> None:
+    numbers = list(range(10_000))
+    assert preduce(operator.add, numbers, max_workers=2) == sum(numbers)
+    assert preduce(operator.add, numbers, 5, max_workers=2) == sum(numbers) + 5
+
+    # Associative but not commutative
+    letters = [chr(ord("a") + i % 26) for i in range(1000)]
+    result = preduce(operator.add, letters, threads=True, max_workers=3, chunksize=7)
+    assert result == "".join(letters)
+
+
+def test_preduce_empty() -> None:
+    assert preduce(operator.add, [], 0, threads=True) == 0
+    with pytest.raises(TypeError):
+        preduce(operator.add, [], threads=True)
@@ -0,0 +1,107 @@
+import gc
+import weakref
+from typing import Protocol, runtime_checkable
+
+from about_python.protocols import Tracked, fast_runtime_checkable, invalidate
+
+
+@fast_runtime_checkable
+@runtime_checkable
+class MyProtocol(Protocol):
+    def foo(self) -> int: ...
+
+
+@fast_runtime_checkable
+@runtime_checkable
+class DataProtocol(Protocol):
+    value: int
+
+
+class Class:
+    def foo(self) -> int:
+        return 0
+
+
+class Other:
+    pass
+
+
+class Slotted:
+    __slots__ = ()
+
+
+def test_fast_runtime_checkable() -> None:
+    assert isinstance(Class(), MyProtocol)
+    assert isinstance(Class(), MyProtocol)  # cached
+    assert not isinstance(Other(), MyProtocol)
+    assert not isinstance(Slotted(), MyProtocol)
+    assert not isinstance(1, MyProtocol)
+
+    class Nominal(MyProtocol):
+        def foo(self) -> int:
+            return 1
+
+    assert isinstance(Nominal(), MyProtocol)
+
+
+def test_sub_protocol() -> None:
+    @runtime_checkable
+    class SubProtocol(MyProtocol, Protocol):
+        def bar(self) -> int: ...
+
+    # The verdicts of the fast protocol are not those of its sub-protocols
+    assert isinstance(Class(), MyProtocol)
+    assert not isinstance(Class(), SubProtocol)
+
+
+def test_instance_attributes() -> None:
+    class WithValue:
+        def __init__(self) -> None:
+            self.value = 1
+            super().__init__()
+
+    class WithoutValue:
+        pass
+
+    assert isinstance(WithValue(), DataProtocol)
+    assert not isinstance(WithoutValue(), DataProtocol)
+
+    instance = WithoutValue()
+    instance.value = 1  # type: ignore
+    assert isinstance(instance, DataProtocol)
+
+
+def test_invalidate() -> None:
+    class Late:
+        pass
+
+    assert not isinstance(Late(), MyProtocol)
+    Late.foo = lambda self: 0  # type: ignore
+    invalidate(Late)
+    assert isinstance(Late(), MyProtocol)
+
+
+def test_tracked() -> None:
+    class Base(Tracked):
+        pass
+
+    class Derived(Base):
+        pass
+
+    assert not isinstance(Derived(), MyProtocol)
+    Base.foo = lambda self: 0  # type: ignore
+    assert isinstance(Derived(), MyProtocol)
+    del Base.foo  # type: ignore
+    assert not isinstance(Derived(), MyProtocol)
+
+
+def test_cache_is_weak() -> None:
+    class Temporary:
+        def foo(self) -> int:
+            return 0
+
+    assert isinstance(Temporary(), MyProtocol)
+    reference = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,119 @@
+from typing import Any
+
+import pytest
+
+from about_python.proxy import make_proxy
+from about_python.stats import Histogram
+
+
+def _get_private(__self: Any, __clock: int) -> int:
+    return __clock
+
+
+class Class:
+    LIMIT = 10
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._value = 1
+        super().__init__()
+
+    def get_string(self, value: str) -> str:
+        return value
+
+    def get_int(self, value: int, /, *, scale: int = 1) -> int:
+        self.calls += 1
+        return value * scale
+
+    def get_all(self, *args: int, **kwargs: int) -> tuple[Any, ...]:
+        return args, kwargs
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+
+    @staticmethod
+    def name() -> str:
+        return "class"
+
+    def get_slice(self, start: int, stop: int = 10) -> tuple[int, int]:
+        return start, stop
+
+    # Out of the class: the parameter name would be mangled
+    get_private = _get_private
+
+    def __len__(self) -> int:
+        return 3
+
+
+def test_make_proxy() -> None:
+    def get_string(proxy: Any, s: str) -> str:
+        return proxy.__wrapped__.get_string(s.upper())
+
+    ClassProxy = make_proxy(Class, {"get_string": get_string})
+    instance = Class()
+    proxy = ClassProxy(instance)
+    assert type(proxy).__qualname__ == "ClassProxy"
+    assert proxy.get_string("abc") == "ABC"
+    assert proxy.get_int(10) == 10 and proxy.get_int(2, scale=3) == 6
+    assert proxy.get_all(1, 2, a=3) == ((1, 2), {"a": 3})
+    assert proxy.name() == "class" and proxy.LIMIT == 10 and len(proxy) == 3
+    # Instance attributes go through __getattr__
+    assert proxy.calls == 2
+    proxy.value = 5
+    assert instance.value == 5
+    with pytest.raises(TypeError):
+        proxy.get_int(value=1)  # type: ignore
+    # Forwarded methods are found on the class, not by __getattr__
+    assert "get_int" in type(proxy).__dict__
+
+
+def test_hooks() -> None:
+    def get_string(proxy: Any, value: str) -> str:
+        return value * 2
+
+    latency = Histogram()
+    ClassProxy = make_proxy(
+        Class,
+        {"get_string": get_string},
+        hooks={"get_int": latency.record, "get_string": latency.record},
+    )
+    proxy = ClassProxy(Class())
+    assert proxy.get_int(1) == 1
+    assert proxy.get_string("a") == "aa"
+    with pytest.raises(TypeError):
+        proxy.get_int("a", scale=None)  # type: ignore
+    assert latency.count == 3
+
+
+def test_hooks_parameter_names() -> None:
+    # Parameters named as the locals and globals of the forwarding methods
+    latency = Histogram()
+    ClassProxy = make_proxy(
+        Class, hooks={"get_slice": latency.record, "get_private": latency.record}
+    )
+    proxy = ClassProxy(Class())
+    assert proxy.get_slice(3) == (3, 10)
+    assert proxy.get_slice(start=3, stop=4) == (3, 4)
+    assert proxy.get_private(5) == 5
+    assert latency.count == 3
+    with pytest.raises(ValueError):
+        make_proxy(Class, hooks={"missing": latency.record})
+
+
+def test_subclass() -> None:
+    ClassProxy: Any = make_proxy(Class)
+
+    class Doubling(ClassProxy):
+        __slots__ = ()
+
+        def get_int(self, value: int) -> int:
+            return 2 * self.__wrapped__.get_int(value)
+
+    proxy = Doubling(Class())
+    assert proxy.get_int(2) == 4
+    assert proxy.get_string("a") == "a"
@@ -0,0 +1,137 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+from typing import ClassVar
+
+import pytest
+
+from about_python.records import Frozen, Record, fields
+
+
+class Point(Record, frozen=True, order=True):
+    x: int
+    y: int = 0
+
+
+class Point3D(Point, frozen=True):
+    z: int = 0
+
+
+class Counter(Record):
+    name: str
+    count: int = 0
+    instances: ClassVar[int] = 0
+
+
+def test_record() -> None:
+    point = Point(1, 2)
+    assert (point.x, point.y) == (1, 2)
+    assert Point(1) == Point(1, y=0)
+    assert Point(1) != Point(2)
+    assert repr(point) == "Point(x=1, y=2)"
+    assert not hasattr(point, "__dict__")
+    assert fields(point) == fields(Point) == ("x", "y")
+    assert Point.__match_args__ == ("x", "y")
+    match point:
+        case Point(x, y):
+            assert (x, y) == (1, 2)
+    assert pickle.loads(pickle.dumps(point)) == point
+    assert copy.replace(point, y=3) == Point(1, 3)
+    assert copy.replace(Record()) == Record()
+
+
+def test_frozen() -> None:
+    point = Point(1, 2)
+    with pytest.raises(FrozenInstanceError):
+        point.x = 3  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        del point.x  # type: ignore
+    assert hash(point) == hash(Point(1, 2))
+    assert len({point, Point(1, 2), Point(2, 1)}) == 2
+
+
+def test_order() -> None:
+    assert sorted([Point(2), Point(1, 3), Point(1, 2)]) == [
+        Point(1, 2),
+        Point(1, 3),
+        Point(2),
+    ]
+    with pytest.raises(TypeError):
+        assert Point(1) < Point3D(1)  # type: ignore
+
+
+def test_mutable() -> None:
+    counter = Counter("a")
+    counter.count += 1
+    assert counter == Counter("a", 1)
+    assert fields(Counter) == ("name", "count")
+    with pytest.raises(TypeError):
+        hash(counter)
+    with pytest.raises(AttributeError):
+        counter.other = 1  # type: ignore
+
+
+def test_inheritance() -> None:
+    point = Point3D(1, 2, 3)
+    assert fields(point) == ("x", "y", "z")
+    assert Point3D.__slots__ == ("z",)
+    assert repr(point) == "Point3D(x=1, y=2, z=3)"
+    assert point != Point(1, 2)
+    with pytest.raises(FrozenInstanceError):
+        point.z = 0  # type: ignore
+    with pytest.raises(TypeError):
+
+        class Mutable(Point, frozen=False):  # type: ignore
+            pass
+
+
+def test_defined_methods() -> None:
+    class Named(Record, frozen=True):
+        name: str
+
+        def __repr__(self) -> str:
+            return self.name
+
+    assert repr(Named("a")) == "a"
+
+
+def test_invalid_defaults() -> None:
+    with pytest.raises(TypeError):
+
+        class Late(Record):  # pyright: ignore[reportUnusedClass]
+            x: int = 0
+            y: int  # pyright: ignore[reportGeneralTypeIssues]
+
+    with pytest.raises(ValueError):
+
+        class Shared(Record):  # type: ignore
+            items: list[int] = []
+
+
+class Event(Frozen, frozen=True):
+    name: str
+    value: int = 0
+
+
+def test_frozen_replace() -> None:
+    event = Event("a", 1)
+    assert not hasattr(event, "__dict__")
+    assert fields(Event) == ("name", "value")
+    with pytest.raises(FrozenInstanceError):
+        event.value = 2  # type: ignore
+    changed = event.replace(value=2)
+    assert changed == Event("a", 2) and event == Event("a", 1)
+    assert changed.name is event.name
+    assert event.evolve(name="b") == copy.replace(event, name="b") == Event("b", 1)
+    with pytest.raises(TypeError):
+        event.replace(other=1)
+    assert Point(1, 2).__replace__(y=3) == Point(1, 3)
+
+
+def test_frozen_hash() -> None:
+    event = Event("a", 1)
+    with pytest.raises(AttributeError):
+        event._hash  # type: ignore
+    assert hash(event) == hash(Event("a", 1))
+    assert event._hash == hash(event)  # type: ignore
+    assert not hasattr(event.replace(value=2), "_hash")
@@ -0,0 +1,128 @@
+import asyncio
+import io
+import re
+from pathlib import Path
+
+import pytest
+
+from about_python import regex
+from about_python.regex import PatternCache, PatternSet
+
+
+def test_pattern_cache() -> None:
+    cache = PatternCache(maxsize=2)
+    assert cache.compile(r"a") is cache.compile(r"a")
+    assert cache.compile(r"a") is not cache.compile(r"a", re.IGNORECASE)
+    cache.compile(r"b")
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 3, 1, 2)
+    cache.clear()
+    assert cache.info().currsize == 0
+
+
+def test_module_functions() -> None:
+    if match := regex.match(r"abc", "abc-def-abc"):
+        assert match.span() == (0, 3)
+    else:
+        assert False
+    assert regex.fullmatch(r"abc", "abc-def") is None
+    assert regex.search(r"def", "abc-def") is not None
+    assert regex.findall(r"abc", "ABC-def-abc", re.IGNORECASE) == ["ABC", "abc"]
+    assert [m.span() for m in regex.finditer(r"abc", "abc-def-abc")] == [
+        (0, 3),
+        (8, 11),
+    ]
+    assert regex.split("-", "abc-def-ghi") == ["abc", "def", "ghi"]
+    assert regex.sub("-", "|", "abc-def-ghi") == "abc|def|ghi"
+    assert regex.subn("-", "|", "abc-def-ghi") == ("abc|def|ghi", 2)
+    assert regex.findall(rb"\d", b"a1b2") == [b"1", b"2"]
+    assert regex.cache_info().hits + regex.cache_info().misses > 0
+
+
+def test_pattern_set() -> None:
+    rules = PatternSet(
+        {
+            "error": r"ERROR (?P<code>\d+)",
+            "warning": r"WARN(ING)?",
+            "number": r"\d+",
+        }
+    )
+    line = "WARN disk 90 ERROR 42"
+    assert [(name, m.group()) for name, m in rules.finditer(line)] == [
+        ("warning", "WARN"),
+        ("number", "90"),
+        ("error", "ERROR 42"),
+    ]
+    assert rules.match(line) is not None
+    if found := rules.search("disk ERROR 7"):
+        name, match = found
+        assert (name, match.group("code")) == ("error", "7")
+    else:
+        assert False
+    assert rules.match("disk") is None
+
+
+def test_pattern_set_matched() -> None:
+    # "number" matches only inside the match of "error": one scan misses it
+    rules = PatternSet({"error": r"ERROR \d+", "number": r"\d+", "x": "x"})
+    assert {name for name, _ in rules.finditer("ERROR 42")} == {"error"}
+    assert rules.matched("ERROR 42") == {"error", "number"}
+    assert rules.matched("nothing") == set()
+    # The rescans do not fill the cache of the module
+    misses = regex.cache_info().misses
+    rules.matched("ERROR 7 x")
+    assert regex.cache_info().misses == misses
+
+
+def test_pattern_set_empty() -> None:
+    with pytest.raises(ValueError):
+        PatternSet({})
+
+
+@pytest.mark.parametrize(
+    "pattern", [r"\w+", r"\b\d+\b", r"a*", r"(?<=x)y+", r"ERROR \d+", r"^\w", r"$"]
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_finditer_stream(pattern: str, chunk_size: int) -> None:
+    text = "xyy ERROR 123 aaa b 4567 xyyy ERROR 9 aa" * 5
+    expected = [(m.start(), m.end(), m.group()) for m in re.finditer(pattern, text)]
+    matches = regex.finditer_stream(
+        pattern, io.StringIO(text), chunk_size=chunk_size, max_match=16
+    )
+    assert [(m.start, m.end, m.group()) for m in matches] == expected
+
+
+@pytest.mark.parametrize("pattern", [r"a*", r"x?", r"x"])
+def test_finditer_stream_empty(pattern: str) -> None:
+    expected = [m.span() for m in re.finditer(pattern, "")]
+    matches = regex.finditer_stream(pattern, io.StringIO(""), max_match=16)
+    assert [(m.start, m.end) for m in matches] == expected
+
+
+def test_finditer_stream_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"".join(b"line %d ERROR %d\n" % (i, i * 7) for i in range(1000)))
+    with path.open("rb") as file:
+        matches = list(
+            regex.finditer_stream(rb"ERROR (\d+)", file, chunk_size=100, max_match=32)
+        )
+    assert len(matches) == 1000
+    assert matches[-1].group(1) == b"6993"
+    assert path.read_bytes()[matches[5].start : matches[5].end] == b"ERROR 35"
+
+
+def test_afinditer_stream() -> None:
+    async def coroutine() -> list[tuple[int, bytes]]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"a1 b22 c333 " * 10)
+        reader.feed_eof()
+        return [
+            (m.start, m.group())
+            async for m in regex.afinditer_stream(
+                rb"\d+", reader, chunk_size=5, max_match=8
+            )
+        ]
+
+    matches = asyncio.run(coroutine())
+    assert len(matches) == 30
+    assert matches[:3] == [(1, b"1"), (4, b"22"), (8, b"333")]
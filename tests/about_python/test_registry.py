@@ -0,0 +1,62 @@
+import pickle
+from collections.abc import Hashable
+
+import pytest
+
+from about_python.registry import Registry
+
+
+class Codec(Registry):
+    pass
+
+
+class Text(Codec, tags={"text"}):
+    pass
+
+
+class Json(Text, key="json", tags={"structured"}):
+    pass
+
+
+class Csv(Text, key="csv"):
+    pass
+
+
+class Binary(Codec, key="binary"):
+    pass
+
+
+class Transport(Registry, key="json"):
+    pass
+
+
+def test_registry() -> None:
+    assert Codec.lookup("json") is Json
+    assert Transport.lookup("json") is Transport
+    with pytest.raises(KeyError):
+        Codec.lookup("missing")
+    assert Json.key == "json" and Text.key is None
+    assert Json.tags == {"text", "structured"}
+    assert Codec.tagged("text") == (Text, Json, Csv)
+    assert Codec.tagged("missing") == ()
+    assert Codec.descendants() == (Text, Json, Csv, Binary)
+    assert Text.descendants() == (Json, Csv)
+    assert Csv.descendants() == ()
+
+
+def test_duplicate_key() -> None:
+    with pytest.raises(ValueError):
+
+        class Other(Codec, key="csv"):  # type: ignore
+            pass
+
+
+def test_freeze() -> None:
+    snapshot = Codec.freeze()
+    assert snapshot.lookup("csv") is Csv
+    assert snapshot.tagged("structured") == (Json,)
+    assert snapshot.descendants(Text) == (Json, Csv)
+    with pytest.raises(TypeError):
+        snapshot.by_key["xml"] = Codec  # type: ignore
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+    assert not isinstance(snapshot, Hashable)
@@ -0,0 +1,130 @@
+import socket
+import time
+from typing import Any
+
+import pytest
+
+from about_python.scheduler import (
+    Cancelled,
+    Scheduler,
+    TaskGenerator,
+    join,
+    readable,
+    sleep,
+    spawn,
+)
+
+
+def test_switches() -> None:
+    trace: list[str] = []
+
+    def task(name: str) -> TaskGenerator[str]:
+        for _ in range(3):
+            trace.append(name)
+            yield
+        return name
+
+    scheduler = Scheduler()
+    scheduler.spawn(task("a"))
+    scheduler.spawn(task("b"))
+    assert scheduler.run() is None
+    assert "".join(trace) == "ababab"
+
+
+def test_join() -> None:
+    def child(value: int) -> TaskGenerator[int]:
+        yield
+        return 2 * value
+
+    def failing() -> TaskGenerator[None]:
+        yield
+        raise ValueError("failing")
+
+    def main() -> TaskGenerator[tuple[int, str]]:
+        tasks: list[Any] = []
+        for value in range(3):
+            tasks.append((yield spawn(child(value))))
+        total = 0
+        for task in tasks:
+            total += yield join(task)
+        try:
+            yield join((yield spawn(failing())))
+        except ValueError as error:
+            return total, str(error)
+        return total, ""
+
+    assert Scheduler().run(main()) == (6, "failing")
+
+
+def test_sleep() -> None:
+    trace: list[str] = []
+
+    def sleeper(name: str, seconds: float) -> TaskGenerator[None]:
+        yield sleep(seconds)
+        trace.append(name)
+
+    scheduler = Scheduler()
+    scheduler.spawn(sleeper("slow", 0.02))
+    scheduler.spawn(sleeper("fast", 0.01))
+    start = time.monotonic()
+    scheduler.run()
+    assert trace == ["fast", "slow"]
+    assert time.monotonic() - start >= 0.02
+
+
+def test_cancel() -> None:
+    def sleeper() -> TaskGenerator[str]:
+        try:
+            yield sleep(60)
+        except Cancelled:
+            return "cancelled"
+        return "slept"
+
+    def main() -> TaskGenerator[str]:
+        task = yield spawn(sleeper())
+        yield
+        task.cancel()
+        return (yield join(task))
+
+    start = time.monotonic()
+    assert Scheduler().run(main()) == "cancelled"
+    assert time.monotonic() - start < 1
+
+
+def test_readable() -> None:
+    left, right = socket.socketpair()
+    left.setblocking(False)
+
+    def reader() -> TaskGenerator[bytes]:
+        yield readable(left)
+        return left.recv(100)
+
+    def writer() -> TaskGenerator[None]:
+        yield sleep(0.01)
+        right.send(b"ping")
+
+    def main() -> TaskGenerator[bytes]:
+        task = yield spawn(reader())
+        yield spawn(writer())
+        return (yield join(task))
+
+    scheduler = Scheduler()
+    try:
+        assert scheduler.run(main()) == b"ping"
+    finally:
+        scheduler.close()
+        left.close()
+        right.close()
+
+
+def test_deadlock() -> None:
+    def wait_other(index: int) -> TaskGenerator[None]:
+        yield join(tasks[1 - index])
+
+    def main() -> TaskGenerator[None]:
+        yield join(tasks[0])
+
+    scheduler = Scheduler()
+    tasks = [scheduler.spawn(wait_other(0)), scheduler.spawn(wait_other(1))]
+    with pytest.raises(RuntimeError):
+        scheduler.run(main())
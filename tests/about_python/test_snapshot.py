@@ -0,0 +1,60 @@
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+from about_python.snapshot import VERSION, directory, load_or_build
+
+
+def test_load_or_build(tmp_path: Path) -> None:
+    source = tmp_path / "source.py"
+    source.write_text("x = 1\n")
+    builds: list[int] = []
+
+    def build() -> dict[str, int]:
+        builds.append(1)
+        return {"x": len(builds)}
+
+    assert load_or_build("index", build, [source], tmp_path) == {"x": 1}
+    assert load_or_build("index", build, [source], tmp_path) == {"x": 1}
+    assert len(builds) == 1
+
+    snapshot = pickle.loads((tmp_path / "index.pickle").read_bytes())
+    assert snapshot["version"][0] == VERSION
+
+    # A new modification time with the same content keeps the snapshot
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_or_build("index", build, [source], tmp_path) == {"x": 1}
+    assert len(builds) == 1
+    # and stores the new one, not to hash the source again
+    snapshot = pickle.loads((tmp_path / "index.pickle").read_bytes())
+    stamp, _ = snapshot["stamps"][str(source)]
+    assert stamp == (source.stat().st_mtime_ns, source.stat().st_size)
+
+    source.write_text("x = 2\n")
+    assert load_or_build("index", build, [source], tmp_path) == {"x": 2}
+    assert load_or_build("index", build, [], tmp_path) == {"x": 3}
+
+
+def test_corrupted_snapshot(tmp_path: Path) -> None:
+    (tmp_path / "index.pickle").write_bytes(b"not a pickle")
+    assert load_or_build("index", lambda: 1, [], tmp_path) == 1
+    assert load_or_build("index", lambda: 2, [], tmp_path) == 1
+
+
+def test_read_only_cache(tmp_path: Path) -> None:
+    (tmp_path / "file").write_text("")
+    # The cache directory cannot be created below a file
+    cache = tmp_path / "file" / "cache"
+    assert load_or_build("index", lambda: 1, [], cache) == 1
+    assert load_or_build("index", lambda: 2, [], cache) == 2
+
+
+def test_directory(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("ABOUT_PYTHON_CACHE", str(tmp_path))
+    assert directory() == tmp_path
+    monkeypatch.delenv("ABOUT_PYTHON_CACHE")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert directory() == tmp_path / "about_python"
@@ -0,0 +1,51 @@
+import operator
+import random
+from pathlib import Path
+
+import pytest
+
+from about_python import sorting
+from about_python.sorting import external_sorted
+
+
+def _records(count: int) -> list[tuple[int, int, int]]:
+    rng = random.Random(0)
+    return [(rng.randrange(10), rng.randrange(10), index) for index in range(count)]
+
+
+def test_in_memory(tmp_path: Path) -> None:
+    records = _records(100)
+    key = operator.itemgetter(0, 1)
+    result = external_sorted(records, key=key, directory=str(tmp_path))
+    assert list(result) == sorted(records, key=key)
+    assert not any(tmp_path.iterdir())
+    assert list(external_sorted(list[int]())) == []
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_spilled(reverse: bool, tmp_path: Path) -> None:
+    records = _records(5000)
+    key = operator.itemgetter(0, 1)
+    # Stable: records with the same key keep their order
+    expected = sorted(records, key=key, reverse=reverse)
+    result = external_sorted(
+        records, key=key, reverse=reverse, max_memory=4096, directory=str(tmp_path)
+    )
+    assert next(result) == expected[0]
+    assert len(list(tmp_path.iterdir())) == 1
+    assert [expected[0], *result] == expected
+    assert not any(tmp_path.iterdir())
+
+
+def test_multiple_passes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sorting, "_FAN_IN", 3)
+    values = list(range(2000))
+    random.Random(0).shuffle(values)
+    assert list(external_sorted(values, max_memory=1024)) == sorted(values)
+
+
+def test_parallel() -> None:
+    records = _records(5000)
+    key = operator.itemgetter(1)
+    result = external_sorted(records, key=key, max_memory=1 << 14, parallel=2)
+    assert list(result) == sorted(records, key=key)
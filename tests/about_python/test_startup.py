@@ -0,0 +1,64 @@
+import subprocess
+
+import pytest
+
+from about_python import main
+from about_python.startup import BudgetExceeded, Profile, check, parse, profile
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:        88 |         88 |     _sre
+import time:       286 |        286 |       re._constants
+import time:       425 |        711 |     re._parser
+import time:       476 |       1275 |   re._compiler
+import time:       827 |       2102 | re
+import time:       920 |        920 | gettext
+"""
+
+
+def test_parse() -> None:
+    re, gettext = parse(OUTPUT)
+    assert (re.name, re.self_us, re.cumulative_us) == ("re", 827, 2102)
+    assert [child.name for child in re.children] == ["re._compiler"]
+    assert [child.name for child in re.children[0].children] == [
+        "_sre",
+        "re._parser",
+    ]
+    assert gettext.children == ()
+    assert [record.name for record in re.chain()] == [
+        "re",
+        "re._compiler",
+        "re._parser",
+        "re._constants",
+    ]
+
+    result = Profile(roots=(re, gettext), wall_ms=10)
+    assert result.import_ms == 3.022
+    assert [record.name for record in result.slowest(2)] == ["gettext", "re"]
+    assert [chain[0].name for chain in result.chains()] == ["re", "gettext"]
+
+
+def test_profile() -> None:
+    result = profile(["-c", "import json"])
+    assert "json" in {record.name for record in result.records()}
+    assert result.wall_ms > 0
+    check(result, budget_ms=10_000)
+    with pytest.raises(BudgetExceeded):
+        check(result, budget_ms=0)
+
+
+def test_profile_failure() -> None:
+    with pytest.raises(subprocess.CalledProcessError) as info:
+        profile(["-c", "import about_python.missing"])
+    assert info.value.returncode == 1
+    assert "ModuleNotFoundError" in info.value.stderr
+    assert "import time:" not in info.value.stderr
+
+
+def test_startup_command(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["startup", "--budget-ms", "10000"]) == 0
+    assert "about_python.cli" in capsys.readouterr().out
+    assert main(["startup", "--budget-ms", "0", "--", "-c", "import json"]) == 1
+    output = capsys.readouterr().out
+    assert "budget 0.0 ms" in output
+    assert " json" in output
@@ -0,0 +1,30 @@
+import pytest
+
+from about_python.stats import Histogram, percentile
+
+
+def test_percentile() -> None:
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_histogram() -> None:
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value)
+    assert (histogram.count, histogram.min, histogram.max) == (1000, 1, 1000)
+    assert histogram.mean == 500.5
+    for q in (50, 90, 99):
+        assert q * 10 <= histogram.percentile(q) <= q * 10 * 1.25
+    assert histogram.percentile(100) == 1000
+    assert sum(count for _, _, count in histogram.buckets()) == 1000
+
+    other = Histogram()
+    other.record(0)
+    histogram.merge(other)
+    assert (histogram.count, histogram.min) == (1001, 0)
+    with pytest.raises(ValueError):
+        histogram.record(-1)
+    with pytest.raises(ValueError):
+        Histogram().percentile(50)
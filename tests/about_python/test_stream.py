@@ -0,0 +1,102 @@
+import itertools
+from collections.abc import Iterable, Iterator
+
+import pytest
+
+from about_python.stream import (
+    Pipeline,
+    batched,
+    dedupe_within,
+    interleave,
+    tee,
+    throttle,
+    window,
+)
+
+
+def test_batched() -> None:
+    assert list(batched("abcde", 2)) == [("a", "b"), ("c", "d"), ("e",)]
+    words = ["a" * 10, "b" * 10, "c" * 30, "d"]
+    assert list(batched(words, max_bytes=25, sizeof=len)) == [
+        ("a" * 10, "b" * 10),
+        ("c" * 30,),
+        ("d",),
+    ]
+    assert list(batched(range(5), 2, max_bytes=100, sizeof=lambda _: 40)) == [
+        (0, 1),
+        (2, 3),
+        (4,),
+    ]
+    with pytest.raises(ValueError):
+        list(batched([1]))
+
+
+def test_window() -> None:
+    assert list(window("abcd", 3)) == [("a", "b", "c"), ("b", "c", "d")]
+    assert list(window("ab", 3)) == []
+
+
+def test_throttle() -> None:
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    def sleep(seconds: float) -> None:
+        nonlocal now
+        now += seconds
+
+    times: list[float] = []
+    for _ in throttle(range(5), 10, burst=2, clock=clock, sleep=sleep):
+        times.append(now)
+    assert [round(time, 9) for time in times] == [0, 0, 0.1, 0.2, 0.3]
+
+
+def test_dedupe_within() -> None:
+    assert list(dedupe_within("aabab", 1)) == ["a", "b", "a", "b"]
+    assert list(dedupe_within("abcab", 2)) == ["a", "b", "c", "a", "b"]
+    assert list(dedupe_within("abcab", 3)) == ["a", "b", "c"]
+    assert list(dedupe_within(["A", "a"], 1, key=str.lower)) == ["A"]
+
+
+def test_interleave() -> None:
+    assert "".join(interleave("abc", "d", "ef")) == "adebfc"
+
+
+def test_tee() -> None:
+    first, second = tee(range(10), maxsize=3)
+    assert list(itertools.islice(first, 3)) == [0, 1, 2]
+    with pytest.raises(BufferError):
+        next(first)
+    assert list(itertools.islice(second, 3)) == [0, 1, 2]
+    # The iterator ahead goes on once the other caught up
+    assert list(zip(first, second)) == [(i, i) for i in range(3, 10)]
+
+    first, second = tee(range(10), maxsize=1)
+    assert list(zip(first, second)) == [(i, i) for i in range(10)]
+
+
+def test_tee_unread() -> None:
+    # An iterator deleted or closed before it started does not hold the others
+    first, second = tee(range(10), maxsize=3)
+    del second
+    assert list(first) == list(range(10))
+
+    first, second, third = tee(range(10), 3, maxsize=3)
+    second.close()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+    assert list(zip(first, third)) == [(i, i) for i in range(10)]
+
+
+def _sum_batches(batches: Iterable[tuple[int, ...]]) -> Iterator[int]:
+    return map(sum, batches)
+
+
+def test_pipeline() -> None:
+    pipeline = Pipeline(range(10)).pipe(batched, 4).pipe(_sum_batches, name="sum")
+    assert list(pipeline) == [6, 22, 17]
+    batches, sums = pipeline.stats
+    assert (batches.name, batches.items_in, batches.items_out) == ("batched", 10, 3)
+    assert (sums.name, sums.items_in, sums.items_out) == ("sum", 3, 3)
+    assert batches.max_depth == 4
+    assert sums.max_depth == 1
+    assert pipeline.report().splitlines()[1].split()[:3] == ["batched", "10", "3"]
@@ -0,0 +1,10 @@
+from about_python.lazy import attach
+
+# my_file is imported when my_function is accessed for the first time
+__getattr__, __dir__, __all__ = attach(
+    __name__, {".my_module.my_file": ["my_function"]}, submodules=["my_module"]
+)
+
+
+def secret_function() -> None:
+    pass
@@ -0,0 +1,2 @@
+def my_function(value: int) -> int:
+    return value